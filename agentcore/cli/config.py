@@ -66,6 +66,31 @@ def set_url():
     else:
         console.print(f"[red]Provided URL:'{url}' is not a running Agentcore URL. Please set the running Agentcore URL[/red]")
 
+@config.command(name='prewarm')
+@click.argument('state', type=click.Choice(['on', 'off']))
+def set_prewarm(state):
+    """Open the API connection in the background while commands start."""
+    config = ConfigManager()
+    config.set_prewarm(state == 'on')
+    console.print(f"[green]Connection prewarming turned {state}.[/green]")
+
+@config.command(name='max-upload-size')
+@click.argument('megabytes', type=click.FloatRange(min=1))
+def set_max_upload_size(megabytes):
+    """Set the largest file, in MB, that data uploads accept."""
+    config = ConfigManager()
+    config.set_max_upload_size(megabytes)
+    console.print(f"[green]Maximum upload size set to {megabytes:g} MB.[/green]")
+
+@config.command(name='upload-compression')
+@click.argument('level', type=click.IntRange(0, 9))
+def set_upload_compression(level):
+    """Set the gzip level (1-9) for CSV/JSON/TXT uploads, or 0 to send them uncompressed."""
+    config = ConfigManager()
+    config.set_upload_compression(level)
+    state = f"gzip level {level}" if level else "off"
+    console.print(f"[green]Upload compression set to {state}.[/green]")
+
 @config.command(name='view')
 @BaseManager.handle_api_error
 def view_config():
@@ -88,6 +113,9 @@ def view_config():
         "[green]Set[/green]" if config.token() else "[red]Not Set[/red]"
     )
     table.add_row("Logged In Time", config.login_time() or "[red]Not Set[/red]")
+    table.add_row("Connection Prewarm", "[green]On[/green]" if config.prewarm_enabled() else "Off")
+    table.add_row("Max Upload Size", f"{config.max_upload_size() / 1024 / 1024:g} MB")
+    table.add_row("Upload Compression", f"gzip level {config.upload_compression()}" if config.upload_compression() else "Off")
     
     # Add user information if logged in
     if config.token():
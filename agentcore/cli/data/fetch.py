@@ -36,6 +36,7 @@ from agentcore.managers.data_version_manager import DataVersionManager2
 
 from agentcore.managers.table_manager import TableDisplay
 from agentcore.managers.base import BaseManager
+from agentcore.managers.poll_scheduler import PollScheduler
 from agentcore.cli.experiments.helpers import get_project_list
 from agentcore.cli.data.main import data
 from agentcore.cli.data.main import beautify_datetime
@@ -276,11 +277,17 @@ def fetch_initial_data():
     # Step 7: Poll the task status
     console.print("\n[bold]Monitoring task progress...[/bold]")
     completed = False
+    # Long-poll or SSE when the server offers them, adaptive polling otherwise
+    channel = data_version_manager.task_status_channel(
+        task_id, poller=PollScheduler.instance().poller(min_interval=1, max_interval=15)
+    )
+    task_status = None
     
     with console.status("[bold green]Processing...[/bold green]") as status:
         while not completed:
-            time.sleep(2)  # Poll every 2 seconds
-            task_status = data_version_manager.get_task_status(task_id)
+            # Poll quickly while the status changes, back off while it does not
+            channel.wait(changed=channel.observe(task_status and task_status.get('status')))
+            task_status = data_version_manager.get_task_status(task_id, channel=channel)
             
             if not task_status:
                 console.print("[yellow]Could not retrieve task status. Retrying...[/yellow]")
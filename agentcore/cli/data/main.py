@@ -110,4 +110,4 @@ def beautify_datetime(dt_str, date_only=False):
     except Exception:
         return None
 
-from agentcore.cli.data import operations, source, transform, fetch
\ No newline at end of file
+from agentcore.cli.data import operations, source, transform, fetch, profile
\ No newline at end of file
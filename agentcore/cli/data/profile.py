@@ -0,0 +1,97 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import os
+import sys
+
+import click
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from agentcore.cli.data.main import data
+from agentcore.managers.config import ConfigManager
+from agentcore.managers.data_profile import EXCEL_EXTENSIONS, FileProfile, convert_excel_to_csv, profile_file
+
+console = Console()
+
+MAX_COLUMNS_SHOWN = 20
+
+
+def print_profile(profile: FileProfile, out: Console = console) -> None:
+    """Print a compact profile: one summary line, a column table and any issues."""
+    summary = [f"{profile.size / 1024 / 1024:,.1f} MB"]
+    if profile.encoding:
+        summary.append(profile.encoding)
+    if profile.delimiter:
+        summary.append(repr(profile.delimiter))
+    if profile.columns:
+        summary.append(f"{len(profile.columns)} columns")
+        rows = f"{profile.rows:,} rows" if profile.rows_exact else f"≈{profile.rows:,} rows"
+        if not profile.rows_exact:
+            rows += f" (sampled {profile.sampled_rows:,} in {profile.windows} windows)"
+        summary.append(rows)
+    summary.append(f"{profile.elapsed:.1f}s")
+    out.print(f"[bold]📋 {os.path.basename(profile.path)}[/bold] [dim]{' · '.join(summary)}[/dim]")
+
+    if profile.dtypes:
+        table = Table(box=box.SIMPLE, show_edge=False, pad_edge=False)
+        table.add_column("Column")
+        table.add_column("Type", style="cyan")
+        table.add_column("Nulls", justify="right")
+        for column in profile.columns[:MAX_COLUMNS_SHOWN]:
+            ratio = profile.null_ratio.get(column, 0.0)
+            style = "red" if ratio >= 0.5 else "yellow" if ratio > 0 else "dim"
+            table.add_row(column, profile.dtypes.get(column, "-"), f"[{style}]{ratio:.0%}[/{style}]")
+        if len(profile.columns) > MAX_COLUMNS_SHOWN:
+            table.add_row(f"[dim]... and {len(profile.columns) - MAX_COLUMNS_SHOWN} more[/dim]", "", "")
+        out.print(table)
+
+    for message in profile.errors:
+        out.print(f"  [red]❌ {message}[/red]")
+    for message in profile.warnings:
+        out.print(f"  [yellow]⚠️  {message}[/yellow]")
+
+
+@data.command(name='profile')
+@click.argument('files', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--full', is_flag=True, help='Parse whole files instead of sampling large ones')
+@click.option('--xlsx-to-csv', is_flag=True, help='Convert Excel files to CSV next to them and profile the CSV')
+def profile_files(files, full, xlsx_to_csv):
+    """Check data files locally before uploading them."""
+    max_size = ConfigManager().max_upload_size()
+    failed = 0
+    for path in files:
+        if xlsx_to_csv and os.path.splitext(path)[1].lower() in EXCEL_EXTENSIONS:
+            try:
+                path = convert_excel_to_csv(path)
+            except ImportError as e:
+                console.print(f"[red]❌ Cannot convert {path}: {e}[/red]")
+                failed += 1
+                continue
+            console.print(f"[green]✅ Converted to {path}[/green]")
+        profile = profile_file(path, max_size=max_size, full=full)
+        print_profile(profile)
+        failed += not profile.ok
+    if failed:
+        sys.exit(1)
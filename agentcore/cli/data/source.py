@@ -29,14 +29,22 @@ from rich.prompt import Prompt
 from typing import Optional
 from datetime import datetime
 import json
+import os
+import sys
+from pathlib import Path
 from rich import box
 
+from agentcore.managers.bulk_ingest import (FAILED, REUSED, SKIPPED, UPLOADED, BulkIngester, IngestManifest,
+                                             collect_files)
+from agentcore.managers.data_profile import EXCEL_EXTENSIONS, convert_excel_to_csv, profile_file
 from agentcore.managers.datasource_manager import DatasourceManager
 from agentcore.managers.data_version_manager import DataVersionManager2
 
 from agentcore.managers.table_manager import TableDisplay
 from agentcore.managers.base import BaseManager
+from agentcore.managers.config import ConfigManager
 from agentcore.cli.experiments.helpers import get_project_list
+from agentcore.cli.data.profile import print_profile
 from agentcore.cli.data.main import data
 from agentcore.cli.data.main import beautify_datetime
 install()
@@ -184,13 +192,41 @@ class CustomHelpCommand(click.Command):
             "    - income_data    (classification)\n"
             "    - diabetes       (regression)\n"
         )
+        console.print(
+            "\n[bold blue]Bulk File Ingestion[/bold blue]\n"
+            "ag data connect --from-dir DIR_OR_GLOB --project-id ID [OPTIONS]\n"
+            "  --pattern GLOB       files to take from a directory (default: all)\n"
+            "  --description TEXT   description; {file_name} and {stem} are replaced\n"
+            "  --template FILE      JSON payload applied to every datasource\n"
+            "  --workers N          files uploaded at once (default: 4)\n"
+            "  --manifest FILE      where results are recorded (default: ~/.agentcore/ingest/)\n"
+            "  --force-upload       upload even if the same contents were uploaded before\n"
+            "  --skip-preflight     upload without profiling files locally first\n"
+            "  --xlsx-to-csv        convert Excel files to CSV locally before uploading\n"
+        )
         return ""
 
 
 @data.command(name='connect', cls = CustomHelpCommand)
-def datasources_create():
+@click.option('--force-upload', is_flag=True, help='Upload files even if the same contents were uploaded before')
+@click.option('--from-dir', 'source', help='Create a file datasource for every file in a directory or glob, without prompts')
+@click.option('--pattern', help='Glob for files inside --from-dir (default: all files)')
+@click.option('--project-id', type=int, help='Project for bulk-ingested datasources')
+@click.option('--description', help='Description for bulk-ingested datasources; {file_name} and {stem} are replaced')
+@click.option('--template', type=click.File('r'), help='JSON payload applied to every bulk-ingested datasource')
+@click.option('--workers', type=click.IntRange(1, BulkIngester.MAX_WORKERS), default=BulkIngester.DEFAULT_WORKERS,
+              show_default=True, help='Files uploaded at once in bulk mode')
+@click.option('--manifest', type=click.Path(dir_okay=False), help='Manifest file recording bulk results')
+@click.option('--skip-preflight', is_flag=True, help='Upload bulk files without profiling them locally first')
+@click.option('--xlsx-to-csv', is_flag=True, help='Convert Excel files to CSV locally before uploading them in bulk mode')
+def datasources_create(force_upload, source, pattern, project_id, description, template, workers, manifest,
+                       skip_preflight, xlsx_to_csv):
     """Create a datasource with improved UX"""
     datasource_manager = DatasourceManager()
+    if source:
+        return _ingest_files(datasource_manager, source, pattern, project_id, description, template,
+                             workers, manifest, reuse=not force_upload, preflight=not skip_preflight,
+                             excel_to_csv=xlsx_to_csv)
     base_manager = BaseManager()
     
     console.print("[bold blue]🚀 Welcome to Datasource Creation Wizard[/bold blue]\n")
@@ -242,7 +278,7 @@ def datasources_create():
     
     # Step 6: Create datasource
     console.print(f"\n[bold green]Step 6: Creating Datasource...[/bold green]")
-    response = _create_datasource_with_error_handling(datasource_manager, payload)
+    response = _create_datasource_with_error_handling(datasource_manager, payload, reuse=not force_upload)
     if not response:
         return
     _display_created_datasource(response)
@@ -251,6 +287,62 @@ def datasources_create():
     return response
 
 
+def _ingest_files(datasource_manager, source, pattern, project_id, description, template, workers, manifest, reuse,
+                  preflight=True, excel_to_csv=False):
+    """Bulk mode of `connect`: one file datasource per file, recorded in a manifest."""
+    payload = {}
+    if template:
+        try:
+            payload = json.load(template)
+        except ValueError as e:
+            console.print(f"[red]❌ Template is not valid JSON: {e}[/red]")
+            sys.exit(1)
+    payload["data_source_type_id"] = 3
+    if project_id is not None:
+        payload["project_id"] = project_id
+    if description:
+        payload["description"] = description
+    if not payload.get("project_id"):
+        console.print("[red]❌ --project-id (or project_id in --template) is required with --from-dir.[/red]")
+        sys.exit(1)
+
+    files = collect_files(source, pattern)
+    if not files:
+        console.print(f"[yellow]No files match {source}.[/yellow]")
+        return None
+
+    manifest = IngestManifest(Path(manifest) if manifest else IngestManifest.default_path(source))
+    ingester = BulkIngester(datasource_manager, payload, manifest, workers=workers, reuse=reuse,
+                            max_size=ConfigManager().max_upload_size(), preflight=preflight,
+                            excel_to_csv=excel_to_csv)
+    console.print(f"[bold blue]📦 Ingesting {len(files)} files into project {payload['project_id']}[/bold blue]")
+
+    styles = {UPLOADED: "green", REUSED: "cyan", SKIPPED: "dim", FAILED: "red"}
+
+    def report(result):
+        if result.status != SKIPPED:
+            style = styles[result.status]
+            console.print(f"[{style}]{result.status:>8}[/{style}] {os.path.basename(result.path)} [dim]{result.detail}[/dim]")
+
+    try:
+        results = ingester.run(files, on_result=report)
+    except KeyboardInterrupt:
+        console.print(f"\n[yellow]Interrupted. Finished files are recorded in {manifest.path}; run again to continue.[/yellow]")
+        sys.exit(130)
+
+    counts = {status: sum(1 for result in results if result.status == status) for status in styles}
+    summary = Table(title="Bulk Ingestion", box=box.SIMPLE)
+    for status in styles:
+        summary.add_column(status.capitalize(), justify="right", style=styles[status])
+    summary.add_row(*(str(counts[status]) for status in styles))
+    console.print(summary)
+    console.print(f"[dim]Manifest: {manifest.path}[/dim]")
+    if counts[FAILED]:
+        console.print("[yellow]Run the same command again to retry the failed files.[/yellow]")
+        sys.exit(1)
+    return results
+
+
 def _display_and_select_datasource_type(datasource_manager, base_manager):
     """Display available datasource types with tab completion"""
     datasource_types = datasource_manager.datasource_types()
@@ -614,9 +706,9 @@ def _get_file_config():
                 console.print(f"[red]❌ Path is not a file: {file_path}. Aborting.[/red]")
                 return None
         
-        # Check file size (optional - you can adjust the limit)
+        # Check file size (limit set with `config max-upload-size`)
         file_size = os.path.getsize(file_path)
-        max_size = 100 * 1024 * 1024  # 100MB limit
+        max_size = ConfigManager().max_upload_size()
         if file_size > max_size:
             remaining = max_attempts - attempt - 1
             if remaining > 0:
@@ -633,8 +725,20 @@ def _get_file_config():
     if not file_path:
         return None
     
-    # Get file info
+    # Optionally turn Excel into CSV before anything is sent
     import os
+    if os.path.splitext(file_path)[1].lower() in EXCEL_EXTENSIONS and Prompt.ask(
+        "[bold]Convert to CSV locally before upload?[/bold]",
+        choices=["yes", "no"],
+        default="no"
+    ) == "yes":
+        try:
+            file_path = convert_excel_to_csv(file_path)
+            console.print(f"[green]✅ Converted to {file_path}[/green]")
+        except (ImportError, ValueError, OSError) as e:
+            console.print(f"[yellow]⚠️  Could not convert to CSV ({e}); uploading the Excel file as is.[/yellow]")
+
+    # Get file info
     file_size = os.path.getsize(file_path)
     file_name = os.path.basename(file_path)
     file_ext = os.path.splitext(file_name)[1].lower()
@@ -656,6 +760,18 @@ def _get_file_config():
             console.print("[yellow]File upload cancelled.[/yellow]")
             return None
     
+    # Pre-flight profile: catch broken files before they are uploaded
+    profile = profile_file(file_path, max_size=ConfigManager().max_upload_size())
+    console.print()
+    print_profile(profile, console)
+    if not profile.ok and Prompt.ask(
+        "[bold]This file has errors. Upload anyway?[/bold]",
+        choices=["yes", "no"],
+        default="no"
+    ) != "yes":
+        console.print("[yellow]File upload cancelled.[/yellow]")
+        return None
+
     # Confirm upload
     if not Prompt.ask(
         f"[bold]Upload this file?[/bold]", 
@@ -746,7 +862,7 @@ def _review_and_confirm(payload):
     ) == "yes"
 
 
-def _create_datasource_with_error_handling(datasource_manager, payload):
+def _create_datasource_with_error_handling(datasource_manager, payload, reuse=True):
     """Create datasource with comprehensive error handling and file upload support"""
     
     # Check if this is a file upload (datasource type 3)
@@ -761,7 +877,7 @@ def _create_datasource_with_error_handling(datasource_manager, payload):
         file_name = upload_payload.pop("file_name", None)
         
         # Call the datasource manager with file upload
-        response = datasource_manager.create_datasource_with_file(upload_payload, file_path, file_name)
+        response = datasource_manager.create_datasource_with_file(upload_payload, file_path, file_name, reuse=reuse)
     else:
         # Regular datasource creation without file upload
         response = datasource_manager.create_datasource(payload)
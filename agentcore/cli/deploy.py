@@ -41,6 +41,7 @@ from agentcore.managers.users_manager import UserManager
 from agentcore.managers.table_manager import TableDisplay
 from agentcore.managers.base import BaseManager
 from agentcore.managers.deploy_manager import DeployManager
+from agentcore.managers.poll_scheduler import PollScheduler
 from agentcore.managers.base import BaseManager
 from agentcore.managers.users_manager import UserManager
 from agentcore.managers.credentials_manager import CredentialManager
@@ -267,10 +268,14 @@ def fetch_status(job_id=None):
     
     try:
         seen_steps = set()
+        # Long-poll or SSE when the server offers them, adaptive polling otherwise
+        channel = deploy_manager.status_channel_for_job(
+            job_id, poller=PollScheduler.instance().poller(min_interval=1, max_interval=20)
+        )
         
         with Live(refresh_per_second=2, console=console) as live:
             while True:
-                response = deploy_manager.fetch_status(job_id)
+                response = deploy_manager.fetch_status(job_id, channel=channel)
                 if not response or not isinstance(response, dict):
                     console.print("[red]❌ Failed to fetch job status or invalid response.[/red]")
                     return
@@ -306,7 +311,7 @@ def fetch_status(job_id=None):
                 if status.upper() in ["SUCCESS", "FAILED"]:
                     break
                 
-                time.sleep(3)
+                channel.wait(changed=channel.observe((status, len(details))))
         
         console.print(f"\n[bold]{status}[/bold] - Monitoring complete.\n")
 
@@ -563,10 +568,14 @@ def fetch_production_status(task_id=None):
 
     # Initial setup
     live = None
+    # Long-poll or SSE when the server offers them, adaptive polling otherwise
+    channel = deploy_manager.promotion_status_channel(
+        task_id, poller=PollScheduler.instance().poller(min_interval=1, max_interval=20)
+    )
 
     try:
         while True:
-            response = deploy_manager.promote_production_staus(task_id)
+            response = deploy_manager.promote_production_staus(task_id, channel=channel)
 
             if not response:
                 if live:
@@ -625,8 +634,7 @@ def fetch_production_status(task_id=None):
                 console.print(response)
                 break
 
-            import time
-            time.sleep(5)
+            channel.wait(changed=channel.observe((status, str(result))))
 
     except KeyboardInterrupt:
         if live:
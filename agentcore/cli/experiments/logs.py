@@ -20,29 +20,98 @@
 # Original License Date: 2025-07-24
 # ###################################################################################
 
+import io
 import time
 import json
+import sys
+import bisect
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, Any, List, Set
-from rich.console import Console
+from typing import Dict, Any, List, Optional, Pattern, Set, Tuple
+from rich.console import Console, Group
 from rich.live import Live
 from rich.table import Table
 from rich.text import Text
 from rich.panel import Panel
 
+from agentcore.managers.log_archive import LogArchive, log_timestamp
+from agentcore.managers.poll_scheduler import PollScheduler
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.managers.training_metrics import TrainingMetricsExtractor, sparkline
+
 console = Console()
 
 class LogMonitor:
+    # Records kept in memory for display; totals cover every log seen
+    BUFFER_SIZE = 1000
+    # Number of recent log hashes remembered for de-duplication
+    DEDUP_WINDOW = 65536
+
     def __init__(self, experiment_manager, project_id: int, experiment_group_code: str, version: str = "1.0"):
         self.experiment_manager = experiment_manager
         self.project_id = project_id
         self.experiment_group_code = experiment_group_code
         self.version = version
-        self.displayed_logs: Set[str] = set()
-        self.all_logs: List[Dict[str, Any]] = []
+        self.displayed_logs: Set[int] = set()
+        self.displayed_order = deque()
+        self.recent_logs = deque(maxlen=self.BUFFER_SIZE)
+        self.total_logs = 0
+        self.level_counts: Dict[str, int] = {}
+        self.source_counts: Dict[str, int] = {}
+        self.first_timestamp = None
+        self.last_timestamp = None
         self.last_poll_time = None
-        self.poll_interval = 2  # seconds
+        self.last_fetch_failed = False
+        self.poll_interval = 1  # seconds, while new logs keep arriving
+        self.max_poll_interval = 15  # seconds, reached by backing off while idle
+        # Long-poll or SSE when the server offers them, adaptive polling otherwise
+        self.channel = experiment_manager.log_channel(
+            project_id, experiment_group_code, version,
+            poller=PollScheduler.instance().poller(self.poll_interval, self.max_poll_interval),
+        )
         self.max_display_logs = 50  # Maximum logs to display in the table
+        self.log_tail = experiment_manager.log_tail(project_id, experiment_group_code, version, channel=self.channel)
+
+    @staticmethod
+    def log_hash(log: Dict[str, Any]) -> int:
+        """Return a 64-bit hash identifying a log entry within this process."""
+        return hash((log.get('timestamp', ''), log.get('source', ''), log.get('message', '')))
+
+    def is_new_log(self, log: Dict[str, Any]) -> bool:
+        """Check a log against the dedup window and remember it if unseen."""
+        log_hash = self.log_hash(log)
+        if log_hash in self.displayed_logs:
+            return False
+        if len(self.displayed_order) >= self.DEDUP_WINDOW:
+            self.displayed_logs.discard(self.displayed_order.popleft())
+        self.displayed_order.append(log_hash)
+        self.displayed_logs.add(log_hash)
+        return True
+
+    def add_log(self, log: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a log in the ring buffer, dropping the oldest record once it is full."""
+        level = sys.intern(str(log.get('level', 'UNKNOWN')))
+        source = sys.intern(str(log.get('source', 'Unknown')))
+        record = {
+            'timestamp': log.get('timestamp', ''),
+            'level': level,
+            'source': source,
+            'message': log.get('message', ''),
+        }
+        self.recent_logs.append(record)
+
+        self.total_logs += 1
+        self.level_counts[level] = self.level_counts.get(level, 0) + 1
+        self.source_counts[source] = self.source_counts.get(source, 0) + 1
+        if self.first_timestamp is None:
+            self.first_timestamp = record['timestamp']
+        self.last_timestamp = record['timestamp']
+        return record
+
+    def close(self):
+        """Close the log channel."""
+        self.channel.close()
         
     def create_log_table(self) -> Table:
         """Create a formatted table for displaying logs."""
@@ -58,7 +127,7 @@ class LogMonitor:
         table.add_column("Message", style="white", min_width=40)
         
         # Display recent logs (limit to prevent overwhelming the display)
-        recent_logs = self.all_logs[-self.max_display_logs:] if len(self.all_logs) > self.max_display_logs else self.all_logs
+        recent_logs = list(self.recent_logs)[-self.max_display_logs:]
         
         for log in recent_logs:
             # Format timestamp
@@ -103,8 +172,11 @@ class LogMonitor:
         """Create a status panel showing monitoring information."""
         now = datetime.now()
         status_text = f"🔄 Monitoring active | Last updated: {now.strftime('%H:%M:%S')}\n"
-        status_text += f"📊 Total logs: {len(self.all_logs)} | "
-        status_text += f"🕐 Poll interval: {self.poll_interval}s\n"
+        status_text += f"📊 Total logs: {self.total_logs} | "
+        if self.channel.pushing:
+            status_text += f"⚡ Updates pushed by the server ({self.channel.mode})\n"
+        else:
+            status_text += f"🕐 Poll interval: {self.channel.delay:.0f}s (adaptive)\n"
         status_text += f"📁 Project: {self.project_id} | Group: {self.experiment_group_code} | Version: {self.version}\n"
         status_text += "Press Ctrl+C to stop monitoring"
         
@@ -117,31 +189,23 @@ class LogMonitor:
     def fetch_new_logs(self) -> List[Dict[str, Any]]:
         """Fetch new logs from the API."""
         try:
-            response = self.experiment_manager.fetch_logs(
-                self.project_id, 
-                self.experiment_group_code, 
-                self.version
-            )
+            # Only entries appended since the last poll are returned
+            logs = self.log_tail.poll().logs
+            self.last_fetch_failed = False
             
-            if response and 'logs' in response:
-                logs = response['logs']
-                
+            if logs:
                 # Filter for new logs only
                 new_logs = []
                 for log in logs:
-                    # Create a unique identifier for each log
-                    log_id = f"{log.get('timestamp', '')}-{log.get('source', '')}-{log.get('message', '')}"
-                    
-                    if log_id not in self.displayed_logs:
-                        new_logs.append(log)
-                        self.displayed_logs.add(log_id)
-                        self.all_logs.append(log)
+                    if self.is_new_log(log):
+                        new_logs.append(self.add_log(log))
                 
                 return new_logs
             
             return []
             
         except Exception as e:
+            self.last_fetch_failed = True
             # Create an error log entry
             error_log = {
                 'timestamp': datetime.now().isoformat(),
@@ -192,9 +256,10 @@ class LogMonitor:
         if use_live_display:
             # Use Rich Live display for real-time table updates
             try:
+                new_logs = initial_logs
                 with Live(self.create_log_table(), refresh_per_second=1) as live:
                     while True:
-                        time.sleep(self.poll_interval)
+                        self.channel.wait(changed=bool(new_logs), failed=self.last_fetch_failed)
                         
                         new_logs = self.fetch_new_logs()
                         if new_logs:
@@ -211,8 +276,9 @@ class LogMonitor:
         else:
             # Simple console output mode
             try:
+                new_logs = initial_logs
                 while True:
-                    time.sleep(self.poll_interval)
+                    self.channel.wait(changed=bool(new_logs), failed=self.last_fetch_failed)
                     
                     new_logs = self.fetch_new_logs()
                     if new_logs:
@@ -222,25 +288,413 @@ class LogMonitor:
                 console.print("\n[yellow]Log monitoring stopped by user.[/yellow]")
     
     def get_log_summary(self) -> Dict[str, Any]:
-        """Get a summary of all logs collected."""
-        if not self.all_logs:
+        """Get a summary of all logs collected, including those no longer in the ring buffer."""
+        if not self.total_logs:
             return {}
         
-        summary = {
-            'total_logs': len(self.all_logs),
-            'levels': {},
-            'sources': {},
+        return {
+            'total_logs': self.total_logs,
+            'levels': dict(self.level_counts),
+            'sources': dict(self.source_counts),
             'time_range': {
-                'start': self.all_logs[0].get('timestamp', ''),
-                'end': self.all_logs[-1].get('timestamp', '')
+                'start': self.first_timestamp,
+                'end': self.last_timestamp
             }
         }
-        
-        for log in self.all_logs:
-            level = log.get('level', 'UNKNOWN')
-            source = log.get('source', 'Unknown')
-            
-            summary['levels'][level] = summary['levels'].get(level, 0) + 1
-            summary['sources'][source] = summary['sources'].get(source, 0) + 1
-        
-        return summary
\ No newline at end of file
+
+
+LEVEL_STYLES = {
+    'ERROR': "bold red",
+    'WARNING': "bold yellow",
+    'WARN': "bold yellow",
+    'INFO': "bold green",
+    'DEBUG': "dim",
+}
+
+EXPERIMENT_COLORS = [
+    "cyan", "magenta", "green", "yellow", "blue", "bright_red",
+    "bright_cyan", "bright_magenta", "bright_green", "bright_yellow", "bright_blue",
+]
+
+
+class LogRenderer:
+    """
+    Append-only terminal renderer for log entries.
+
+    Each entry is formatted once when it arrives and written below what is
+    already on screen; nothing is cleared or reprinted. Level colours are
+    rendered to escape codes once up front and each batch is written with
+    a single call. The last ``scrollback`` formatted lines are kept so they
+    can be replayed, e.g. after the log restarts.
+    """
+
+    SCROLLBACK = 5000
+
+    def __init__(self, output_console: Optional[Console] = None, scrollback: Optional[int] = None, color: Optional[bool] = None):
+        self.console = output_console or console
+        self.scrollback = self.SCROLLBACK if scrollback is None else scrollback
+        self.lines = deque(maxlen=self.scrollback)
+        self.total_lines = 0
+        if color is None:
+            color = self.console.is_terminal and not self.console.no_color and self.console.color_system is not None
+        self._level_codes: Dict[str, Tuple[str, str]] = {}
+        if color:
+            probe = Console(file=io.StringIO(), force_terminal=True, color_system=self.console.color_system)
+            for level, style in LEVEL_STYLES.items():
+                # Render a marker to learn the escape codes that wrap a styled string
+                probe.print(Text("\0", style=style), end="")
+                start, _, end = probe.file.getvalue().partition("\0")
+                probe.file.seek(0)
+                probe.file.truncate()
+                self._level_codes[level] = (start, end)
+
+    @staticmethod
+    def format_time(timestamp: Any) -> str:
+        timestamp = str(timestamp or '')
+        # Fast path for ISO 8601 ('2025-07-24T10:30:00.123+00:00' -> '2025-07-24 10:30:00')
+        if len(timestamp) >= 19 and timestamp[10] in 'T ' and timestamp[4] == '-' and timestamp[13] == ':':
+            return f"{timestamp[:10]} {timestamp[11:19]}"
+        try:
+            return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return timestamp
+
+    @classmethod
+    def format_line(cls, log: Dict[str, Any]) -> str:
+        """Format one entry as a plain 'time [LEVEL] source: message' line."""
+        return f"{cls.format_time(log.get('timestamp'))} [{log.get('level', '')}] {log.get('source', '')}: {log.get('message', '')}"
+
+    def write(self, logs: List[Dict[str, Any]]) -> int:
+        """Format and write new entries. Returns the number of lines written."""
+        if not logs:
+            return 0
+        codes = self._level_codes
+        out = []
+        for log in logs:
+            line = self.format_line(log)
+            self.lines.append(line)
+            if codes:
+                level_codes = codes.get(str(log.get('level', '')).upper())
+                if level_codes:
+                    line = f"{level_codes[0]}{line}{level_codes[1]}"
+            out.append(line)
+        self.total_lines += len(logs)
+        self.write_text("\n".join(out) + "\n")
+        return len(logs)
+
+    def write_text(self, text: str):
+        self.console.file.write(text)
+        self.console.file.flush()
+
+    def replay(self):
+        """Write the kept scrollback again (without colours)."""
+        if self.lines:
+            self.write_text("\n".join(self.lines) + "\n")
+
+
+def _format_metric(value: float) -> str:
+    if value is None:
+        return "-"
+    if value == int(value) and abs(value) < 1e9:
+        return str(int(value))
+    return f"{value:.4g}"
+
+
+def create_metrics_table(extractor: TrainingMetricsExtractor, width: int = 40) -> Table:
+    """Sparklines with latest, min and max for every metric found so far."""
+    alerts = extractor.alerts()
+    table = Table(show_header=True, header_style="bold blue", box=None, padding=(0, 1))
+    table.add_column("Metric", style="cyan", no_wrap=True)
+    table.add_column("Trend", no_wrap=True)
+    table.add_column("Last", justify="right")
+    table.add_column("Min", justify="right", style="dim")
+    table.add_column("Max", justify="right", style="dim")
+    table.add_column("Values", justify="right", style="dim")
+    table.add_column("")
+    series_list = extractor.active_series()
+    if not series_list:
+        table.add_row(Text("waiting for epoch, step, loss or throughput lines...", style="dim"))
+        return table
+    for series in series_list:
+        alert = alerts.get(series.name)
+        table.add_row(
+            series.name,
+            Text(sparkline(series.points(), width), style="red" if alert else "green"),
+            _format_metric(series.last),
+            _format_metric(series.minimum),
+            _format_metric(series.maximum),
+            str(series.count),
+            Text(alert, style="bold red") if alert else "",
+        )
+    return table
+
+
+class FollowedExperiment:
+    """Polling state and rate statistics for one experiment in a MultiLogMonitor."""
+
+    RATE_WINDOW = 60  # seconds
+
+    def __init__(self, experiment_manager, project_id: int, experiment_group_code: str, version: str,
+                 label: str, color: str):
+        self.project_id = project_id
+        self.experiment_group_code = experiment_group_code
+        self.version = version
+        self.label = label
+        self.color = color
+        self.tail = experiment_manager.log_tail(project_id, experiment_group_code, version)
+        self.archive = LogArchive(project_id, experiment_group_code, version)
+        self.archive.resume(self.tail)
+        self.total_logs = 0
+        self.matched_logs = 0
+        self.error_count = 0
+        self.last_log_time = None
+        self.last_error = None
+        self.recent_counts = deque()
+        self.poller = PollScheduler.instance().poller(MultiLogMonitor.MIN_POLL_INTERVAL, MultiLogMonitor.MAX_POLL_INTERVAL)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Fetch new logs for this experiment and add them to its archive."""
+        if not self.poller.acquire():
+            return []
+        update = self.tail.poll()
+        if update.reset:
+            self.archive.reset()
+        self.archive.append(update.logs, self.tail.get_state())
+        return update.logs
+
+    def record(self, count: int, errors: int, now: float):
+        self.total_logs += count
+        self.error_count += errors
+        if count:
+            self.last_log_time = now
+            self.recent_counts.append((now, count))
+        while self.recent_counts and self.recent_counts[0][0] < now - self.RATE_WINDOW:
+            self.recent_counts.popleft()
+
+    def rate(self, now: float) -> float:
+        """Log lines per second over the last RATE_WINDOW seconds."""
+        if not self.recent_counts:
+            return 0.0
+        window = min(self.RATE_WINDOW, max(now - self.recent_counts[0][0], 1.0))
+        return sum(count for _, count in self.recent_counts) / window
+
+
+class MultiLogMonitor:
+    """
+    Follows the logs of many experiments in one view.
+
+    All experiments are polled through one bounded worker pool, each on its
+    own adaptive schedule so quiet experiments are polled less often. New
+    entries are merged by timestamp into a single scrollback, each
+    experiment gets its own colour, and a header table shows per-experiment
+    rates.
+    """
+
+    MAX_WORKERS = 8
+    SCROLLBACK = 500
+    # Longest a refresh waits for slow polls; they are picked up on a later one
+    CYCLE_DEADLINE = 1.0
+    MIN_POLL_INTERVAL = 1
+    MAX_POLL_INTERVAL = 15
+
+    def __init__(self, experiment_manager, experiments: List[Tuple[int, str, str]],
+                 levels: Optional[List[str]] = None, sources: Optional[List[str]] = None,
+                 pattern: Optional[Pattern] = None):
+        self.experiment_manager = experiment_manager
+        self.levels = {level.upper() for level in levels} if levels else None
+        self.sources = set(sources) if sources else None
+        self.pattern = pattern
+        show_project = len({project_id for project_id, _, _ in experiments}) > 1
+        self.experiments = [
+            FollowedExperiment(
+                experiment_manager, project_id, group, version,
+                label=f"{project_id}/{group}:{version}" if show_project else f"{group}:{version}",
+                color=EXPERIMENT_COLORS[index % len(EXPERIMENT_COLORS)],
+            )
+            for index, (project_id, group, version) in enumerate(experiments)
+        ]
+        # Merged scrollback kept sorted by (timestamp, arrival order)
+        self.merged_keys: List[Tuple[float, int]] = []
+        self.merged_logs: List[Tuple[FollowedExperiment, Dict[str, Any]]] = []
+        self.arrivals = 0
+        self.started_at = time.monotonic()
+        self.in_flight: Dict[Future, FollowedExperiment] = {}
+
+    def matches(self, log: Dict[str, Any]) -> bool:
+        if self.levels is not None and str(log.get('level', '')).upper() not in self.levels:
+            return False
+        if self.sources is not None and str(log.get('source', '')) not in self.sources:
+            return False
+        if self.pattern is not None and not self.pattern.search(str(log.get('message', ''))):
+            return False
+        return True
+
+    def poll_all(self, executor: ThreadPoolExecutor) -> List[Tuple[FollowedExperiment, Dict[str, Any]]]:
+        """
+        Poll every experiment that is due and return the new matching entries in timestamp order.
+
+        Waits at most CYCLE_DEADLINE for the polls; one slow experiment does
+        not hold back the others, and its entries arrive with a later call.
+        """
+        busy = set(self.in_flight.values())
+        submitted = []
+        for experiment in self.experiments:
+            if experiment not in busy and experiment.poller.due():
+                future = executor.submit(experiment.poll)
+                self.in_flight[future] = experiment
+                submitted.append(future)
+        if submitted:
+            wait(submitted, timeout=self.CYCLE_DEADLINE)
+        done = [future for future in self.in_flight if future.done()]
+        now = time.monotonic()
+        new_logs = []
+        for future in done:
+            experiment = self.in_flight.pop(future)
+            try:
+                logs = future.result()
+                experiment.last_error = None
+            except Exception as e:
+                experiment.last_error = str(e)
+                experiment.poller.schedule(failed=True)
+                continue
+            experiment.poller.schedule(changed=bool(logs))
+            errors = 0
+            for log in logs:
+                if str(log.get('level', '')).upper() == 'ERROR':
+                    errors += 1
+                if self.matches(log):
+                    experiment.matched_logs += 1
+                    new_logs.append(self.add_log(experiment, log))
+            experiment.record(len(logs), errors, now)
+        new_logs.sort(key=lambda item: item[0])
+        return [item[1] for item in new_logs]
+
+    def add_log(self, experiment: FollowedExperiment, log: Dict[str, Any]):
+        timestamp = log_timestamp(log)
+        key = (timestamp if timestamp is not None else time.time(), self.arrivals)
+        self.arrivals += 1
+        item = (experiment, log)
+        position = bisect.bisect(self.merged_keys, key)
+        self.merged_keys.insert(position, key)
+        self.merged_logs.insert(position, item)
+        if len(self.merged_keys) > self.SCROLLBACK:
+            del self.merged_keys[0]
+            del self.merged_logs[0]
+        return key, item
+
+    def format_row(self, experiment: FollowedExperiment, log: Dict[str, Any]) -> List[Any]:
+        timestamp = log.get('timestamp', '')
+        try:
+            time_str = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%H:%M:%S')
+        except (AttributeError, ValueError):
+            time_str = str(timestamp)[:8] or "N/A"
+        level = str(log.get('level', '')).upper()
+        return [
+            time_str,
+            Text(experiment.label, style=experiment.color),
+            Text(level, style=LEVEL_STYLES.get(level, "white")),
+            str(log.get('source', 'Unknown')),
+            str(log.get('message', '')),
+        ]
+
+    def create_stats_table(self) -> Table:
+        now = time.monotonic()
+        table = Table(show_header=True, header_style="bold blue", box=None, padding=(0, 1))
+        table.add_column("Experiment")
+        table.add_column("Lines", justify="right")
+        table.add_column("Lines/s", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("Last log", justify="right")
+        table.add_column("Status")
+        for experiment in self.experiments:
+            idle = f"{now - experiment.last_log_time:.0f}s ago" if experiment.last_log_time else "-"
+            status = Text(experiment.last_error[:60], style="red") if experiment.last_error else Text("ok", style="green")
+            table.add_row(
+                Text(experiment.label, style=experiment.color),
+                str(experiment.total_logs),
+                f"{experiment.rate(now):.1f}",
+                Text(str(experiment.error_count), style="red" if experiment.error_count else "dim"),
+                idle,
+                status,
+            )
+        return table
+
+    def create_log_table(self, max_rows: int) -> Table:
+        table = Table(show_header=True, header_style="bold blue", expand=True)
+        table.add_column("Time", style="dim", width=8, no_wrap=True)
+        table.add_column("Experiment", no_wrap=True)
+        table.add_column("Level", width=7, no_wrap=True)
+        table.add_column("Source", style="cyan", max_width=20, no_wrap=True)
+        table.add_column("Message", ratio=1, no_wrap=True, overflow="ellipsis")
+        for experiment, log in self.merged_logs[-max_rows:] if max_rows > 0 else []:
+            table.add_row(*self.format_row(experiment, log))
+        return table
+
+    def render(self):
+        # Leave room for the stats table, the log table borders and the footer
+        max_rows = console.height - len(self.experiments) - 8
+        footer = Text(
+            f"Following {len(self.experiments)} experiments | adaptive polling "
+            f"{self.MIN_POLL_INTERVAL}-{self.MAX_POLL_INTERVAL}s | Press Ctrl+C to stop",
+            style="dim",
+        )
+        return Group(self.create_stats_table(), self.create_log_table(max_rows), footer)
+
+    def wait_until_due(self):
+        """Sleep until the next experiment is due to be polled or a running poll finishes."""
+        busy = set(self.in_flight.values())
+        idle = [experiment.poller.next_due for experiment in self.experiments if experiment not in busy]
+        delay = max(min(idle) - time.monotonic(), 0.05) if idle else self.MAX_POLL_INTERVAL
+        if self.in_flight:
+            wait(list(self.in_flight), timeout=delay, return_when=FIRST_COMPLETED)
+        else:
+            time.sleep(delay)
+
+    def print_logs(self, items: List[Tuple[FollowedExperiment, Dict[str, Any]]]):
+        """Print entries as plain lines (used when output is not a terminal)."""
+        for experiment, log in items:
+            time_str, _, level, source, message = self.format_row(experiment, log)
+            console.out(f"{time_str} {experiment.label} [{level.plain}] {source}: {message}", highlight=False)
+
+    def start_monitoring(self, use_live_display: Optional[bool] = None):
+        """Poll all experiments until interrupted."""
+        if use_live_display is None:
+            use_live_display = console.is_terminal
+        hub = ProgressHub.instance()
+        was_quiet = hub.quiet
+        workers = min(self.MAX_WORKERS, max(len(self.experiments), 1))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-follow")
+        try:
+            if use_live_display:
+                # The hub's own Live display cannot run inside this one
+                hub.set_quiet()
+                with Live(self.render(), console=console, refresh_per_second=2, screen=False) as live:
+                    while True:
+                        self.poll_all(executor)
+                        live.update(self.render())
+                        self.wait_until_due()
+            else:
+                while True:
+                    self.print_logs(self.poll_all(executor))
+                    self.wait_until_due()
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Log monitoring stopped by user.[/yellow]")
+        finally:
+            for experiment in self.experiments:
+                experiment.poller.cancel()
+            # Polls still running append to the archives; let them finish before flushing
+            executor.shutdown(wait=True, cancel_futures=True)
+            hub.set_quiet(was_quiet)
+            for experiment in self.experiments:
+                experiment.archive.flush()
+
+    def get_log_summary(self) -> Dict[str, Any]:
+        """Per-experiment line and error counts collected so far."""
+        return {
+            experiment.label: {
+                'total_logs': experiment.total_logs,
+                'matched_logs': experiment.matched_logs,
+                'errors': experiment.error_count,
+            }
+            for experiment in self.experiments
+        }
@@ -40,6 +40,8 @@ from rich.panel import Panel
 from rich.table import Table
 from rich import box
 import json
+import re
+import fnmatch
 import yaml
 import tempfile
 import os
@@ -61,12 +63,17 @@ import yaml
 
 
 from agentcore.managers.experiment_manager import ExperimentManager
+from agentcore.managers.log_archive import LogArchive, parse_time
+from agentcore.managers.log_stats import compute_log_stats, filter_log_frame, load_log_frame
+from agentcore.managers.poll_scheduler import PollScheduler
 from agentcore.managers.base import BaseManager
 from agentcore.managers.table_manager import TableDisplay
 from agentcore.managers.projects_manager import ProjectManager
 from agentcore.managers.instance_manager import InstanceManager
 from agentcore.managers.experiments_manager import ExperimentsManager
-from agentcore.cli.experiments.logs import LogMonitor
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.managers.training_metrics import TrainingMetricsExtractor, compile_metric_patterns
+from agentcore.cli.experiments.logs import LogMonitor, LogRenderer, MultiLogMonitor, create_metrics_table
 from agentcore.cli.experiments.helpers import *
 from agentcore.cli.experiments.main import *
 
@@ -90,9 +97,16 @@ def run():
     project_type_id = selected_project.get("project_type_id")
     console.print(f"[bold green]Selected Project ID: {project_id} (Type ID: {project_type_id})[/bold green]")
     
+    # Instances, data versions and model types only depend on the project,
+    # so fetch them together before walking through the selections
+    response, data_versions, model_types = BaseManager.gather(
+        lambda: instance_manager.project_instance_show(project_id),
+        lambda: experiment_manager.list_data_versions(project_id),
+        lambda: experiment_manager.get_model_types(project_type_id)
+    )
+
     # Step 3: Show instances for the selected project
     console.print(f"\n[bold blue]Instances for project ID {project_id}:[/bold blue]")
-    response = instance_manager.project_instance_show(project_id)
     
     if response and response.get('instances'):
         instances = response['instances']
@@ -116,7 +130,6 @@ def run():
     
     # Step 5: Fetch and display data versions
     console.print(f"\n[bold blue]Data Versions for project ID {project_id}:[/bold blue]")
-    data_versions = experiment_manager.list_data_versions(project_id)
 
     # Create a direct Table instead of using TableDisplay
     from rich.table import Table
@@ -205,7 +218,6 @@ def run():
     
     # Step 10: Get and select model type
     console.print(f"\n[bold blue]Available Model Types for Project Type ID {project_type_id}:[/bold blue]")
-    model_types = experiment_manager.get_model_types(project_type_id)
     
     if not model_types:
         console.print("[yellow]No model types available for this project type. Exiting.[/yellow]")
@@ -364,6 +376,7 @@ def run():
                         console.print(f"Total logs collected: {summary['total_logs']}")
                         console.print(f"Log levels: {summary['levels']}")
                         console.print(f"Sources: {summary['sources']}")
+                    log_monitor.close()
             else:
                 console.print("[yellow]Could not extract experiment group code from result. Log monitoring unavailable.[/yellow]")
     else:
@@ -372,71 +385,326 @@ def run():
         
         
 
+def _validate_log_time(ctx, param, value):
+    if value is None:
+        return None
+    try:
+        return parse_time(value)
+    except ValueError:
+        raise click.BadParameter("use a duration like 30s, 15m, 2h, 1d or an ISO date/time")
+
+
+def _validate_log_pattern(ctx, param, value):
+    if value is None:
+        return None
+    try:
+        return re.compile(value)
+    except re.error as e:
+        raise click.BadParameter(f"invalid regular expression: {e}")
+
+
+def _validate_metric_patterns(ctx, param, value):
+    patterns = {}
+    for item in value:
+        name, separator, pattern = item.partition("=")
+        if not separator or not name.strip():
+            raise click.BadParameter(f"expected NAME=REGEX, got '{item}'")
+        patterns[name.strip()] = pattern
+    try:
+        compile_metric_patterns(patterns)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    return patterns
+
+
+RUNNING_EXPERIMENT_STATUSES = {'running', 'in_progress', 'in progress', 'started', 'pending', 'queued'}
+
+
+def _find_follow_targets(experiment_manager, project_id, group_pattern, version, running_only):
+    """Return (project_id, group code, version) for every experiment matching the filters."""
+    if project_id is not None:
+        project_ids = [project_id]
+    else:
+        projects = ProjectManager().view_projects() or []
+        project_ids = [project['id'] for project in projects if 'id' in project]
+
+    responses = BaseManager.gather(*[
+        (lambda pid=pid: experiment_manager.display_experiment_info(pid)) for pid in project_ids
+    ])
+
+    targets = []
+    for pid, response in zip(project_ids, responses):
+        for experiment in (response or {}).get('results') or []:
+            group = experiment.get('experiment_group_code')
+            experiment_version = experiment.get('version')
+            if not group or experiment_version is None:
+                continue
+            if group_pattern and not fnmatch.fnmatch(group, group_pattern):
+                continue
+            if version and str(experiment_version) != str(version):
+                continue
+            if running_only and str(experiment.get('status', '')).lower() not in RUNNING_EXPERIMENT_STATUSES:
+                continue
+            targets.append((pid, group, str(experiment_version)))
+    return targets
+
+
+def _print_archived_logs(logs, pager=False, batch_size=1000):
+    """Print archived log entries, optionally through the system pager. Returns the count."""
+    if pager:
+        count = 0
+        with console.pager():
+            for log in logs:
+                console.out(LogRenderer.format_line(log), highlight=False)
+                count += 1
+        return count
+
+    renderer = LogRenderer(scrollback=0)
+    batch = []
+    for log in logs:
+        batch.append(log)
+        if len(batch) >= batch_size:
+            renderer.write(batch)
+            batch = []
+    renderer.write(batch)
+    return renderer.total_lines
+
+
+def _format_span(delta) -> str:
+    seconds = int(delta.total_seconds())
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    if seconds < 86400:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    return f"{seconds // 86400}d {seconds % 86400 // 3600:02d}h"
+
+
+def _format_stamp(value) -> str:
+    return "-" if value is None or value != value else value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _print_log_stats(stats):
+    """Render the summary from compute_log_stats as Rich tables."""
+    if not stats["total"]:
+        console.print("[yellow]No matching log entries.[/yellow]")
+        return
+
+    overview = Table(title="Log Summary", box=MINIMAL_HEAVY_HEAD, show_header=False)
+    overview.add_column(style="bold cyan")
+    overview.add_column()
+    overview.add_row("Lines", f"{stats['total']:,}" + (f" ({stats['untimed']:,} without timestamp)" if stats["untimed"] else ""))
+    overview.add_row("Levels", ", ".join(f"{level} {count:,}" for level, count in stats["levels"].items()))
+    if stats["first"] is not None:
+        overview.add_row("First line", _format_stamp(stats["first"]))
+        overview.add_row("Last line", f"{_format_stamp(stats['last'])} ({_format_span(stats['idle'])} ago)")
+        longest = stats["gaps"]["gap"].max() if len(stats["gaps"]) else stats["gap_threshold"]
+        if stats["idle"] > max(longest, stats["gap_threshold"]):
+            overview.add_row("Activity", "[bold red]Silent for longer than any earlier pause - possibly stalled[/bold red]")
+        else:
+            overview.add_row("Activity", "[green]Within its usual rhythm[/green]")
+    console.print(overview)
+
+    timeline = stats["timeline"]
+    if timeline is not None:
+        table = Table(title=f"Lines per {stats['bucket']}", box=MINIMAL_HEAVY_HEAD)
+        table.add_column("Start", style="cyan")
+        for column in timeline.columns:
+            table.add_column(str(column).title(), justify="right")
+        table.add_column("Error %", justify="right")
+        for start, row in timeline.iterrows():
+            errors = row.get("ERROR", 0)
+            share = f"{100 * errors / row['total']:.1f}" if row["total"] else "-"
+            cells = [f"{int(value):,}" for value in row]
+            table.add_row(_format_stamp(start), *cells, f"[red]{share}[/red]" if errors else share)
+        console.print(table)
+
+    table = Table(title="Top Sources", box=MINIMAL_HEAVY_HEAD)
+    for column, justify in (("Source", "left"), ("Lines", "right"), ("Errors", "right"), ("First", "left"), ("Last", "left")):
+        table.add_column(column, justify=justify)
+    for source, row in stats["sources"].iterrows():
+        table.add_row(str(source), f"{row['lines']:,}", f"{row['errors']:,}",
+                      _format_stamp(row["first"]), _format_stamp(row["last"]))
+    console.print(table)
+
+    table = Table(title="Top Messages", box=MINIMAL_HEAVY_HEAD)
+    for column, justify in (("Count", "right"), ("Level", "left"), ("Message", "left"), ("First", "left"), ("Last", "left")):
+        table.add_column(column, justify=justify)
+    for template, row in stats["templates"].iterrows():
+        level = row["level"]
+        style = "red" if level == "ERROR" else "yellow" if level == "WARNING" else ""
+        table.add_row(f"{row['count']:,}", f"[{style}]{level}[/{style}]" if style else level, template,
+                      _format_stamp(row["first"]), _format_stamp(row["last"]))
+    console.print(table)
+
+    gaps = stats["gaps"]
+    if gaps is not None and len(gaps):
+        table = Table(title=f"Pauses longer than {_format_span(stats['gap_threshold'])}", box=MINIMAL_HEAVY_HEAD)
+        for column in ("From", "To", "Silent for"):
+            table.add_column(column)
+        for _, row in gaps.iterrows():
+            table.add_row(_format_stamp(row["start"]), _format_stamp(row["end"]), _format_span(row["gap"]))
+        console.print(table)
+
+
 @experiments.command(name="logs", help="View live logs for a running experiment.")
+@click.option('--project-id', type=int, help='Project ID (skips the project prompt)')
+@click.option('--group', 'group_code', help='Experiment group code (a glob pattern with --follow-many)')
+@click.option('--version', 'version_option', help='Experiment version (requires --group)')
+@click.option('--since', callback=_validate_log_time, help='Only logs after this time (e.g. 15m, 2h, 2025-07-24T10:00)')
+@click.option('--until', callback=_validate_log_time, help='Only logs before this time')
+@click.option('--level', 'levels', multiple=True, help='Only logs with this level (repeatable)')
+@click.option('--source', 'sources', multiple=True, help='Only logs from this source (repeatable)')
+@click.option('--grep', 'pattern', callback=_validate_log_pattern, help='Only logs whose message matches this regex')
+@click.option('--tail', type=click.IntRange(min=0), help='Only the last N matching logs')
+@click.option('--offline', is_flag=True, help='Answer from the local log archive without contacting the server')
+@click.option('--pager', is_flag=True, help='Page through the archived log history instead of following it')
+@click.option('--stats', is_flag=True,
+              help='Summarize the archived logs (levels over time, top sources and messages, pauses) instead of printing them')
+@click.option('--metrics', is_flag=True,
+              help='Chart epoch, step, loss, validation metric and throughput values found in the log while following it')
+@click.option('--metric-pattern', 'metric_patterns', multiple=True, callback=_validate_metric_patterns,
+              help='NAME=REGEX pattern for an extra or replaced --metrics series; the first group is the value (repeatable)')
+@click.option('--follow-many', is_flag=True,
+              help='Follow every experiment matching --project-id, --group (glob pattern), --version and --running in one view')
+@click.option('--running', is_flag=True, help='With --follow-many, only follow running experiments')
 @BaseManager.handle_api_error
-def logs():
-    """Display live logs for a running experiment."""
-    import time
-    import threading
+def logs(project_id, group_code, version_option, since, until, levels, sources, pattern, tail, offline,
+         pager, stats, metrics, metric_patterns, follow_many, running):
+    """
+    Display live logs for a running experiment.
+
+    Fetched logs are kept in a local archive under ~/.agentcore/logs. With any
+    of --since, --until, --level, --source, --grep or --tail the matching
+    logs are printed from the archive once, after fetching only what is
+    missing from the server, instead of following the log. --pager shows the
+    same history in the system pager, and --stats summarizes it instead.
+
+    With --metrics, training curves extracted from the log (epoch, step,
+    loss, validation metrics, throughput) are drawn as sparklines below the
+    live log, with warnings for plateaus and throughput drops.
+
+    With --follow-many, all matching experiments are followed in one merged
+    view (--level, --source and --grep filter it). Without --project-id or
+    --group this follows every running experiment.
+    """
+    if follow_many:
+        experiment_manager = ExperimentManager()
+        running_only = running or (project_id is None and not group_code)
+        targets = _find_follow_targets(experiment_manager, project_id, group_code, version_option, running_only)
+        if not targets:
+            console.print("[yellow]No matching experiments to follow.[/yellow]")
+            return None
+        console.print(f"[bold green]Following {len(targets)} experiments...[/bold green]")
+        monitor = MultiLogMonitor(experiment_manager, targets, levels=levels, sources=sources, pattern=pattern)
+        monitor.start_monitoring()
+        for label, counts in monitor.get_log_summary().items():
+            console.print(f"[dim]{label}: {counts['total_logs']} lines, {counts['errors']} errors[/dim]")
+        return None
+
     from rich.live import Live
-    from rich.text import Text
-    from rich.panel import Panel
-    
+
     experiment_manager = ExperimentManager()
     project_manager = ProjectManager()
     table_display = TableDisplay()
     
     # Step 1: Get available projects
-    selected_project = get_project_list()
- 
-    project_id = selected_project['id']
-    project_type_id = selected_project.get("project_type_id")
+    if project_id is None:
+        selected_project = get_project_list()
+        if not selected_project:
+            return None
+        project_id = selected_project['id']
  
     console.print(f"[bold green]Selected Project ID: {project_id}[/bold green]")
 
     # Step 3: Get experiment group code and version from user
+    if group_code and version_option:
+        experiment_group_code, version = group_code, version_option
+    else:
+        selected_experiment = get_experiments_by_project_search_list(project_id)
+        if not selected_experiment:
+            return None
+        
+        experiment_group_code = selected_experiment['experiment_group_code']
+        version = selected_experiment['version']
 
-    selected_experiment = get_experiments_by_project_search_list(project_id)
-    if not selected_experiment:
+    archive = LogArchive(project_id, experiment_group_code, version)
+    # Follows over long-poll or SSE when the server offers them, polling otherwise
+    log_channel = experiment_manager.log_channel(
+        project_id, experiment_group_code, version,
+        poller=PollScheduler.instance().poller(min_interval=1, max_interval=15),
+    )
+    log_tail = experiment_manager.log_tail(project_id, experiment_group_code, version, channel=log_channel)
+
+    if pager or stats or any(option is not None for option in (since, until, pattern, tail)) or levels or sources:
+        if not offline:
+            try:
+                archive.sync(log_tail)
+            except Exception as e:
+                console.print(f"[yellow]Could not fetch new logs, showing archived logs only: {str(e)}[/yellow]")
+        if stats:
+            frame = load_log_frame(archive.iter_block_texts(since=since, until=until, levels=levels, sources=sources))
+            frame = filter_log_frame(frame, since=since, until=until, levels=levels, sources=sources, pattern=pattern)
+            if tail is not None:
+                frame = frame.sort_values("timestamp", kind="stable").tail(tail)
+            _print_log_stats(compute_log_stats(frame))
+            return None
+        matched = _print_archived_logs(
+            archive.query(since=since, until=until, levels=levels, sources=sources, pattern=pattern, tail=tail),
+            pager=pager,
+        )
+        console.print(f"[dim]{matched} matching log entries ({archive.entry_count} archived)[/dim]")
         return None
-    
-    experiment_group_code = selected_experiment['experiment_group_code']
-    version = selected_experiment['version']
-    
+
+    if offline:
+        _print_archived_logs(archive.query())
+        return None
+
     # Step 4: Start live log polling
     console.print(f"\n[bold green]Starting live log monitoring for Project {project_id}, Group {experiment_group_code}, Version {version}[/bold green]")
     console.print("[dim]Press Ctrl+C to stop...[/dim]\n")
     
-    from datetime import datetime
-
     def fetch_and_display_logs():
-        previous_log_content = ""
+        # New lines are appended below what is on screen; nothing is redrawn
+        renderer = LogRenderer()
+        console.print(
+            f"[bold blue]Live Logs - Project: {project_id} | Group: {experiment_group_code} | Version: {version}[/bold blue]"
+        )
+        
+        # Start from the end of the archived logs and only fetch what came after them
+        history = list(archive.query(tail=renderer.scrollback))
+        hidden = archive.entry_count - len(history)
+        if hidden > 0:
+            console.print(f"[dim]... {hidden} earlier lines (use --pager to view the full history)[/dim]")
+        renderer.write(history)
+        if extractor is not None:
+            for text in archive.iter_block_texts():
+                extractor.feed_jsonl(text)
+        archive.resume(log_tail)
+        waiting_notice = not history
         
         while True:
             try:
-                # Fetch logs
-                response = experiment_manager.fetch_logs(project_id, experiment_group_code, version)
-                logs = response.get("logs", [])
-                
-                # Format each log line
-                current_log_content = "\n".join([
-                    f"{datetime.fromisoformat(log['timestamp']).strftime('%Y-%m-%d %H:%M:%S')} "
-                    f"[{log['level']}] {log['source']}: {log['message']}"
-                    for log in logs
-                ]) if logs else "[dim]No logs available yet...[/dim]"
+                # Fetch only the logs appended since the last poll
+                update = log_tail.poll()
+                if update.reset:
+                    archive.reset()
+                    console.rule("[yellow]Log restarted[/yellow]")
+                archive.append(update.logs, log_tail.get_state())
+                if extractor is not None:
+                    extractor.feed(update.logs)
                 
-                # Only update if content has changed
-                if current_log_content != previous_log_content:
-                    console.clear()
-                    console.print(
-                        f"[bold blue]Live Logs - Project: {project_id} | Group: {experiment_group_code} | Version: {version}[/bold blue]"
-                    )
-                    console.print("[yellow]Press Ctrl+C to stop...[/yellow]\n")
-                    
-                    console.print(current_log_content)
-                    previous_log_content = current_log_content
+                if waiting_notice and not update.logs:
+                    console.print("[dim]No logs available yet...[/dim]")
+                waiting_notice = False
+                new_logs = update.logs
+                if len(new_logs) > renderer.scrollback:
+                    console.print(f"[dim]... {len(new_logs) - renderer.scrollback} earlier lines (use --pager to view the full history)[/dim]")
+                    new_logs = new_logs[-renderer.scrollback:]
+                renderer.write(new_logs)
                 
-                time.sleep(2)
+                log_channel.wait(changed=bool(update.logs))
             
             except KeyboardInterrupt:
                 console.print("\n[yellow]Log monitoring stopped by user.[/yellow]\n")
@@ -444,17 +712,31 @@ def logs():
             
             except Exception as e:
                 console.print(f"\n[red]Error fetching logs: {str(e)}[/red]")
-                time.sleep(5)
+                log_channel.wait(failed=True)
 
-    
+    extractor = TrainingMetricsExtractor(metric_patterns) if metrics else None
+    hub = ProgressHub.instance()
+    was_quiet = hub.quiet
     try:
-        fetch_and_display_logs()
+        if extractor is not None and console.is_terminal:
+            # Log lines are printed above the chart, which stays at the bottom of the screen
+            hub.set_quiet()
+            with Live(get_renderable=lambda: create_metrics_table(extractor), console=console,
+                      refresh_per_second=2, redirect_stdout=True, transient=True):
+                fetch_and_display_logs()
+        else:
+            fetch_and_display_logs()
     except KeyboardInterrupt:
         console.print("\n[yellow]Exiting log viewer...[/yellow]")
+    finally:
+        hub.set_quiet(was_quiet)
+        archive.flush()
+    if extractor is not None:
+        console.print(create_metrics_table(extractor))
 
 
 
 
-    return payload
+    return None
 if __name__ == "__main__":
     experiments()
\ No newline at end of file
@@ -32,6 +32,7 @@ from agentcore.cli.experiments.helpers import get_project_list
 from agentcore.cli.instances.aws_operations import create_aws_instance, get_aws_region_list, get_aws_instance_types
 from agentcore.cli.instances.onprem_operations import create_onprem_instance
 from agentcore.cli.instances.status_tracker import fetch_instance_details, fetch_instance_details_project_id, fetch_status
+from agentcore.cli.instances.top import top
 
 console = Console()
 
@@ -369,5 +370,7 @@ def update_instance():
     
     fetch_status(response['task_id'], instance_id=instance_id)
 
+instances.add_command(top)
+
 if __name__ == "__main__":
-    instances()
\ No newline at end of file
+    instances()
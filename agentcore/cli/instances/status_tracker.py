@@ -33,6 +33,7 @@ import time
 from agentcore.managers.instance_manager import InstanceManager
 from agentcore.managers.table_manager import TableDisplay
 from agentcore.managers.base import BaseManager
+from agentcore.managers.poll_scheduler import PollScheduler
 from agentcore.cli.experiments.helpers import get_project_list
 from agentcore.cli.instances.utils import beautify_datetime
 
@@ -59,12 +60,25 @@ def fetch_status(task_id=None,instance_id = None):
     # Initial setup
     table = None
     live = None
+    # Long-poll or SSE when the server offers them, adaptive polling otherwise
+    channel = instance_manager.task_status_channel(
+        task_id, poller=PollScheduler.instance().poller(min_interval=1, max_interval=20)
+    )
     
     try:
         while True:
-            response = instance_manager.instance_status(task_id)
-            if instance_id:
-                instance_response = instance_manager.instance_show(instance_id=instance_id)
+            if instance_id and not channel.pushing:
+                response, instance_response = BaseManager.gather(
+                    lambda: instance_manager.instance_status(task_id, channel=channel),
+                    lambda: instance_manager.instance_show(instance_id=instance_id)
+                )
+            elif instance_id:
+                # A pushed status may wait on the server for minutes; fetch the
+                # instance after it arrives so both describe the same moment
+                response = instance_manager.instance_status(task_id, channel=channel)
+                instance_response = instance_manager.instance_show(instance_id=instance_id) if response else None
+            else:
+                response = instance_manager.instance_status(task_id, channel=channel)
             if not response:
                 if live:
                     live.stop()
@@ -121,9 +135,12 @@ def fetch_status(task_id=None,instance_id = None):
                     console.print(response)
                 break
             
-            # Wait for 5 seconds before next update
-            import time
-            time.sleep(5)
+            # Poll again soon while the task is changing, back off while it is not
+            changed = channel.observe((
+                response.get("status"), response.get("updated_at"),
+                instance_response.get("state") if instance_id else None,
+            ))
+            channel.wait(changed=changed)
             
     except KeyboardInterrupt:
         if live:
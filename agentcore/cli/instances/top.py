@@ -0,0 +1,192 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import time
+from typing import Dict, List, Optional
+
+import click
+from rich import box
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from agentcore.managers.fleet_monitor import RUNNING_STATES, FleetMonitor, FleetRow
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.managers.projects_manager import ProjectManager
+
+console = Console()
+
+STATE_STYLES = {"running": "green", "pending": "yellow", "starting": "yellow", "stopping": "yellow",
+                "stopped": "dim", "terminated": "dim", "failed": "red", "error": "red"}
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    seconds = int(seconds)
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    if seconds < 86400:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 86400}d{seconds % 86400 // 3600:02d}h"
+
+
+def _format_transition(row: FleetRow) -> str:
+    if row.last_transition is None:
+        return ""
+    before, after, duration = row.last_transition
+    took = f" after {_format_duration(duration)}" if duration is not None else ""
+    return f"{before} → {after}{took}"
+
+
+class FleetTable:
+    """
+    Renders the FleetMonitor rows as one table.
+
+    The cells that only change when the instance does are cached per row
+    version, so each refresh only rebuilds the rows that changed plus the
+    clock-driven columns (time in state, uptime, cost).
+    """
+
+    def __init__(self, monitor: FleetMonitor):
+        self.monitor = monitor
+        self._cells: Dict[tuple, tuple] = {}
+
+    def _static_cells(self, key, row: FleetRow) -> List[str]:
+        cached = self._cells.get(key)
+        if cached is not None and cached[0] == row.version:
+            return cached[1]
+        instance = row.instance
+        style = STATE_STYLES.get(str(row.state or "").lower(), "")
+        state = f"[{style}]{row.state}[/{style}]" if style else str(row.state)
+        cells = [
+            f"{row.project_name}", str(instance.get("id")), str(instance.get("name") or ""),
+            state, str(instance.get("instance_type") or ""), _format_transition(row),
+        ]
+        self._cells[key] = (row.version, cells)
+        return cells
+
+    def __rich_console__(self, console, options):
+        # Rendering rows that Live would crop anyway costs ~1 ms each
+        yield self.render(max_rows=max((options.height or console.height) - 8, 1))
+
+    def render(self, max_rows: Optional[int] = None) -> Table:
+        monitor = self.monitor
+        now = time.time()
+        table = Table(box=box.MINIMAL_HEAVY_HEAD)
+        for column in ("Project", "ID", "Name", "State", "Type", "Last Transition"):
+            table.add_column(column, style="cyan" if column == "Project" else None)
+        table.add_column("In State", justify="right")
+        table.add_column("Uptime", justify="right")
+        table.add_column("Cost", justify="right")
+
+        # Instances that are not running come first: they are the ones changing
+        keys = sorted(monitor.rows, key=lambda key: (
+            str(monitor.rows[key].state or "").lower() in RUNNING_STATES, str(key[0]), str(key[1])
+        ))
+        total_cost, currency = 0.0, ""
+        for index, key in enumerate(keys):
+            row = monitor.rows[key]
+            cost = monitor.cost(row, now)
+            cost_cell = "-"
+            if cost is not None:
+                currency = monitor.price(row).get("currency") or ""
+                total_cost += cost
+                cost_cell = f"{cost:,.2f} {currency}".strip()
+            if max_rows is not None and index >= max_rows:
+                continue
+            table.add_row(
+                *self._static_cells(key, row),
+                _format_duration(row.in_state(now)), _format_duration(row.uptime(now)), cost_cell,
+            )
+        self._cells = {key: cells for key, cells in self._cells.items() if key in monitor.rows}
+
+        stats = monitor.stats
+        caption = (
+            f"{len(monitor.rows)} instances in {len(monitor.projects)} projects"
+            f" | {stats['requests']} requests, {stats['not_modified']} unchanged, {stats['deltas']} deltas"
+        )
+        if total_cost:
+            caption += f" | running cost {total_cost:,.2f} {currency}".rstrip()
+        if max_rows is not None and len(keys) > max_rows:
+            caption += f" | {len(keys) - max_rows} more not shown"
+        caption += " | Ctrl+C to quit"
+        if monitor.errors:
+            caption += "\n[red]" + "; ".join(
+                f"project {monitor.projects[project_id]}: {error}" for project_id, error in monitor.errors.items()
+            ) + "[/red]"
+        table.caption = caption
+        return table
+
+
+def _resolve_projects(project_ids) -> Optional[Dict]:
+    response = ProjectManager().view_projects()
+    if not isinstance(response, list):
+        response = (response or {}).get("results", []) if isinstance(response, dict) else []
+    names = {project["id"]: project.get("name", str(project["id"])) for project in response if "id" in project}
+    if not project_ids:
+        return names or None
+    return {project_id: names.get(project_id, str(project_id)) for project_id in project_ids}
+
+
+@click.command(name='top')
+@click.option('--project-id', 'project_ids', type=int, multiple=True,
+              help='Only this project (repeatable); all projects by default')
+@click.option('--interval', type=click.FloatRange(min=1), default=2, show_default=True,
+              help='Seconds between polls of a project while its instances are changing')
+def top(project_ids, interval):
+    """Live dashboard of instance state, uptime and running cost across projects."""
+    projects = _resolve_projects(project_ids)
+    if not projects:
+        console.print("[red]No Projects found.[/red]\n")
+        return
+
+    monitor = FleetMonitor(projects, min_interval=interval)
+    try:
+        if console.is_terminal:
+            hub = ProgressHub.instance()
+            quiet = hub.quiet
+            hub.set_quiet()
+            try:
+                with Live(FleetTable(monitor), console=console, refresh_per_second=1, screen=False):
+                    monitor.run()
+            finally:
+                hub.set_quiet(quiet)
+        else:
+            # Plain output for logs and pipes: one line per changed instance
+            def report(current: FleetMonitor, changed: List[FleetRow]):
+                for row in changed:
+                    line = f"{row.project_name} {row.instance_id} {row.instance.get('name', '')}: {row.state}"
+                    transition = _format_transition(row)
+                    if transition:
+                        line += f" ({transition})"
+                    console.print(line, markup=False, highlight=False, soft_wrap=True)
+
+            monitor.run(on_update=report)
+    except KeyboardInterrupt:
+        pass
+    stats = monitor.stats
+    console.print(
+        f"[dim]{stats['requests']} requests, {stats['not_modified']} answered 304 Not Modified, "
+        f"{stats['deltas']} delta responses[/dim]"
+    )
@@ -23,6 +23,10 @@
 import logging
 logging.getLogger("urllib3.connectionpool").setLevel(logging.CRITICAL)
 
+# Start connecting to the API host before the command modules are imported
+from agentcore.managers.prewarm import start_prewarm
+start_prewarm()
+
 import click
 import json
 import logging
@@ -41,15 +45,20 @@ from agentcore.cli.observability import observability
 from agentcore.cli.login import logout,change_password,reset_password, login_user, signup_user
 from agentcore.cli.deploy import deploy
 from agentcore.cli.data.main import data
+from agentcore.cli.watch import watch
+from agentcore.managers.progress_hub import ProgressHub
 
 console = Console()
 
 @click.group()
 @click.option('--debug', is_flag=True, help='Enable debug logging')
-def cli(debug):
+@click.option('--quiet', '-q', is_flag=True, help='Hide progress spinners')
+def cli(debug, quiet):
     """AgentCORE CLI - Manage your ML projects with ease."""
     log_level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(level=log_level)
+    if quiet:
+        ProgressHub.instance().set_quiet()
 
 @cli.command("list")
 @click.pass_context
@@ -94,6 +103,7 @@ cli.add_command(change_password)
 cli.add_command(reset_password)
 cli.add_command(deploy)
 cli.add_command(signup_user)
+cli.add_command(watch)
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -138,8 +138,7 @@ def view_users(format):
     """View all users with formatting and pagination."""
     user_manager = UserManager()
     base_manager = BaseManager()
-    response_users = user_manager.view_users()
-    response_roles = user_manager.view_roles()
+    response_users, response_roles = BaseManager.gather(user_manager.view_users, user_manager.view_roles)
 
     if response_users == -1:
         return None
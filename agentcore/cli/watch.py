@@ -0,0 +1,157 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import sys
+import time
+
+import click
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from rich import box
+
+from agentcore.managers.log_archive import parse_time
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.managers.task_journal import TASK_KINDS, TaskJournal
+from agentcore.managers.task_watcher import FAILED, PENDING, SUCCEEDED, TaskWatcher
+
+console = Console()
+
+STATE_STYLES = {PENDING: "dim", "running": "yellow", SUCCEEDED: "green", FAILED: "red"}
+
+
+def _format_elapsed(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 3600:
+        return f"{seconds // 60}:{seconds % 60:02d}"
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def create_watch_table(watcher: TaskWatcher) -> Table:
+    """Render one row per watched task with a summary caption."""
+    now = time.monotonic()
+    table = Table(box=box.MINIMAL_HEAVY_HEAD, show_lines=False)
+    table.add_column("Kind", style="cyan")
+    table.add_column("ID")
+    table.add_column("Task")
+    table.add_column("Status")
+    table.add_column("Elapsed", justify="right")
+    table.add_column("Detail", overflow="fold")
+    for task in watcher.tasks:
+        style = STATE_STYLES.get(task.state, "")
+        detail = task.error or task.detail
+        if task.hook_result:
+            detail = f"{detail} [dim]({task.hook_result})[/dim]" if detail else f"[dim]{task.hook_result}[/dim]"
+        table.add_row(
+            task.kind,
+            task.task_id,
+            task.label,
+            f"[{style}]{task.status}[/{style}]",
+            _format_elapsed(task.elapsed(now)),
+            f"[red]{detail}[/red]" if task.error else detail,
+        )
+    done = sum(task.done for task in watcher.tasks)
+    table.caption = (
+        f"{done}/{len(watcher.tasks)} finished | {len(watcher.failed)} failed"
+        + ("" if done == len(watcher.tasks) else " | Ctrl+C to stop watching")
+    )
+    return table
+
+
+def _validate_since(ctx, param, value):
+    if value is None:
+        return None
+    try:
+        return parse_time(value)
+    except ValueError:
+        raise click.BadParameter("use a duration like 30s, 15m, 2h, 1d or an ISO date/time")
+
+
+@click.command("watch")
+@click.option('--instance-task', 'instance_tasks', multiple=True, help='Instance task ID (repeatable)')
+@click.option('--data-task', 'data_tasks', multiple=True, help='Data fetch/transform task ID (repeatable)')
+@click.option('--deploy-job', 'deploy_jobs', multiple=True, help='Deployment job ID (repeatable)')
+@click.option('--promotion', 'promotions', multiple=True, help='Production promotion ID (repeatable)')
+@click.option('--since', callback=_validate_since,
+              help='Also watch every task started from this machine since then (e.g. 30m, 2h)')
+@click.option('--kind', 'kinds', multiple=True, type=click.Choice(TASK_KINDS),
+              help='With --since, only tasks of this kind (repeatable)')
+@click.option('--on-complete', help='Shell command run as each task finishes; '
+              'AGENTCORE_TASK_KIND, _ID, _LABEL, _STATUS and _STATE are set')
+@click.option('--timeout', type=click.FloatRange(min=0, min_open=True),
+              help='Give up after this many seconds; unfinished tasks count as failed')
+def watch(instance_tasks, data_tasks, deploy_jobs, promotions, since, kinds, on_complete, timeout):
+    """Watch instance, data, deployment and promotion tasks until they finish.
+
+    Exits with status 1 if any task failed or timed out.
+    """
+    tasks = [("instance", task_id, None) for task_id in instance_tasks]
+    tasks += [("data", task_id, None) for task_id in data_tasks]
+    tasks += [("deploy", job_id, None) for job_id in deploy_jobs]
+    tasks += [("promotion", promotion_id, None) for promotion_id in promotions]
+    if since is not None:
+        seen = {(kind, str(task_id)) for kind, task_id, _ in tasks}
+        for entry in TaskJournal.instance().recent(since, kinds=list(kinds) or None):
+            if (entry["kind"], entry["id"]) not in seen:
+                tasks.append((entry["kind"], entry["id"], entry.get("label")))
+    if not tasks:
+        console.print("[yellow]No tasks to watch. Pass task IDs or --since (e.g. --since 1h).[/yellow]")
+        return
+
+    watcher = TaskWatcher(tasks, on_complete=on_complete, timeout=timeout)
+    try:
+        if console.is_terminal:
+            hub = ProgressHub.instance()
+            quiet = hub.quiet
+            hub.set_quiet()
+            try:
+                with Live(get_renderable=lambda: create_watch_table(watcher), console=console, refresh_per_second=4):
+                    succeeded = watcher.run()
+            finally:
+                hub.set_quiet(quiet)
+        else:
+            # Plain output for logs and CI: one line per status change
+            reported = {}
+
+            def report(current: TaskWatcher):
+                for task in current.tasks:
+                    if task.state == PENDING and not task.error:
+                        continue
+                    line = f"{task.kind} {task.task_id}: {task.status} ({task.state})"
+                    if task.error or task.detail:
+                        line += f" {task.error or task.detail}"
+                    if task.hook_result:
+                        line += f" [{task.hook_result}]"
+                    if reported.get(task) != line:
+                        reported[task] = line
+                        console.print(line, markup=False, highlight=False, soft_wrap=True)
+
+            succeeded = watcher.run(on_update=report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching; the tasks keep running on the server.[/yellow]")
+        sys.exit(130)
+
+    if not succeeded:
+        console.print(f"[red]{len(watcher.failed)} of {len(watcher.tasks)} tasks failed[/red]")
+        sys.exit(1)
+    console.print(f"[green]All {len(watcher.tasks)} tasks finished successfully[/green]")
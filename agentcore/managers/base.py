@@ -20,12 +20,13 @@
 # Original License Date: 2025-07-24
 # ###################################################################################
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import json
+import threading
 import time
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit import prompt
@@ -36,6 +37,8 @@ from agentcore.managers.config import ConfigManager
 from agentcore.managers.client import APIClient, APIError
 from agentcore.utils.config import CONFIG_FILE, CONFIG_DIR
 from agentcore.managers.table_manager import TableDisplay
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.managers.status_channel import StatusChannel
 
 import sys
 import os
@@ -50,7 +53,9 @@ class ConfigurationError(Exception):
 
 class BaseManager:
     _shared_client = None
+    _shared_client_lock = threading.Lock()
     SUPPORT_EMAIL = "support-agentcore@coreops.ai"
+    GATHER_MAX_WORKERS = 8
     
     def __init__(self, config_manager=None, api_client=None):
         """
@@ -73,7 +78,9 @@ class BaseManager:
         This ensures the same client instance is used across all API calls.
         """
         if BaseManager._shared_client is None:
-            BaseManager._shared_client = self._create_api_client()
+            with BaseManager._shared_client_lock:
+                if BaseManager._shared_client is None:
+                    BaseManager._shared_client = self._create_api_client()
         else:
             # Update the existing client with current token (in case it was refreshed)
             current_token = self.config_manager.access_token()
@@ -136,9 +143,48 @@ class BaseManager:
         return formatted_messages
 
 
+    @staticmethod
+    def gather(*operations, max_workers=None):
+        """
+        Run independent API operations concurrently.
+        The shared APIClient is thread-safe, so manager methods can be
+        passed in directly, e.g. gather(manager.view_users, manager.view_roles).
+
+        Args:
+            *operations: Zero-argument callables
+            max_workers (int, optional): Thread limit. Defaults to GATHER_MAX_WORKERS
+
+        Returns:
+            list: Results in the same order as the operations. If any
+            operation raised, the exception of the earliest one in argument
+            order is re-raised once all have finished.
+        """
+        if len(operations) <= 1:
+            return [operation() for operation in operations]
+
+        workers = min(len(operations), max_workers or BaseManager.GATHER_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-gather") as executor:
+            futures = [executor.submit(operation) for operation in operations]
+        return [future.result() for future in futures]
+
+    def status_channel(self, endpoint, **kwargs) -> StatusChannel:
+        """
+        Open a StatusChannel on a status endpoint of this manager's API.
+
+        Args:
+            endpoint: Status endpoint
+            **kwargs: poller, params and wait passed to StatusChannel
+
+        Returns:
+            StatusChannel using long-poll or SSE when the server offers them
+        """
+        return StatusChannel(self.api_client, endpoint, **kwargs)
+
     def _execute_with_progress(self, description, operation):
         """
         Centralized progress tracking for API operations.
+        Progress is reported through the process-wide ProgressHub, which only
+        draws a spinner once the operation has run for a moment.
         Only retries for specific token validation errors.
         Leverages APIClient's built-in token refresh mechanism.
         """
@@ -147,12 +193,7 @@ class BaseManager:
         success = False
         last_error = None
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
-            task = progress.add_task(description=description, total=None)
+        with ProgressHub.instance().task(description) as task:
 
             while not success and retries <= max_retries:
                 try:
@@ -162,8 +203,7 @@ class BaseManager:
                         return result
                     # Retry only if result is None
                     wait = retries * 2
-                    progress.update(
-                        task,
+                    task.update(
                         # description=f"{description} (Retry {retries}/{max_retries})"
                         description=f"{description}"
                     )
@@ -179,8 +219,7 @@ class BaseManager:
                         "Given token not valid for any token type" in str(e.message)):
                         
                         wait = retries * 2
-                        progress.update(
-                            task,
+                        task.update(
                             # description=f"{description} (Token refresh retry {retries}/{max_retries} - waiting {wait}s)"
                             description=f"{description}"
                         )
@@ -0,0 +1,240 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from agentcore.managers.client import APIError
+from agentcore.managers.data_profile import EXCEL_EXTENSIONS, convert_excel_to_csv, profile_file
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.managers.upload_registry import UploadRegistry
+from agentcore.utils.config import INGEST_MANIFEST_DIR
+
+# Outcomes recorded for each file
+UPLOADED = "uploaded"
+REUSED = "reused"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+def collect_files(source: str, pattern: Optional[str] = None) -> List[str]:
+    """
+    List the files to ingest, sorted by path.
+
+    Args:
+        source: A directory or a glob such as 'drops/2025-*/*.csv' ('**' recurses)
+        pattern: Glob applied inside a directory source (default: every file)
+    """
+    source = os.path.expanduser(source)
+    if os.path.isdir(source):
+        source = os.path.join(source, pattern or "*")
+    return sorted(os.path.abspath(path) for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting one file."""
+
+    path: str
+    status: str
+    datasource_id: Any = None
+    detail: str = ""
+
+
+class IngestManifest:
+    """
+    JSON record of which files of a bulk ingestion succeeded or failed.
+
+    Each file is stored with its size, modification time and SHA-256, and
+    the datasource it became or the error it failed with. A file that
+    succeeded is skipped on later runs while its size and mtime are
+    unchanged, or when its contents hash the same as before, so a re-run
+    only processes new, changed and failed files.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            self.entries: Dict[str, Dict[str, Any]] = json.loads(self.path.read_text(encoding="utf-8"))["files"]
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+
+    @staticmethod
+    def default_path(source: str) -> Path:
+        """Manifest location for a source: ~/.agentcore/ingest/<name>-<hash>.json."""
+        source = os.path.abspath(os.path.expanduser(source))
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", os.path.basename(source.rstrip("/*")) or "root")
+        return INGEST_MANIFEST_DIR / f"{name}-{hashlib.sha1(source.encode()).hexdigest()[:10]}.json"
+
+    def is_done(self, file_path: str) -> bool:
+        """Whether the file was ingested before and has not changed since."""
+        with self._lock:
+            entry = self.entries.get(file_path)
+        if not entry or entry.get("status") not in (UPLOADED, REUSED):
+            return False
+        stat = os.stat(file_path)
+        if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        # Touched but possibly not changed (e.g. copied again): compare contents
+        if entry.get("size") != stat.st_size or UploadRegistry.instance().digest(file_path) != entry.get("sha256"):
+            return False
+        with self._lock:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self._save()
+        return True
+
+    def record(self, result: IngestResult) -> None:
+        """Store a file's outcome and write the manifest."""
+        entry: Dict[str, Any] = {"status": result.status, "detail": result.detail, "recorded_at": time.time()}
+        try:
+            stat = os.stat(result.path)
+            entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            if result.status in (UPLOADED, REUSED):
+                entry["sha256"] = UploadRegistry.instance().digest(result.path)
+        except OSError:
+            pass
+        if result.datasource_id is not None:
+            entry["datasource_id"] = result.datasource_id
+        with self._lock:
+            self.entries[result.path] = entry
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text(json.dumps({"files": self.entries}, indent=2), encoding="utf-8")
+        temp.replace(self.path)
+
+
+class BulkIngester:
+    """
+    Creates one file datasource per file through a bounded worker pool.
+
+    Every file gets the template payload, with ``{file_name}`` and
+    ``{stem}`` in its description replaced per file. Outcomes go to the
+    IngestManifest as they happen, so an interrupted run loses nothing.
+    With ``preflight`` on, each file is profiled locally first and files
+    with errors are recorded as failed without being uploaded.
+    """
+
+    DEFAULT_WORKERS = 4
+    MAX_WORKERS = 16
+
+    def __init__(self, datasource_manager, template: Dict[str, Any], manifest: IngestManifest,
+                 workers: Optional[int] = None, reuse: bool = True, max_size: Optional[int] = None,
+                 preflight: bool = True, excel_to_csv: bool = False):
+        self.datasource_manager = datasource_manager
+        self.template = template
+        self.manifest = manifest
+        self.workers = max(1, min(workers or self.DEFAULT_WORKERS, self.MAX_WORKERS))
+        self.reuse = reuse
+        self.max_size = max_size
+        self.preflight = preflight
+        self.excel_to_csv = excel_to_csv
+
+    def payload_for(self, file_path: str) -> Dict[str, Any]:
+        file_name = os.path.basename(file_path)
+        payload = dict(self.template)
+        description = str(payload.get("description") or "{file_name}")
+        payload["description"] = description.replace("{file_name}", file_name).replace(
+            "{stem}", os.path.splitext(file_name)[0])
+        return payload
+
+    def run(self, files: List[str], on_result: Optional[Callable[[IngestResult], None]] = None) -> List[IngestResult]:
+        """
+        Ingest the files that are new, changed or failed last time.
+
+        Args:
+            files: Absolute paths, e.g. from collect_files
+            on_result: Called with each IngestResult as it is recorded
+
+        Returns:
+            One IngestResult per file, in the order of ``files``
+        """
+        results: Dict[str, IngestResult] = {}
+        pending = []
+        for path in files:
+            if self.manifest.is_done(path):
+                results[path] = IngestResult(path, SKIPPED, self.manifest.entries[path].get("datasource_id"),
+                                             "unchanged since last run")
+                if on_result:
+                    on_result(results[path])
+            else:
+                pending.append(path)
+
+        with ProgressHub.instance().task(f"Ingesting {len(pending)} files", total=len(pending)) as task, \
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest") as pool:
+            futures = {pool.submit(self._ingest, path): path for path in pending}
+            for future in as_completed(futures):
+                result = future.result()
+                self.manifest.record(result)
+                results[result.path] = result
+                task.advance()
+                if on_result:
+                    on_result(result)
+        return [results[path] for path in files]
+
+    def _ingest(self, file_path: str) -> IngestResult:
+        if self.excel_to_csv and os.path.splitext(file_path)[1].lower() in EXCEL_EXTENSIONS:
+            with tempfile.TemporaryDirectory(prefix="agentcore-ingest-") as tmp:
+                csv_name = os.path.splitext(os.path.basename(file_path))[0] + ".csv"
+                try:
+                    csv_path = convert_excel_to_csv(file_path, os.path.join(tmp, csv_name))
+                except Exception as e:
+                    return IngestResult(file_path, FAILED, detail=f"Excel conversion failed: {e}")
+                return self._upload(file_path, csv_path, csv_name)
+        return self._upload(file_path, file_path)
+
+    def _upload(self, file_path: str, upload_path: str, file_name: Optional[str] = None) -> IngestResult:
+        try:
+            if self.preflight:
+                profile = profile_file(upload_path, max_size=self.max_size)
+                if not profile.ok:
+                    return IngestResult(file_path, FAILED, detail=f"pre-flight: {profile.errors[0]}")
+            else:
+                size = os.path.getsize(upload_path)
+                if self.max_size and size > self.max_size:
+                    return IngestResult(file_path, FAILED, detail=f"file is {size:,} bytes; the limit is {self.max_size:,}")
+            response, note = self.datasource_manager.ingest_file(self.payload_for(file_path), upload_path,
+                                                                 file_name=file_name, reuse=self.reuse)
+            if not response:
+                return IngestResult(file_path, FAILED, detail="server returned no datasource")
+            datasource_id = response.get("data_source_id", response.get("id"))
+        except APIError as e:
+            return IngestResult(file_path, FAILED, detail=str(e.message).strip())
+        except Exception as e:
+            # One odd file or response must not lose the manifest for the rest;
+            # KeyboardInterrupt is not an Exception and still stops the run
+            return IngestResult(file_path, FAILED, detail=str(e).strip() or type(e).__name__)
+        return IngestResult(file_path, REUSED if note == "reused" else UPLOADED, datasource_id, note)
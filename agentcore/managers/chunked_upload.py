@@ -0,0 +1,388 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from agentcore.managers.client import APIClient, APIError
+from agentcore.managers.compression import ServerFeatures, gzip_bytes, gzip_rejected, is_compressible
+from agentcore.managers.progress_hub import ProgressHub
+from agentcore.utils.config import (UPLOADS_FILE, UPLOAD_CHUNK_ENDPOINT, UPLOAD_COMPLETE_ENDPOINT,
+                                    UPLOAD_SESSIONS_ENDPOINT)
+
+# Statuses worth retrying a chunk for; None is a transport error. 422 is a checksum mismatch
+RETRYABLE_STATUS = {None, 408, 422, 425, 429, 500, 502, 503, 504}
+
+# Statuses meaning the server has no chunked upload endpoint
+UNSUPPORTED_STATUS = {404, 405, 501}
+
+
+def _format_size(size: float) -> str:
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def _format_rate(bytes_per_second: float) -> str:
+    return f"{_format_size(bytes_per_second)}/s"
+
+
+class UploadJournal:
+    """
+    Local record of chunked uploads that have not finished yet.
+
+    An entry is keyed by the file's absolute path, size and modification
+    time plus what it is uploaded for, so running the same command on the
+    same unchanged file resumes its upload session. Entries are removed when
+    the upload completes and forgotten after ``MAX_AGE`` seconds.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_AGE = 7 * 24 * 3600
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or UPLOADS_FILE)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "UploadJournal":
+        """Return the process-wide journal, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def key(file_path: str, purpose: str) -> str:
+        stat = os.stat(file_path)
+        return f"{purpose}|{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        cutoff = time.time() - self.MAX_AGE
+        return {key: entry for key, entry in entries.items() if entry.get("created_at", 0) >= cutoff}
+
+    def _store(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_suffix(".tmp")
+            temp.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+            temp.replace(self.path)
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(key)
+
+    def save(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[key] = entry
+            self._store(entries)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._store(entries)
+
+
+class ChunkedUploader:
+    """
+    Uploads a file in chunks to a resumable upload session.
+
+    The protocol:
+
+    - ``POST uploads/`` with the file name, size and proposed chunk size
+      opens a session; the server answers with ``session_id`` and may
+      choose a different ``chunk_size``.
+    - ``PUT uploads/{id}/chunks/{n}/`` sends chunk n with Content-Range and
+      its SHA-256 in ``X-Chunk-SHA256``; a mismatch is answered with 422
+      and the chunk is sent again.
+    - ``GET uploads/{id}/`` lists the ``received`` chunk numbers, so an
+      interrupted upload only sends what is missing.
+    - ``POST uploads/{id}/complete/`` with the SHA-256 of the whole file
+      finishes the session, which the caller then references by id.
+
+    Sessions are recorded in the UploadJournal until they complete.
+
+    With a compression level set, chunks of text files are gzip-compressed
+    and sent with ``Content-Encoding: gzip``; Content-Range and checksums
+    still describe the uncompressed bytes. The first chunk to a server
+    finds out whether it accepts this, and ServerFeatures remembers it.
+
+    Chunks are sent by a bounded pool of workers so a high-latency link
+    carries several requests at once. The file is still read once, in
+    order, by the calling thread, and at most ``2 * workers`` chunks are in
+    memory at a time. A failed chunk is retried on its own; the rest of the
+    upload carries on.
+    """
+
+    MIN_CHUNK_SIZE = 1024 * 1024
+    MAX_CHUNK_SIZE = 64 * 1024 * 1024
+    # Large files get bigger chunks so they stay under this many requests
+    MAX_CHUNKS = 1000
+    # Chunks read ahead and not yet sent are held in memory up to about this many bytes
+    IN_FLIGHT_BYTES = 128 * 1024 * 1024
+    DEFAULT_WORKERS = 4
+    MAX_WORKERS = 16
+    MAX_RETRIES = 5
+    RETRY_BACKOFF = 0.5
+    MAX_RETRY_DELAY = 10
+
+    def __init__(self, api_client: APIClient, journal: Optional[UploadJournal] = None,
+                 chunk_size: Optional[int] = None, max_retries: Optional[int] = None,
+                 workers: Optional[int] = None, compression: int = 0):
+        self.api_client = api_client
+        self.compression = compression
+        self.journal = journal or UploadJournal.instance()
+        self.chunk_size = chunk_size
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self.workers = max(1, min(workers or self.DEFAULT_WORKERS, self.MAX_WORKERS))
+        self.resumed_chunks = 0
+        self.sent_chunks = 0
+        self.sent_bytes = 0
+        self.wire_bytes = 0
+        self.retries = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self._gzip = False
+
+    def part_size(self, size: int) -> int:
+        """
+        Choose a chunk size for a file.
+
+        Small files are split so every worker has a few chunks to send.
+        Chunks stay small enough that two per worker fit in
+        ``IN_FLIGHT_BYTES``, unless that would take more than ``MAX_CHUNKS``
+        requests. Sizes are whole MiB between ``MIN_CHUNK_SIZE`` and
+        ``MAX_CHUNK_SIZE``.
+        """
+        if self.chunk_size:
+            return self.chunk_size
+        target = min(size // (self.workers * 4), self.IN_FLIGHT_BYTES // (self.workers * 2))
+        target = max(target, math.ceil(size / self.MAX_CHUNKS))
+        target = math.ceil(target / self.MIN_CHUNK_SIZE) * self.MIN_CHUNK_SIZE
+        return max(self.MIN_CHUNK_SIZE, min(target, self.MAX_CHUNK_SIZE))
+
+    def throughput(self) -> float:
+        """Bytes per second sent by the last upload."""
+        return self.sent_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line description of the last upload, e.g. '64.0 MB in 2.1s (30.5 MB/s)'."""
+        text = f"{_format_size(self.sent_bytes)} in {self.elapsed:.1f}s ({_format_rate(self.throughput())})"
+        if self.resumed_chunks:
+            text += f", {self.resumed_chunks} chunks resumed"
+        if self.wire_bytes != self.sent_bytes:
+            text += f", {_format_size(self.wire_bytes)} on the wire (gzip)"
+        if self.retries:
+            text += f", {self.retries} retries"
+        return text
+
+    def upload(self, file_path: str, purpose: str, file_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Upload a file, resuming an earlier session for the same file if there is one.
+
+        Args:
+            file_path: File to upload
+            purpose: What the upload is for (e.g. 'datasource'); part of the resume key
+            file_name: Name sent to the server (defaults to the file's name)
+
+        Returns:
+            The completion response with its ``session_id``, or None if the
+            server does not support chunked uploads
+
+        Raises:
+            APIError: If a chunk could not be sent; the session is kept so
+                running the same command again resumes it
+        """
+        file_name = file_name or os.path.basename(file_path)
+        size = os.path.getsize(file_path)
+        key = self.journal.key(file_path, purpose)
+
+        session = self._resume(key)
+        received = set(session.pop("received", [])) if session else set()
+        if session is None:
+            session = self._open(file_name, size, purpose)
+            if session is None:
+                return None
+            self.journal.save(key, session)
+
+        session_id = session["session_id"]
+        chunk_size = int(session["chunk_size"])
+        count = max(1, math.ceil(size / chunk_size))
+        self.resumed_chunks = len(received)
+        self.sent_chunks = self.sent_bytes = self.wire_bytes = 0
+        features = ServerFeatures.instance()
+        gzip_support = features.supports(self.api_client.base_url, "gzip-chunks")
+        self._gzip = bool(self.compression) and is_compressible(file_name) and gzip_support is not False
+        # Until the server is known to accept gzip, the first chunk goes alone as a probe
+        probe = self._gzip and gzip_support is None
+        digest = hashlib.sha256()
+        description = f"Uploading {file_name}" + (f" (resuming, {len(received)}/{count} chunks done)" if received else "")
+        # Bounded by bytes, not chunks, so big chunks do not multiply memory use
+        queue_depth = max(1, min(self.workers * 2, self.IN_FLIGHT_BYTES // chunk_size))
+        started = time.monotonic()
+
+        with open(file_path, "rb") as f, \
+                ProgressHub.instance().task(description, total=count - len(received)) as task, \
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="upload") as pool:
+            in_flight: Set[Future] = set()
+            try:
+                for index in range(count):
+                    if len(in_flight) >= queue_depth:
+                        in_flight = self._collect(in_flight, task, description, started)
+                    chunk = f.read(chunk_size)
+                    # Chunks already on the server are read only to hash the whole file
+                    digest.update(chunk)
+                    if index in received:
+                        continue
+                    if probe:
+                        self._probe_gzip(session_id, index, chunk, index * chunk_size, size)
+                        task.advance()
+                        probe = False
+                        continue
+                    in_flight.add(pool.submit(self._send_chunk, session_id, index, chunk, index * chunk_size, size))
+                while in_flight:
+                    in_flight = self._collect(in_flight, task, description, started)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            finally:
+                self.elapsed = time.monotonic() - started
+
+        try:
+            response = self.api_client.post(
+                UPLOAD_COMPLETE_ENDPOINT.format(session_id=session_id),
+                data={"sha256": digest.hexdigest(), "size": size, "chunks": count},
+            )
+        except APIError as e:
+            if e.status_code in (400, 409, 410, 422):
+                # The server rejected the assembled file; start over next time
+                self.journal.remove(key)
+            raise
+        self.journal.remove(key)
+        return {**(response or {}), "session_id": session_id}
+
+    def _open(self, file_name: str, size: int, purpose: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.api_client.post(UPLOAD_SESSIONS_ENDPOINT, data={
+                "file_name": file_name, "size": size, "chunk_size": self.part_size(size), "purpose": purpose,
+            })
+        except APIError as e:
+            if e.status_code in UNSUPPORTED_STATUS:
+                return None
+            raise
+        return {
+            "session_id": response["session_id"],
+            "chunk_size": response.get("chunk_size") or self.part_size(size),
+            "file_name": file_name,
+            "created_at": time.time(),
+        }
+
+    def _collect(self, in_flight: Set[Future], task, description: str, started: float) -> Set[Future]:
+        """Wait for at least one chunk to finish, re-raising its error; return the chunks still running."""
+        done, pending = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            future.result()
+            task.advance()
+        elapsed = time.monotonic() - started
+        if elapsed > 0:
+            task.update(description=f"{description} [dim]{_format_rate(self.sent_bytes / elapsed)}[/dim]")
+        return pending
+
+    def _resume(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the journal entry for this file with the chunks the server already has."""
+        session = self.journal.get(key)
+        if session is None:
+            return None
+        try:
+            status = self.api_client.get(f"{UPLOAD_SESSIONS_ENDPOINT}{session['session_id']}/")
+        except APIError as e:
+            if e.status_code in (404, 410):
+                # Expired or already completed on the server
+                self.journal.remove(key)
+                return None
+            raise
+        return {**session, "received": [int(index) for index in (status or {}).get("received") or []]}
+
+    def _probe_gzip(self, session_id: str, index: int, chunk: bytes, offset: int, size: int) -> None:
+        """Send one compressed chunk and record whether the server accepted it."""
+        features = ServerFeatures.instance()
+        try:
+            self._send_chunk(session_id, index, chunk, offset, size)
+        except APIError as e:
+            if not gzip_rejected(e):
+                raise
+            features.remember(self.api_client.base_url, "gzip-chunks", False)
+            self._gzip = False
+            self._send_chunk(session_id, index, chunk, offset, size)
+            return
+        features.remember(self.api_client.base_url, "gzip-chunks", True)
+
+    def _send_chunk(self, session_id: str, index: int, chunk: bytes, offset: int, size: int) -> None:
+        headers = {
+            "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{size}" if chunk else f"bytes */{size}",
+            "X-Chunk-SHA256": hashlib.sha256(chunk).hexdigest(),
+        }
+        body = chunk
+        if self._gzip:
+            body = gzip_bytes(chunk, self.compression)
+            headers["Content-Encoding"] = "gzip"
+        endpoint = UPLOAD_CHUNK_ENDPOINT.format(session_id=session_id, index=index)
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.api_client.put_bytes(endpoint, body, headers=headers)
+                with self._lock:
+                    self.sent_chunks += 1
+                    self.sent_bytes += len(chunk)
+                    self.wire_bytes += len(body)
+                return
+            except APIError as e:
+                if e.status_code not in RETRYABLE_STATUS or attempt == self.max_retries:
+                    raise APIError(
+                        f"Upload interrupted at chunk {index + 1}: {e.message}. "
+                        f"Run the same command again to resume.",
+                        status_code=e.status_code,
+                    )
+            with self._lock:
+                self.retries += 1
+            delay = min(self.RETRY_BACKOFF * 2 ** attempt, self.MAX_RETRY_DELAY)
+            time.sleep(delay * random.uniform(0.8, 1.2))
@@ -20,15 +20,20 @@
 # Original License Date: 2025-07-24
 # ###################################################################################
 
+import ssl
+import threading
+import weakref
 import requests
+from requests.auth import AuthBase
 from requests.exceptions import RequestException, HTTPError, Timeout, ConnectionError
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Iterable, Tuple, Union
 import logging
 from datetime import datetime
 import time
 from agentcore.managers.config import ConfigManager
+from agentcore.managers.multipart import MultipartEncoder
 from agentcore.utils.config import TOKEN_ENDPOINT
 from enum import Enum
 
@@ -51,6 +56,80 @@ class APIError(Exception):
         super().__init__(self.message)
 
 
+class BearerAuth(AuthBase):
+    """
+    Attaches the current bearer token to each outgoing request.
+
+    The token is held as a single immutable string that is replaced atomically,
+    so concurrent requests always see either the old or the new token and the
+    shared session headers are never mutated.
+    """
+
+    def __init__(self, token: Optional[str] = None):
+        self._token = token
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    def swap(self, token: Optional[str]) -> bool:
+        """Replace the token; returns False when it was already current."""
+        with self._lock:
+            if token == self._token:
+                return False
+            self._token = token
+            return True
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        token = self._token
+        if token and "Authorization" not in request.headers:
+            request.headers["Authorization"] = f"Bearer {token}"
+        return request
+
+
+class TLSSessionContext(ssl.SSLContext):
+    """
+    SSL context that resumes TLS sessions across pooled connections.
+
+    The session of the most recent connection to a host is offered when the
+    next connection to that host is opened, so additional pooled connections
+    (e.g. for parallel requests) skip the full handshake when the server
+    supports resumption.
+    """
+
+    def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+        sessions = self.__dict__.setdefault("_tls_sessions", {})
+        cached = sessions.get(server_hostname)
+        if session is None and cached is not None:
+            previous, session = cached
+            # TLS 1.3 tickets arrive after the handshake, so prefer the
+            # previous socket's current session when it is still open
+            live = previous()
+            if live is not None and live.session is not None:
+                session = live.session
+        tls_sock = super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session, **kwargs)
+        sessions[server_hostname] = (weakref.ref(tls_sock), tls_sock.session or session)
+        return tls_sock
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools share one session-resuming TLS context."""
+
+    def __init__(self, *args, verify_ssl: bool = True, **kwargs):
+        # CA certificates are loaded per connection from requests' verify setting
+        context = TLSSessionContext(ssl.PROTOCOL_TLS_CLIENT)
+        if not verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        self.ssl_context = context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
 class TokenManager:
     """Handles token management, including refresh logic."""
 
@@ -58,9 +137,25 @@ class TokenManager:
         self.config = config
         self.client = client
         self.logger = logging.getLogger(__name__)  # Initialize logger
-
-    def refresh_token(self) -> bool:
-        """Refresh access token, or re-login if refresh token expired."""
+        # Serializes refreshes so concurrent 401s don't each spend the refresh token
+        self._refresh_lock = threading.RLock()
+
+    def refresh_token(self, rejected_token: Optional[str] = None) -> bool:
+        """
+        Refresh access token, or re-login if refresh token expired.
+
+        Args:
+            rejected_token: Token the server just rejected. If the client
+                already holds a different one, another thread refreshed
+                while this request was in flight and no refresh is needed.
+        """
+        with self._refresh_lock:
+            current = self.client.auth.token
+            if rejected_token is not None and current and current != rejected_token:
+                return True
+            return self._refresh_token()
+
+    def _refresh_token(self) -> bool:
         refresh_token = self.config.refresh_token()
 
         # Attempt to refresh the access token
@@ -85,8 +180,14 @@ class TokenManager:
 class APIClient:
     """
     Enhanced API Client with token authentication, retry logic, comprehensive error handling, and logging.
+
+    A single instance is safe to share between threads: the session is only
+    configured at construction time and pooled connections are reused.
     """
 
+    # Pooled connections kept per host; sized for parallel manager calls
+    POOL_MAXSIZE = 32
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -102,6 +203,7 @@ class APIClient:
         self.config = config or ConfigManager()
         self.base_url = base_url or self.config.url()
         self.timeout = timeout
+        self.auth = BearerAuth()
         self.session = self._create_session(max_retries, verify_ssl)
         self.logger = logger or self._setup_logger()
         self.token_manager = TokenManager(self.config, self)
@@ -124,14 +226,22 @@ class APIClient:
             backoff_factor=0.5,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = PooledHTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=self.POOL_MAXSIZE,
+            verify_ssl=verify_ssl,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
+        # Session headers are fixed here and never mutated afterwards; the
+        # token is attached per request by BearerAuth and uploads override
+        # Content-Type through request-level headers.
         session.headers.update({
             "Content-Type": "application/json",
             "User-Agent": "AgentCore-Client/1.0",
         })
+        session.auth = self.auth
 
         return session
 
@@ -148,9 +258,26 @@ class APIClient:
 
         return logger
 
+    def prewarm(self) -> bool:
+        """
+        Open a pooled connection to the API host ahead of the first request.
+
+        Sends a HEAD request to the base URL, so DNS, TCP and TLS handshakes
+        happen here and the session's pool keeps the connection for the
+        next request to reuse. The response status does not matter.
+
+        Returns:
+            True if a connection was opened, False otherwise.
+        """
+        try:
+            self.session.head(self.base_url, timeout=10, allow_redirects=False).close()
+            return True
+        except requests.RequestException:
+            return False
+
     def set_token(self, token: str) -> None:
-        """Set the authentication token in the session headers."""
-        self.session.headers["Authorization"] = f"Bearer {token}"
+        """Set the authentication token used for subsequent requests."""
+        self.auth.swap(token)
         # self.logger.debug("Authentication token set successfully")
 
     def _handle_response(self, response: requests.Response, start_time: float) -> Dict[str, Any]:
@@ -179,7 +306,9 @@ class APIClient:
                 elif error_detail in ["Given token not valid for any token type", "Authentication credentials were not provided."]:
                     # self.logger.warning("Access token expired. Attempting to refresh...")
 
-                    if self.token_manager.refresh_token():
+                    authorization = response.request.headers.get("Authorization", "")
+                    rejected = authorization[len("Bearer "):] if authorization.startswith("Bearer ") else None
+                    if self.token_manager.refresh_token(rejected):
                         # self.logger.info("Token refreshed successfully. Retrying request...")
                         raise APIError(message="Given token not valid for any token type", status_code=401) # Retry the failed request automatically
 
@@ -195,16 +324,17 @@ class APIClient:
 
 
 
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, files: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
-        """Generic request handler."""
+    def _send(self, method: str, endpoint: str, data: Optional[Dict] = None, files: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """Send a request and return the raw response; transport errors become APIError."""
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        start_time = time.time()
 
-        # Handle file uploads by temporarily removing Content-Type header
-        content_type_removed = False
+        # File uploads are streamed from disk by a MultipartEncoder instead of
+        # being built in memory by requests; its Content-Type carries the boundary
+        progress = kwargs.pop('progress', None)
         if files:
-            content_type = self.session.headers.pop("Content-Type", None)
-            content_type_removed = True
+            data = MultipartEncoder(data, files, callback=progress)
+            files = None
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), "Content-Type": data.content_type}
         
         try:
             # Build request parameters
@@ -221,26 +351,71 @@ class APIClient:
             if files is not None:
                 request_params['files'] = files
                 
-            response = self.session.request(**request_params)
-            
-            return self._handle_response(response, start_time)
+            return self.session.request(**request_params)
         except Timeout:
             raise APIError(message="Request timed out")
         except ConnectionError as e:
             raise APIError(message="Connection error")
         except RequestException as e:
             raise APIError(message="Request failed")
-        finally:
-            # Restore the Content-Type header if we removed it
-            if content_type_removed and content_type:
-                self.session.headers["Content-Type"] = content_type
+
+    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None, files: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
+        """Generic request handler."""
+        start_time = time.time()
+        response = self._send(method, endpoint, data=data, files=files, **kwargs)
+        return self._handle_response(response, start_time)
+
+    def get_conditional(self, endpoint: str, etag: Optional[str] = None, params: Optional[Dict] = None,
+                        **kwargs) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Perform a GET that revalidates a previous response.
+
+        The ETag of the previous response is sent as If-None-Match, so a
+        server that supports it answers 304 with an empty body when nothing
+        changed.
+
+        Returns:
+            (data, etag): data is None when the server answered 304 Not Modified
+        """
+        headers = dict(kwargs.pop('headers', None) or {})
+        if etag:
+            headers['If-None-Match'] = etag
+        start_time = time.time()
+        response = self._send(HTTPMethod.GET.value, endpoint, params=params, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None, etag
+        return self._handle_response(response, start_time), response.headers.get('ETag')
+
+    def get_response(self, endpoint: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                     stream: bool = False, timeout: Optional[Any] = None) -> requests.Response:
+        """
+        Perform a GET and return the raw response, for callers that need its
+        headers or read its body as a stream.
+
+        Error statuses raise APIError as in get(); 304 Not Modified is returned.
+        """
+        start_time = time.time()
+        kwargs = {'timeout': timeout} if timeout is not None else {}
+        response = self._send(HTTPMethod.GET.value, endpoint, params=params, headers=headers or {},
+                              stream=stream, **kwargs)
+        if response.status_code >= 400:
+            try:
+                self._handle_response(response, start_time)
+            finally:
+                response.close()
+        return response
 
     def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
         """Perform GET request."""
         return self._request(HTTPMethod.GET.value, endpoint, params=params, **kwargs)
 
     def post(self, endpoint: str, data: Optional[Dict] = None, files: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
-        """Perform POST request with support for form-data uploads."""
+        """
+        Perform POST request with support for form-data uploads.
+
+        With ``files`` the body is streamed; pass ``progress=callback`` to be
+        called with (bytes sent, total bytes) while it is sent.
+        """
         if files:
             # For file uploads, don't use json parameter, use data for form fields
             return self._request(HTTPMethod.POST.value, endpoint, data=data, files=files, **kwargs)
@@ -250,6 +425,15 @@ class APIClient:
         """Perform PUT request."""
         return self._request(HTTPMethod.PUT.value, endpoint, json=data, **kwargs)
 
+    def put_bytes(self, endpoint: str, body: bytes, headers: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
+        """Perform PUT request with a raw binary body (e.g. one chunk of an upload)."""
+        headers = {"Content-Type": "application/octet-stream", **(headers or {})}
+        return self._request(HTTPMethod.PUT.value, endpoint, data=body, headers=headers, **kwargs)
+
+    def post_body(self, endpoint: str, body: Iterable[bytes], headers: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
+        """Perform POST request streaming a prepared body (e.g. a MultipartEncoder), with its own Content-Type."""
+        return self._request(HTTPMethod.POST.value, endpoint, data=body, headers=headers, **kwargs)
+
     def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Perform DELETE request."""
         return self._request(HTTPMethod.DELETE.value, endpoint, **kwargs)
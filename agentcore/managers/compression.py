@@ -0,0 +1,194 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from agentcore.managers.client import APIClient, APIError
+from agentcore.managers.multipart import MultipartEncoder
+from agentcore.utils.config import SERVER_FEATURES_FILE
+
+# Text formats worth compressing; .xlsx and friends are already zip archives
+COMPRESSIBLE_EXTENSIONS = {".csv", ".tsv", ".json", ".jsonl", ".txt"}
+
+# Words in a 400 response that show the server could not read the gzip body itself
+_ENCODING_WORDS = ("encoding", "gzip", "compress")
+
+
+def gzip_rejected(error: APIError) -> bool:
+    """
+    Whether an error means the server does not accept gzip-encoded bodies.
+
+    Only 415 Unsupported Media Type, or a 400 whose message is about the
+    content encoding, counts; any other 4xx is about the request itself and
+    would fail the same way uncompressed.
+    """
+    if error.status_code == 415:
+        return True
+    message = str(error.message).lower()
+    return error.status_code == 400 and any(word in message for word in _ENCODING_WORDS)
+
+
+def is_compressible(file_name: str) -> bool:
+    return os.path.splitext(file_name)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def gzip_bytes(data: bytes, level: int) -> bytes:
+    """Compress one block in gzip format (zlib releases the GIL, so workers compress in parallel)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class GzipBody:
+    """
+    Gzip-compresses a streamed request body on the fly.
+
+    Wraps any iterable of bytes (e.g. a MultipartEncoder) and yields the
+    compressed stream. The compressed length is not known in advance, so
+    the request is sent with chunked transfer encoding. ``raw_bytes`` and
+    ``wire_bytes`` count what went in and what was sent.
+    """
+
+    def __init__(self, body: Iterable[bytes], level: int):
+        self.body = body
+        self.level = level
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.raw_bytes = self.wire_bytes = 0
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in self.body:
+            self.raw_bytes += len(chunk)
+            compressed = compressor.compress(chunk)
+            if compressed:
+                self.wire_bytes += len(compressed)
+                yield compressed
+        tail = compressor.flush()
+        self.wire_bytes += len(tail)
+        yield tail
+
+
+class ServerFeatures:
+    """
+    Remembers what each server turned out to support, e.g. gzip request bodies.
+
+    Support is found out by trying: the first compressed upload to a server
+    either succeeds or is rejected and sent again uncompressed. The result
+    is cached in ~/.agentcore/server_features.json for ``MAX_AGE`` seconds
+    so later uploads go straight to the right format.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_AGE = 7 * 24 * 3600
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or SERVER_FEATURES_FILE)
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Dict[str, Dict]]] = None
+
+    @classmethod
+    def instance(cls) -> "ServerFeatures":
+        """Return the process-wide cache, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def supports(self, server: str, feature: str) -> Optional[bool]:
+        """Return True or False if known, None if the server has not been tried yet."""
+        with self._lock:
+            entry = self._load().get(server.rstrip("/"), {}).get(feature)
+        if not entry or time.time() - entry.get("checked_at", 0) > self.MAX_AGE:
+            return None
+        return entry["supported"]
+
+    def remember(self, server: str, feature: str, supported: bool) -> None:
+        with self._lock:
+            data = self._load()
+            data.setdefault(server.rstrip("/"), {})[feature] = {"supported": supported, "checked_at": time.time()}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp = self.path.with_suffix(".tmp")
+                temp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                temp.replace(self.path)
+            except OSError:
+                pass
+
+
+def post_multipart(api_client: APIClient, endpoint: str, data: Optional[Dict[str, Any]],
+                   files: Dict[str, Any], level: int = 0) -> Tuple[Dict[str, Any], int, int]:
+    """
+    POST a streamed multipart upload, gzip-compressed when the server accepts it.
+
+    With a level above 0 the body is sent with ``Content-Encoding: gzip``,
+    unless the server is known to reject that. A server that has not been
+    tried yet and rejects it gets the upload again uncompressed, and the
+    answer is remembered in ServerFeatures.
+
+    Args:
+        api_client: Client to send the request with
+        endpoint: Endpoint to POST to
+        data: Form fields
+        files: Files, as for requests
+        level: Gzip level, 0 for no compression
+
+    Returns:
+        The response, the size of the multipart body and the bytes sent
+    """
+    encoder = MultipartEncoder(data, files)
+    features = ServerFeatures.instance()
+    server = api_client.base_url
+    support = features.supports(server, "gzip-multipart")
+    if level and support is not False:
+        body = GzipBody(encoder, level)
+        try:
+            response = api_client.post_body(
+                endpoint, body, headers={"Content-Type": encoder.content_type, "Content-Encoding": "gzip"}
+            )
+        except APIError as e:
+            if support is not None or not gzip_rejected(e):
+                raise
+            features.remember(server, "gzip-multipart", False)
+        else:
+            if support is None:
+                features.remember(server, "gzip-multipart", True)
+            return response, encoder.length, body.wire_bytes
+    response = api_client.post_body(endpoint, encoder, headers={"Content-Type": encoder.content_type})
+    return response, encoder.length, encoder.length
@@ -21,12 +21,13 @@
 # ###################################################################################
 
 import json
+import os
 from pathlib import Path
 from typing import Optional, Any,Dict
 import requests
 from agentcore.utils.config import VALIDATE_URL
 
-from agentcore.utils.config import CONFIG_FILE, CONFIG_DIR
+from agentcore.utils.config import CONFIG_FILE, CONFIG_DIR, DEFAULT_MAX_UPLOAD_MB, DEFAULT_UPLOAD_COMPRESSION
 class ConfigManager:
     """
     Manages general configuration settings for the application.
@@ -92,6 +93,40 @@ class ConfigManager:
     def url(self) -> str:
         return self.get("url", "")
 
+    def prewarm_enabled(self) -> bool:
+        """Whether to open the API connection in the background at startup."""
+        env = os.environ.get("AGENTCORE_PREWARM")
+        if env is not None:
+            return env.strip().lower() in ("1", "true", "yes", "on")
+        return bool(self.get("prewarm_connections", False))
+
+    def set_prewarm(self, enabled: bool) -> None:
+        self.set("prewarm_connections", enabled)
+
+    def max_upload_size(self) -> int:
+        """Largest file, in bytes, that uploads accept (AGENTCORE_MAX_UPLOAD_MB overrides)."""
+        env = os.environ.get("AGENTCORE_MAX_UPLOAD_MB")
+        try:
+            megabytes = float(env) if env is not None else float(self.get("max_upload_mb", DEFAULT_MAX_UPLOAD_MB))
+        except (TypeError, ValueError):
+            megabytes = DEFAULT_MAX_UPLOAD_MB
+        return int(megabytes * 1024 * 1024)
+
+    def set_max_upload_size(self, megabytes: float) -> None:
+        self.set("max_upload_mb", megabytes)
+
+    def upload_compression(self) -> int:
+        """Gzip level (0-9) for text file uploads; 0 sends files uncompressed (AGENTCORE_UPLOAD_COMPRESSION overrides)."""
+        env = os.environ.get("AGENTCORE_UPLOAD_COMPRESSION")
+        try:
+            level = int(env) if env is not None else int(self.get("upload_compression", DEFAULT_UPLOAD_COMPRESSION))
+        except (TypeError, ValueError):
+            level = DEFAULT_UPLOAD_COMPRESSION
+        return max(0, min(level, 9))
+
+    def set_upload_compression(self, level: int) -> None:
+        self.set("upload_compression", level)
+
     def token(self) -> Optional[str]:
         """Get the access token or None if not set or invalid."""
         token = self.get("access_token")
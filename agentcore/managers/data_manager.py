@@ -24,9 +24,13 @@ from typing import Optional
 from agentcore.utils.config import DATA_ENDPOINT
 from rich.console import Console
 from agentcore.managers.base import BaseManager
+from agentcore.managers.chunked_upload import ChunkedUploader
+from agentcore.managers.compression import is_compressible, post_multipart
+from agentcore.managers.upload_registry import UploadRegistry
 from agentcore.managers.table_manager import TableDisplay
 import json
 import mimetypes
+import os
 from datetime import datetime
 from rich.prompt import Prompt
 from rich.console import Console
@@ -38,8 +42,8 @@ class DataManager(BaseManager):
         self.columns = []
 
     @BaseManager.handle_api_error
-    def upload_data_files(self, name, file_path):
-        """Upload file to server."""
+    def upload_data_files(self, name, file_path, reuse=True):
+        """Upload file to server, reusing an earlier upload of the same contents unless reuse is False."""
 
         endpoint = DATA_ENDPOINT + "files/save-file/"
 
@@ -47,14 +51,40 @@ class DataManager(BaseManager):
         if mime_type is None:
             mime_type = "application/octet-stream"  # Default to binary if unknown
 
-        with open(file_path, "rb") as file:
-            files = {"file": (file.name, file, mime_type)}  # Ensure correct format
-            data_payload = {"name": name}  
-
+        registry = UploadRegistry.instance()
+        if reuse:
+            digest, existing = registry.find(
+                self.api_client, file_path, "data-file",
+                resource_endpoint=lambda record: DATA_ENDPOINT + f"files/{record['file_id']}/" if record.get("file_id") else None,
+                name=name,
+            )
+            if existing:
+                self.console.print(f"[green]✅ {file_path} was already uploaded as '{name}'; reusing file {existing.get('file_id', '')}[/green]")
+                return existing
+        else:
+            digest = registry.digest(file_path)
+
+        level = self.config_manager.upload_compression() if is_compressible(file_path) else 0
+        uploader = ChunkedUploader(self.api_client, compression=level)
+        session = uploader.upload(file_path, purpose="data-file")
+        if session:
+            self.console.print(f"[dim]Sent {uploader.summary()}[/dim]")
+            data_payload = {"name": name, "upload_session_id": session["session_id"]}
             response = self._execute_with_progress(
-                "Uploading file...",
-                lambda: self.api_client.post(endpoint, data=data_payload, files=files)
+                "Saving file...",
+                lambda: self.api_client.post(endpoint, data=data_payload)
             )
+        else:
+            with open(file_path, "rb") as file:
+                files = {"file": (file.name, file, mime_type)}  # Ensure correct format
+                data_payload = {"name": name}  
+
+                response, size, sent = self._execute_with_progress(
+                    "Uploading file...",
+                    lambda: post_multipart(self.api_client, endpoint, data_payload, files, level)
+                )
+            if sent != size:
+                self.console.print(f"[dim]Sent {sent / 1024 / 1024:.1f} MB on the wire for {size / 1024 / 1024:.1f} MB (gzip)[/dim]")
 
         file_id = response.get("id")
         if not file_id:
@@ -67,6 +97,9 @@ class DataManager(BaseManager):
             lambda: self.api_client.post(upload_endpoint)
         )
 
+        # file_id goes last so a field of the same name in the response cannot replace it
+        registry.record(self.api_client, digest, "data-file", {**(upload_response or {}), "file_id": file_id},
+                        os.path.basename(file_path), name=name)
         return upload_response
     
     @BaseManager.handle_api_error
@@ -0,0 +1,667 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import codecs
+import csv
+import io
+import json
+import os
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DELIMITED_EXTENSIONS = {".csv", ".tsv", ".txt"}
+JSON_EXTENSIONS = {".json", ".jsonl"}
+EXCEL_EXTENSIONS = {".xlsx", ".xls"}
+
+# Files up to this size are read completely; larger ones are sampled
+SAMPLE_BYTES = 16 * 1024 * 1024
+SAMPLE_WINDOWS = 8
+BLOCK_BYTES = 16 * 1024 * 1024
+# Share of sampled rows with the wrong number of fields that fails the file
+MALFORMED_ERROR_RATIO = 0.01
+MAX_EXAMPLES = 3
+
+ERROR = "error"
+WARNING = "warning"
+
+
+@dataclass
+class FileProfile:
+    """What the pre-flight check found out about a data file."""
+
+    path: str
+    format: str
+    size: int
+    encoding: Optional[str] = None
+    delimiter: Optional[str] = None
+    columns: List[str] = field(default_factory=list)
+    rows: int = 0
+    # False when rows is estimated from line breaks rather than parsed
+    rows_exact: bool = True
+    sampled_rows: int = 0
+    windows: int = 0
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    null_ratio: Dict[str, float] = field(default_factory=dict)
+    issues: List[Tuple[str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file has no problems that would make the upload fail."""
+        return not self.errors
+
+    @property
+    def errors(self) -> List[str]:
+        return [message for level, message in self.issues if level == ERROR]
+
+    @property
+    def warnings(self) -> List[str]:
+        return [message for level, message in self.issues if level == WARNING]
+
+    def error(self, message: str) -> None:
+        self.issues.append((ERROR, message))
+
+    def warn(self, message: str) -> None:
+        self.issues.append((WARNING, message))
+
+
+def profile_file(path: str, max_size: Optional[int] = None, full: bool = False) -> FileProfile:
+    """
+    Check a data file locally before it is uploaded.
+
+    CSV/TSV/TXT and JSON files up to ``SAMPLE_BYTES`` are parsed completely.
+    Larger ones are parsed in ``SAMPLE_WINDOWS`` windows spread over the
+    file and their row count is estimated from the bytes per row in the
+    sample, so multi-GB files take a second or two; ``full=True`` parses
+    everything in chunks instead. Excel
+    files are read whole (they are limited to about a million rows) and
+    need openpyxl.
+
+    Args:
+        path: File to check
+        max_size: Upload size limit in bytes, if any
+        full: Parse the whole file even if it is large
+
+    Returns:
+        FileProfile; ``profile.ok`` is False if the upload would fail
+    """
+    started = time.monotonic()
+    extension = os.path.splitext(path)[1].lower()
+    size = os.path.getsize(path)
+    profile = FileProfile(path=path, format=extension.lstrip(".") or "unknown", size=size)
+
+    if max_size and size > max_size:
+        profile.error(f"file is {_format_size(size)}; the upload limit is {_format_size(max_size)}")
+    try:
+        if size == 0:
+            profile.error("file is empty")
+        elif extension in EXCEL_EXTENSIONS:
+            _profile_excel(profile)
+        elif extension == ".jsonl" or (extension == ".json" and _first_char(path) not in ("[", "{")):
+            _profile_json_lines(profile, full)
+        elif extension == ".json":
+            _profile_json_document(profile)
+        else:
+            if extension not in DELIMITED_EXTENSIONS:
+                profile.warn(f"{extension or 'no extension'} is not a supported type; checked it as delimited text")
+            _profile_delimited(profile, full)
+    except OSError:
+        raise
+    except Exception as e:
+        # A parser failure means the file is broken, not that the check is
+        profile.error(f"could not parse file: {str(e).strip() or type(e).__name__}")
+
+    profile.elapsed = time.monotonic() - started
+    return profile
+
+
+def convert_excel_to_csv(path: str, output_path: Optional[str] = None) -> str:
+    """
+    Write the first sheet of an Excel file as UTF-8 CSV.
+
+    Args:
+        path: .xlsx or .xls file
+        output_path: Where to write (default: next to the file, with a .csv extension)
+
+    Returns:
+        Path of the CSV file
+
+    Raises:
+        ImportError: If openpyxl (or xlrd for .xls) is not installed
+    """
+    import pandas as pd
+
+    output_path = output_path or os.path.splitext(path)[0] + ".csv"
+    pd.read_excel(path, sheet_name=0).to_csv(output_path, index=False)
+    return output_path
+
+
+# ---------------------------------------------------------------------------
+# Delimited text
+# ---------------------------------------------------------------------------
+
+def _profile_delimited(profile: FileProfile, full: bool) -> None:
+    with open(profile.path, "rb") as f:
+        head = f.read(64 * 1024)
+    profile.encoding = _detect_encoding(head, profile)
+    if profile.encoding is None:
+        return
+    text = _decode_lines(head, profile.encoding)
+    extension = os.path.splitext(profile.path)[1].lower()
+    profile.delimiter = _detect_delimiter(text, "\t" if extension == ".tsv" else ",")
+
+    header = next(csv.reader(io.StringIO(text), delimiter=profile.delimiter), [])
+    if not any(name.strip() for name in header):
+        profile.error("first line is empty; expected a header row")
+        return
+    profile.columns = [name.strip() for name in header]
+    _check_header(profile)
+
+    sampled = not full and profile.size > SAMPLE_BYTES
+    stats = _ColumnStats(profile.columns)
+    malformed = 0
+    sampled_bytes = 0
+    examples: List[str] = []
+    carry = ""
+    try:
+        for offset, block, final in _windows(profile.path, sampled, profile.encoding):
+            profile.windows += 1
+            if sampled and offset:
+                # A window starts at an arbitrary line, maybe inside a quoted field
+                block = block[_resync(block, profile.delimiter, len(profile.columns)):]
+            block = carry + block
+            try:
+                rows, bad, bad_examples, consumed = _parse_block(
+                    block, profile, stats, skip_header=offset == 0, final=final)
+            except (csv.Error, ValueError) as e:
+                if not sampled:
+                    raise
+                profile.warn(f"could not parse the sample at byte ~{offset:,} ({str(e).strip()})")
+                continue
+            # Whole files carry an unfinished record over to the next block
+            carry = "" if sampled else block[consumed:]
+            sampled_bytes += len(block[:consumed].encode(profile.encoding, errors="replace"))
+            profile.sampled_rows += rows
+            malformed += bad
+            examples.extend(f"{example} (byte ~{offset:,})" if offset else example for example in bad_examples)
+    except UnicodeDecodeError as e:
+        profile.error(f"not valid {profile.encoding} text ({e.reason})")
+        return
+
+    if sampled:
+        profile.rows = _estimate_rows(profile, sampled_bytes, profile.sampled_rows + malformed)
+    else:
+        profile.rows = profile.sampled_rows
+    if profile.rows == 0:
+        profile.error("file has a header but no data rows")
+        return
+
+    if malformed:
+        ratio = malformed / max(profile.sampled_rows + malformed, 1)
+        message = (f"{malformed:,} rows{' in the sample' if sampled else ''} do not have "
+                   f"{len(profile.columns)} fields, e.g. {'; '.join(examples[:MAX_EXAMPLES])}")
+        if ratio > MALFORMED_ERROR_RATIO:
+            profile.error(message)
+        else:
+            profile.warn(message)
+    stats.finish(profile)
+
+
+def _parse_block(block: str, profile: FileProfile, stats: "_ColumnStats", skip_header: bool,
+                 final: bool = True) -> Tuple[int, int, List[str], int]:
+    """
+    Count rows with the wrong field count, then feed the well-formed rows to pandas.
+
+    Unless ``final``, the last record may be cut off (e.g. in the middle of a
+    quoted field), so it is left unparsed. Returns the number of good and bad
+    rows, examples of bad ones and how many characters of the block were parsed.
+    """
+    import pandas as pd
+
+    width = len(profile.columns)
+    bad = 0
+    examples: List[str] = []
+    position = 0
+
+    def lines():
+        nonlocal position
+        for line in io.StringIO(block, newline=""):
+            position += len(line)
+            yield line
+
+    reader = csv.reader(lines(), delimiter=profile.delimiter)
+    if skip_header:
+        next(reader, None)
+    consumed = position
+    rows = 0
+
+    def check(record, line_num):
+        nonlocal rows, bad
+        if not record:
+            return
+        if len(record) != width:
+            bad += 1
+            if len(examples) < MAX_EXAMPLES:
+                where = f"line {line_num}" if skip_header else "a row"
+                examples.append(f"{where} has {len(record)}")
+            return
+        rows += 1
+
+    # Each record is checked once the next one has been read, so the last
+    # one can be held back when it may be incomplete
+    previous = None
+    for record in reader:
+        if previous is not None:
+            check(*previous)
+        consumed_before, previous = consumed, (record, reader.line_num)
+        consumed = position
+    if previous is not None:
+        if final:
+            check(*previous)
+        else:
+            consumed = consumed_before
+    if rows:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            frame = pd.read_csv(
+                io.StringIO(block[:consumed]), sep=profile.delimiter, header=None, names=profile.columns,
+                skiprows=1 if skip_header else 0, on_bad_lines="skip", low_memory=False,
+                skip_blank_lines=True, index_col=False,
+            )
+        stats.add(frame)
+    return rows, bad, examples, consumed
+
+
+def _resync(block: str, delimiter: str, width: int, candidates: int = 20, check: int = 20) -> int:
+    """
+    Find where the first whole record of a window starts.
+
+    Windows begin after a line break, which may be inside a quoted field.
+    Tries the first ``candidates`` line starts and picks the first one from
+    which ``check`` records parse with the header's field count.
+    """
+    start = 0
+    for _ in range(candidates):
+        try:
+            reader = csv.reader(io.StringIO(block[start:], newline=""), delimiter=delimiter, strict=True)
+            parsed = [record for _, record in zip(range(check), reader)]
+        except csv.Error:
+            parsed = []
+        if parsed and all(len(record) == width for record in parsed[:-1]):
+            return start
+        cut = block.find("\n", start)
+        if cut < 0:
+            break
+        start = cut + 1
+    return 0
+
+
+def _windows(path: str, sampled: bool, encoding: str) -> Iterator[Tuple[int, str, bool]]:
+    """
+    Yield (byte offset, text, final) blocks made of whole lines: the whole
+    file, or evenly spread samples. ``final`` is True for a block that ends
+    at the end of the file.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        if not sampled:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            offset = 0
+            carry = ""
+            while True:
+                data = f.read(BLOCK_BYTES)
+                text = carry + decoder.decode(data, final=not data)
+                if not data:
+                    yield offset, text, True
+                    return
+                cut = text.rfind("\n") + 1
+                if cut:
+                    yield offset, text[:cut], False
+                    offset += len(data)
+                    carry = text[cut:]
+                else:
+                    carry = text
+        window = SAMPLE_BYTES // SAMPLE_WINDOWS
+        step = (size - window) // (SAMPLE_WINDOWS - 1)
+        for index in range(SAMPLE_WINDOWS):
+            offset = index * step
+            f.seek(offset)
+            data = f.read(window)
+            final = offset + window >= size
+            if offset:
+                # Start at the first full line
+                data = data[data.find(b"\n") + 1:]
+            if not final:
+                data = data[:data.rfind(b"\n") + 1]
+            if data:
+                yield offset, data.decode(encoding), final
+
+
+def _estimate_rows(profile: FileProfile, sampled_bytes: int, sampled_rows: int) -> int:
+    """Scale the sampled rows up to the file size."""
+    profile.rows_exact = False
+    if not sampled_bytes:
+        return 0
+    return int(profile.size * sampled_rows / sampled_bytes)
+
+
+def _detect_encoding(head: bytes, profile: FileProfile) -> Optional[str]:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        profile.warn("file is UTF-16; UTF-8 is smaller and more widely supported")
+        return "utf-16"
+    if b"\x00" in head:
+        profile.error("file contains NUL bytes; it looks binary, not text")
+        return None
+    try:
+        _decode_lines(head, "utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        profile.warn("file is not UTF-8; reading it as cp1252 (Windows Latin-1)")
+        return "cp1252"
+
+
+def _decode_lines(data: bytes, encoding: str) -> str:
+    """Decode whole lines only, so a character split at the end of a block is not an error."""
+    cut = data.rfind(b"\n") + 1
+    return data[:cut or len(data)].decode(encoding)
+
+
+def _detect_delimiter(text: str, default: str) -> str:
+    sample = "\n".join(text.splitlines()[:50])
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return default
+
+
+def _check_header(profile: FileProfile) -> None:
+    """Warn about blank or repeated column names and make the names unique the way pandas does."""
+    blank = [str(index + 1) for index, name in enumerate(profile.columns) if not name]
+    if blank:
+        profile.warn(f"header has blank column names (columns {', '.join(blank[:MAX_EXAMPLES])})")
+    seen = set()
+    duplicates = sorted({name for name in profile.columns if name and (name in seen or seen.add(name))})
+    if duplicates:
+        profile.warn(f"header repeats column names: {', '.join(duplicates[:MAX_EXAMPLES])}")
+    if len(profile.columns) == 1 and profile.format in ("csv", "tsv"):
+        profile.warn("only one column found; check the delimiter")
+
+    # pandas refuses duplicate names, so rename to "Unnamed: 2", "a.1", ...
+    unique: List[str] = []
+    taken = set()
+    for index, name in enumerate(profile.columns):
+        base = name or f"Unnamed: {index}"
+        candidate, suffix = base, 0
+        while candidate in taken:
+            suffix += 1
+            candidate = f"{base}.{suffix}"
+        taken.add(candidate)
+        unique.append(candidate)
+    profile.columns = unique
+
+
+# ---------------------------------------------------------------------------
+# JSON and Excel
+# ---------------------------------------------------------------------------
+
+def _profile_json_lines(profile: FileProfile, full: bool) -> None:
+    import pandas as pd
+
+    profile.format = "jsonl"
+    profile.encoding = "utf-8"
+    sampled = not full and profile.size > SAMPLE_BYTES
+    stats: Optional[_ColumnStats] = None
+    sampled_bytes = 0
+    malformed = 0
+    examples: List[str] = []
+    blocks = _windows(profile.path, sampled, "utf-8")
+    while True:
+        try:
+            offset, block, _ = next(blocks)
+        except StopIteration:
+            break
+        except UnicodeDecodeError as e:
+            profile.error(f"not valid UTF-8 text ({e.reason})")
+            return
+        profile.windows += 1
+        sampled_bytes += len(block.encode("utf-8"))
+        records = []
+        for number, line in enumerate(block.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                malformed += 1
+                if len(examples) < MAX_EXAMPLES:
+                    examples.append(f"line {number}" if not offset else f"a line near byte {offset:,}")
+                continue
+            records.append(record)
+        if records:
+            frame = pd.DataFrame.from_records(records)
+            if stats is None:
+                profile.columns = [str(column) for column in frame.columns]
+                stats = _ColumnStats(profile.columns)
+            stats.add(frame)
+            profile.sampled_rows += len(records)
+
+    if sampled:
+        profile.rows = _estimate_rows(profile, sampled_bytes, profile.sampled_rows + malformed)
+    else:
+        profile.rows = profile.sampled_rows
+    if malformed:
+        message = f"{malformed:,} lines are not JSON objects, e.g. {', '.join(examples)}"
+        if malformed / max(profile.sampled_rows + malformed, 1) > MALFORMED_ERROR_RATIO:
+            profile.error(message)
+        else:
+            profile.warn(message)
+    if stats is None:
+        profile.error("no JSON objects found")
+        return
+    stats.finish(profile)
+
+
+def _profile_json_document(profile: FileProfile) -> None:
+    import pandas as pd
+
+    profile.encoding = "utf-8"
+    with open(profile.path, "rb") as f:
+        text = f.read(SAMPLE_BYTES).decode("utf-8", errors="replace")
+    truncated = profile.size > SAMPLE_BYTES
+    records, complete = _json_array_records(text)
+    if records is None and not truncated:
+        try:
+            document = json.loads(text)
+        except ValueError as e:
+            profile.error(f"not valid JSON: {e}")
+            return
+        records = document if isinstance(document, list) else [document]
+        complete = True
+    if records is None:
+        profile.warn("only a JSON array of records can be checked without reading the whole file")
+        return
+    if not complete and not truncated:
+        profile.error("JSON array is not valid after record {:,}".format(len(records)))
+    records = [record for record in records if isinstance(record, dict)]
+    if not records:
+        profile.error("no JSON objects found")
+        return
+    frame = pd.DataFrame.from_records(records)
+    profile.columns = [str(column) for column in frame.columns]
+    stats = _ColumnStats(profile.columns)
+    stats.add(frame)
+    profile.windows = 1
+    profile.sampled_rows = len(records)
+    profile.rows = len(records)
+    profile.rows_exact = not truncated
+    if truncated:
+        profile.warn(f"checked the first {len(records):,} records of a {_format_size(profile.size)} JSON array")
+    stats.finish(profile)
+
+
+def _json_array_records(text: str) -> Tuple[Optional[list], bool]:
+    """Decode the records of a top-level JSON array one at a time; returns (records, reached the end)."""
+    decoder = json.JSONDecoder()
+    position = len(text) - len(text.lstrip())
+    if not text.startswith("[", position):
+        return None, False
+    position += 1
+    records = []
+    while True:
+        while position < len(text) and text[position] in " \t\r\n,":
+            position += 1
+        if position >= len(text):
+            return records, False
+        if text[position] == "]":
+            return records, True
+        try:
+            record, position = decoder.raw_decode(text, position)
+        except ValueError:
+            return records, False
+        records.append(record)
+
+
+def _profile_excel(profile: FileProfile) -> None:
+    import pandas as pd
+
+    try:
+        frame = pd.read_excel(profile.path, sheet_name=0)
+    except ImportError as e:
+        profile.warn(f"cannot read Excel files here ({e}); the server will check it")
+        return
+    except ValueError as e:
+        profile.error(f"not a readable Excel file: {e}")
+        return
+    profile.columns = [str(column) for column in frame.columns]
+    _check_header(profile)
+    unnamed = [column for column in profile.columns if column.startswith("Unnamed:")]
+    if unnamed:
+        profile.warn(f"{len(unnamed)} columns have no header")
+    stats = _ColumnStats(profile.columns)
+    stats.add(frame)
+    profile.windows = 1
+    profile.rows = profile.sampled_rows = len(frame)
+    if not len(frame):
+        profile.error("first sheet has no data rows")
+    stats.finish(profile)
+
+
+# ---------------------------------------------------------------------------
+# Column statistics
+# ---------------------------------------------------------------------------
+
+class _ColumnStats:
+    """Accumulates inferred types and null counts per column over several frames."""
+
+    DATETIME_SAMPLE = 200
+    TEXT_SAMPLE = 1000
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+        self.kinds: Dict[str, set] = {column: set() for column in columns}
+        self.nulls: Dict[str, int] = dict.fromkeys(columns, 0)
+        self.rows = 0
+        self.text_examples: Dict[str, str] = {}
+        self.checked: set = set()
+
+    def add(self, frame) -> None:
+        import pandas as pd
+
+        self.rows += len(frame)
+        for position, column in enumerate(self.columns):
+            if position >= frame.shape[1]:
+                continue
+            values = frame.iloc[:, position]
+            self.nulls[column] += int(values.isna().sum())
+            kind = self._kind(values, pd)
+            if kind:
+                self.kinds[column].add(kind)
+            if kind == "string" and column not in self.text_examples and column not in self.checked:
+                self.checked.add(column)
+                non_null = values.dropna()
+                if pd.to_numeric(non_null.head(self.TEXT_SAMPLE), errors="coerce").notna().mean() > 0.5:
+                    # Mostly numbers: remember a value that is not one
+                    text = non_null[pd.to_numeric(non_null, errors="coerce").isna()]
+                    if len(text):
+                        self.text_examples[column] = str(text.iloc[0])
+
+    def _kind(self, values, pd) -> Optional[str]:
+        non_null = values.dropna()
+        if non_null.empty:
+            return None
+        if pd.api.types.is_bool_dtype(values):
+            return "bool"
+        if pd.api.types.is_integer_dtype(values):
+            return "int"
+        if pd.api.types.is_float_dtype(values):
+            return "int" if (non_null == non_null.round()).all() else "float"
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return "datetime"
+        sample = non_null.head(self.DATETIME_SAMPLE).astype(str)
+        if sample.str.contains(r"\d{1,4}[-/:]\d{1,2}", regex=True).all():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                parsed = pd.to_datetime(sample, errors="coerce", format="mixed")
+            if parsed.notna().mean() >= 0.95:
+                return "datetime"
+        return "string"
+
+    def finish(self, profile: FileProfile) -> None:
+        """Write the combined types and null ratios to the profile and flag suspicious columns."""
+        for column in self.columns:
+            kinds = self.kinds[column]
+            if not kinds:
+                dtype = "empty"
+            elif len(kinds) == 1:
+                dtype = next(iter(kinds))
+            elif kinds <= {"int", "float"}:
+                dtype = "float"
+            else:
+                dtype = "string"
+            profile.dtypes[column] = dtype
+            profile.null_ratio[column] = self.nulls[column] / self.rows if self.rows else 0.0
+
+        empty = [column for column in self.columns if profile.dtypes[column] == "empty"]
+        if empty:
+            profile.warn(f"{len(empty)} columns are entirely empty: {', '.join(empty[:MAX_EXAMPLES])}")
+        for column, example in list(self.text_examples.items())[:MAX_EXAMPLES]:
+            profile.warn(f"column '{column}' is mostly numbers but has text such as {example!r}")
+
+
+def _first_char(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read(4096).decode("utf-8-sig", errors="ignore").lstrip()[:1]
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -25,6 +25,7 @@ from agentcore.utils.config import DATAVERSION_ENDPOINT,DATA_VERSION_ENDPOINT, D
 from rich.console import Console
 from agentcore.managers.base import BaseManager
 from agentcore.managers.table_manager import TableDisplay
+from agentcore.managers.task_journal import TaskJournal
 import json
 import mimetypes
 from datetime import datetime
@@ -75,6 +76,7 @@ from typing import Optional, Dict, List, Any
 import json
 from rich.console import Console
 from agentcore.managers.base import BaseManager
+from agentcore.managers.status_channel import StatusChannel
 from agentcore.utils.config import (
     DATA_VERSION_ENDPOINT,
     TASK_STATUS_ENDPOINT,
@@ -185,6 +187,11 @@ class DataVersionManager2(BaseManager):
             "Initiating data fetch...",
             lambda: self.api_client.post(endpoint=FETCH_INITIAL_DATA_ENDPOINT, data=payload)
         )
+        if isinstance(response, dict):
+            TaskJournal.instance().record(
+                "data", response.get("task_id"), label=f"Fetch data source {payload.get('data_source_id', '')}".strip(),
+                version_id=response.get("version_id"),
+            )
         
         return response
     
@@ -205,6 +212,11 @@ class DataVersionManager2(BaseManager):
             "Initiating data transformation...",
             lambda: self.api_client.post(endpoint=TRANSFORM_DATA_VERSION_ENDPOINT, data=payload)
         )
+        if isinstance(response, dict):
+            TaskJournal.instance().record(
+                "data", response.get("task_id"), label=f"Transform data version {payload.get('source_version_id', '')}".strip(),
+                version_id=response.get("target_version_id"),
+            )
         
         return response
     
@@ -245,16 +257,20 @@ class DataVersionManager2(BaseManager):
         return response
     
     @BaseManager.handle_api_error
-    def get_task_status(self, task_id: str) -> Dict[str, Any]:
+    def get_task_status(self, task_id: str, channel: Optional[StatusChannel] = None) -> Dict[str, Any]:
         """
         Check the status of an async task.
         
         Args:
             task_id: ID of the task to check
+            channel: Channel from task_status_channel(); when given, waits for
+                the next update pushed by the server instead of polling
             
         Returns:
             Dictionary with task status information
         """
+        if channel is not None:
+            return channel.fetch()
         # Updated to use the correct task status endpoint
         endpoint = f"{TASK_STATUS_ENDPOINT}{task_id}/"
         
@@ -264,6 +280,10 @@ class DataVersionManager2(BaseManager):
         )
         
         return response
+
+    def task_status_channel(self, task_id: str, **kwargs) -> StatusChannel:
+        """Open a StatusChannel for get_task_status(task_id, channel=...)."""
+        return self.status_channel(f"{TASK_STATUS_ENDPOINT}{task_id}/", **kwargs)
     
     @BaseManager.handle_api_error
     def get_data_version(self, version_id: str) -> Dict[str, Any]:
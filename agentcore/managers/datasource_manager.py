@@ -26,10 +26,20 @@ from agentcore.utils.config import DATASOURCE_ENDPOINT,DATASOURCE_TYPES_ENDPOINT
 from rich.prompt import Prompt
 from rich.console import Console
 from agentcore.managers.base import BaseManager
+from agentcore.managers.chunked_upload import ChunkedUploader
+from agentcore.managers.compression import is_compressible, post_multipart
+from agentcore.managers.upload_registry import UploadRegistry
 from agentcore.managers.table_manager import TableDisplay
 import json
 from datetime import datetime
 
+
+def _datasource_endpoint(record):
+    """Endpoint of the datasource a create response refers to, if it names one."""
+    datasource_id = record.get("data_source_id", record.get("id"))
+    return f"{DATASOURCE_ENDPOINT}{datasource_id}/" if datasource_id is not None else None
+
+
 class DatasourceManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -98,9 +108,13 @@ class DatasourceManager(BaseManager):
 
 
     @BaseManager.handle_api_error(show_details=True)
-    def create_datasource_with_file(self, payload, file_path, file_name=None):
+    def create_datasource_with_file(self, payload, file_path, file_name=None, reuse=True):
         """
         Create a datasource with file upload
+
+        If the same file contents were already uploaded as a datasource for
+        this project, the existing datasource is returned instead, unless
+        reuse is False.
         """
         import os
         
@@ -108,27 +122,20 @@ class DatasourceManager(BaseManager):
             file_name = os.path.basename(file_path)
         
         try:
-            # Prepare the files for upload
-            with open(file_path, 'rb') as file:
-                files = {
-                    'files': (file_name, file, 'application/octet-stream')
-                }
-                
-                # Debug: Print what we're sending
-                self.console.print(f"[dim]Uploading with payload: {payload}[/dim]")
-                self.console.print(f"[dim]File: {file_name}[/dim]")
-                
-                # Use the existing API client's post method with file support
-                response = self._execute_with_progress(
-                    f"Uploading file '{file_name}' and creating datasource...",
-                    lambda: self.api_client.post(
-                        endpoint=DATASOURCE_ENDPOINT,
-                        data=payload,  # Form data
-                        files=files    # File upload
-                    )
+            # Debug: Print what we're sending
+            self.console.print(f"[dim]Uploading with payload: {payload}[/dim]")
+            self.console.print(f"[dim]File: {file_name}[/dim]")
+
+            response, note = self.ingest_file(payload, file_path, file_name, reuse=reuse)
+            if note == "reused":
+                self.console.print(
+                    f"[green]✅ {file_name} was already uploaded; reusing datasource "
+                    f"{response.get('data_source_id', response.get('id', ''))}[/green]"
                 )
-                
+                return response
+
             if response:
+                self.console.print(f"[dim]{note}[/dim]")
                 self.console.print(f"[green]✅ File uploaded successfully: {file_name}[/green]")
                 return response
             else:
@@ -140,4 +147,70 @@ class DatasourceManager(BaseManager):
             return None
         except Exception as e:
             self.console.print(f"[red]❌ Error uploading file: {str(e)}[/red]")
-            return None
\ No newline at end of file
+            return None
+
+    def ingest_file(self, payload, file_path, file_name=None, reuse=True):
+        """
+        Create a datasource from a file without prompting or printing.
+
+        Args:
+            payload: Datasource fields (project_id, data_source_type_id, description...)
+            file_path: File to upload
+            file_name: Name sent to the server (defaults to the file's name)
+            reuse: Return the datasource of an earlier upload of the same contents
+
+        Returns:
+            Tuple of the datasource response and a short note on how the file
+            was sent, or "reused" if an earlier upload was found
+
+        Raises:
+            APIError: If the upload or the datasource creation failed
+            OSError: If the file could not be read
+        """
+        import os
+
+        file_name = file_name or os.path.basename(file_path)
+        registry = UploadRegistry.instance()
+        scope = {"project_id": payload.get("project_id"), "data_source_type_id": payload.get("data_source_type_id")}
+        if reuse:
+            digest, existing = registry.find(
+                self.api_client, file_path, "datasource",
+                resource_endpoint=_datasource_endpoint, **scope,
+            )
+            if existing:
+                return existing, "reused"
+        else:
+            digest = registry.digest(file_path)
+
+        # Text files are gzipped on the way if the server accepts it
+        level = self.config_manager.upload_compression() if is_compressible(file_name) else 0
+
+        # Send the file in resumable chunks and reference the finished session;
+        # servers without the upload endpoint get a single multipart request
+        uploader = ChunkedUploader(self.api_client, compression=level)
+        session = uploader.upload(file_path, purpose="datasource", file_name=file_name)
+        if session:
+            note = f"Sent {uploader.summary()}"
+            response = self._execute_with_progress(
+                f"Creating datasource from '{file_name}'...",
+                lambda: self.api_client.post(
+                    endpoint=DATASOURCE_ENDPOINT,
+                    data={**payload, "upload_session_id": session["session_id"]},
+                )
+            )
+        else:
+            with open(file_path, 'rb') as file:
+                files = {
+                    'files': (file_name, file, 'application/octet-stream')
+                }
+                response, size, sent = self._execute_with_progress(
+                    f"Uploading file '{file_name}' and creating datasource...",
+                    lambda: post_multipart(self.api_client, DATASOURCE_ENDPOINT, payload, files, level)
+                )
+            note = f"Sent {sent / 1024 / 1024:.1f} MB"
+            if sent != size:
+                note += f" on the wire for {size / 1024 / 1024:.1f} MB (gzip)"
+
+        if response:
+            registry.record(self.api_client, digest, "datasource", response, file_name, **scope)
+        return response, note
\ No newline at end of file
@@ -27,7 +27,9 @@ from agentcore.utils.config import (DEPLOY_CREATE_ENDPOINT,FETCH_DEPLOY_STATUS_E
 from rich.prompt import Prompt
 from rich.console import Console
 from agentcore.managers.base import BaseManager
+from agentcore.managers.status_channel import StatusChannel
 from agentcore.managers.table_manager import TableDisplay
+from agentcore.managers.task_journal import TaskJournal
 import json
 from datetime import datetime
 
@@ -49,14 +51,25 @@ class DeployManager(BaseManager):
             "Deploying experiment...",
             lambda: self.api_client.post(endpoint=DEPLOY_CREATE_ENDPOINT, data=payload)
         )
+        if isinstance(response, dict):
+            TaskJournal.instance().record(
+                "deploy", response.get("job_id"), label=f"Deploy {payload.get('experiment_group_code', '')} v{payload.get('version_id', '')}"
+            )
 
         return response
     
     @BaseManager.handle_api_error
-    def fetch_status(self, job_id):
+    def fetch_status(self, job_id, channel: Optional[StatusChannel] = None):
         """
         Fetch deployment status.
+
+        Args:
+            job_id: Deployment job ID
+            channel: Channel from status_channel_for_job(); when given, waits
+                for the next update pushed by the server instead of polling
         """
+        if channel is not None:
+            return channel.fetch()
         endpoint = FETCH_DEPLOY_STATUS_ENDPOINT.format(job_id=job_id)
         response = self._execute_with_progress(
             "Fetching deployment status...",
@@ -64,6 +77,10 @@ class DeployManager(BaseManager):
         )
 
         return response
+
+    def status_channel_for_job(self, job_id, **kwargs) -> StatusChannel:
+        """Open a StatusChannel for fetch_status(job_id, channel=...)."""
+        return self.status_channel(FETCH_DEPLOY_STATUS_ENDPOINT.format(job_id=job_id), **kwargs)
     
     @BaseManager.handle_api_error
     def view_deployments(self, project_id):
@@ -101,6 +118,10 @@ class DeployManager(BaseManager):
             "Promoting to production...",
             lambda: self.api_client.post(endpoint=endpoint,data = payload)
         )
+        if isinstance(response, dict):
+            TaskJournal.instance().record(
+                "promotion", response.get("promotion_id"), label=f"Promote deployment {payload.get('deployment_job_id', '')}".strip()
+            )
 
         return response
     
@@ -131,14 +152,25 @@ class DeployManager(BaseManager):
         return response
     
     @BaseManager.handle_api_error(show_details=True)
-    def promote_production_staus(self, promotion_id):
+    def promote_production_staus(self, promotion_id, channel: Optional[StatusChannel] = None):
         """
         Fetch deployment status.
+
+        Args:
+            promotion_id: Promotion ID
+            channel: Channel from promotion_status_channel(); when given, waits
+                for the next update pushed by the server instead of polling
         """
+        if channel is not None:
+            return channel.fetch()
         endpoint = DEPLOYMENT_PROMOTE_ENDPOINT + promotion_id
         response = self._execute_with_progress(
             "Fetching live status of production...",
             lambda: self.api_client.get(endpoint=endpoint)
         )
 
-        return response
\ No newline at end of file
+        return response
+
+    def promotion_status_channel(self, promotion_id, **kwargs) -> StatusChannel:
+        """Open a StatusChannel for promote_production_staus(promotion_id, channel=...)."""
+        return self.status_channel(DEPLOYMENT_PROMOTE_ENDPOINT + promotion_id, **kwargs)
\ No newline at end of file
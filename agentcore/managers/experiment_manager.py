@@ -29,6 +29,9 @@ import time
 from typing import Dict, Any, Optional, Generator
 from rich.panel import Panel
 
+from agentcore.managers.metrics_writer import MetricsWriter
+from agentcore.managers.poll_scheduler import PollScheduler
+from agentcore.managers.status_channel import StatusChannel
 from agentcore.utils.config import (
     DATA_VERSIONS_ENDPOINT,
     FETCH_COLUMNS_ENDPOINT,
@@ -340,6 +343,15 @@ class ExperimentManager(BaseManager):
         )
         
         return response
+
+    def metrics_writer(self, **kwargs) -> "MetricsWriter":
+        """
+        Create a batched, non-blocking MetricsWriter for reporting from a training loop.
+
+        Use it instead of post_metrics when reporting every step; see
+        MetricsWriter for the keyword arguments (e.g. defaults, batch_size).
+        """
+        return MetricsWriter(self.api_client, **kwargs)
     
     def experiment_status(self, experiment_id: str) -> Dict[str, Any]:
         """
@@ -545,7 +557,8 @@ class ExperimentManager(BaseManager):
         )
         return response
     
-    def fetch_logs(self, project_id: int, experiment_group_code: str, version: str) -> Dict[str, Any]:
+    def fetch_logs(self, project_id: int, experiment_group_code: str, version: str,
+                   since: Optional[str] = None, channel: Optional[StatusChannel] = None) -> Dict[str, Any]:
         """
         Fetch logs for a specific experiment group and version.
         
@@ -553,15 +566,23 @@ class ExperimentManager(BaseManager):
             project_id: ID of the project
             experiment_group_code: Code of the experiment group
             version: Version number
+            since: Cursor returned by a previous response as 'next_cursor'.
+                Servers that support it only return logs after the cursor.
+            channel: Channel from log_channel(); when given, waits for new
+                logs pushed by the server instead of polling
             
         Returns:
             Dictionary with logs data
         """
+        if channel is not None:
+            return channel.fetch(params={'since': since})
         endpoint = FETCH_LOGS_ENDPOINT.format(
             project_id=project_id,
             experiment_group_code=experiment_group_code,
             version=version
         )
+        if since is not None:
+            endpoint += f"&since={urllib.parse.quote(str(since))}"
         
         try:
             response = self._execute_with_progress(
@@ -574,52 +595,83 @@ class ExperimentManager(BaseManager):
             print(f"Error fetching logs: {str(e)}")
             raise
 
+    def log_channel(self, project_id: int, experiment_group_code: str, version: str, **kwargs) -> StatusChannel:
+        """Open a StatusChannel for fetch_logs(..., channel=...)."""
+        endpoint = FETCH_LOGS_ENDPOINT.format(
+            project_id=project_id,
+            experiment_group_code=experiment_group_code,
+            version=version
+        )
+        return self.status_channel(endpoint, **kwargs)
+
+    def log_tail(self, project_id: int, experiment_group_code: str, version: str,
+                 channel: Optional[StatusChannel] = None) -> "LogTail":
+        """
+        Create a LogTail that fetches only new logs on each poll.
+
+        Args:
+            channel: Channel from log_channel() to receive logs over long-poll
+                or SSE when the server offers them
+        """
+        return LogTail(self, project_id, experiment_group_code, version, channel=channel)
+
     def poll_experiment_logs(self, project_id: int, experiment_group_code: str, version: str, 
                              poll_interval: int = 5, max_polls: int = 120) -> Generator[str, None, None]:
         """
         Poll experiment logs continuously until completion or timeout.
         
+        Polling is adaptive: it speeds up to once a second while logs are
+        arriving and backs off to poll_interval * 6 while they are not.
+        Only newly appended log text is yielded and scanned for completion
+        indicators, so each poll costs time proportional to the new text.
+        
         Args:
             project_id: ID of the project
             experiment_group_code: Code of the experiment group
             version: Version number
-            poll_interval: Seconds between polls (default: 5)
-            max_polls: Maximum number of polls before timeout (default: 120 = 10 minutes)
+            poll_interval: Base seconds between polls (default: 5)
+            max_polls: Timeout expressed in base intervals (default: 120 = 10 minutes)
             
         Yields:
-            Log content as string
-        """
-        polls_count = 0
-        last_log_content = ""
-        
-        # Completion indicators for experiment status
-        completion_indicators = [
-            '✅ model execution complete',
-            'experiment completed',
-            'pipeline finished',
-            'error:',
-            'failed'
-        ]
-        
-        while polls_count < max_polls:
+            Newly appended log text, then a status message naming the line
+            that triggered completion, the error, or the timeout
+        """
+        poller = PollScheduler.instance().poller(min_interval=min(1, poll_interval), max_interval=poll_interval * 6)
+        channel = self.log_channel(project_id, experiment_group_code, version, poller=poller)
+        tail = self.log_tail(project_id, experiment_group_code, version, channel=channel)
+        detector = CompletionDetector()
+        deadline = time.monotonic() + poll_interval * max_polls
+        timed_out = False
+        
+        while True:
+            if time.monotonic() >= deadline:
+                timed_out = True
+                break
             try:
-                # Fetch the current logs
-                response = self.fetch_logs(project_id, experiment_group_code, version)
-                current_log = response.get('log', '')
+                # Fetch only what was appended since the last poll
+                update = tail.poll()
+                if update.reset:
+                    detector.reset()
+                delta = update.text + "".join(
+                    f"[{log.get('level', '')}] {log.get('source', '')}: {log.get('message', '')}\n"
+                    for log in update.logs
+                )
                 
-                # Only yield new content if it has changed
-                if current_log != last_log_content:
-                    yield current_log
-                    last_log_content = current_log
+                # Only yield new content
+                if delta:
+                    yield delta
                 
-                # Check for completion indicators
-                if any(indicator in current_log.lower() for indicator in completion_indicators):
-                    yield "Experiment logs indicate completion or an error. Stopping polling."
+                # Check the new text for completion indicators
+                match = detector.feed(delta)
+                if match:
+                    yield (
+                        f"Experiment logs indicate completion or an error "
+                        f"('{match.indicator}' on line {match.line_number}: {match.line.strip()}). Stopping polling."
+                    )
                     break
                 
-                # Increment poll count and wait before the next poll
-                polls_count += 1
-                time.sleep(poll_interval)
+                # Wait before the next poll; sooner if logs are still arriving
+                channel.wait(changed=bool(update))
             
             except Exception as e:
                 # Handle any exceptions during polling
@@ -627,7 +679,7 @@ class ExperimentManager(BaseManager):
                 break
         
         # Handle polling timeout
-        if polls_count >= max_polls:
+        if timed_out:
             yield "Polling timeout reached. Use 'experiments logs' command to check the current status."
         
     def system_metrics(self, project_id: int) -> Dict[str, Any]:
@@ -722,4 +774,192 @@ class ExperimentManager(BaseManager):
         )
 
         return response
-    
\ No newline at end of file
+    
+
+
+COMPLETION_INDICATORS = [
+    '✅ model execution complete',
+    'experiment completed',
+    'pipeline finished',
+    'error:',
+    'failed',
+]
+
+
+class CompletionMatch:
+    """Log line that matched a completion indicator."""
+
+    def __init__(self, indicator: str, line: str, line_number: int):
+        self.indicator = indicator
+        self.line = line
+        self.line_number = line_number
+
+
+class CompletionDetector:
+    """
+    Scans a growing log for completion indicators one chunk at a time.
+
+    Each feed() lower-cases only the new text plus the unfinished last line
+    of the previous chunk, so an indicator split across two polls is still
+    found and old lines are never matched again. Plain str.find per
+    indicator is used because it is several times faster than an
+    alternation regex with IGNORECASE.
+    """
+
+    MAX_PARTIAL_LINE = 64 * 1024
+
+    def __init__(self, indicators: Optional[List[str]] = None):
+        self.indicators = tuple(indicator.lower() for indicator in (indicators or COMPLETION_INDICATORS))
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything seen, e.g. after the log was restarted."""
+        self._partial = ""
+        self._lines_done = 0
+
+    def feed(self, text: str) -> Optional[CompletionMatch]:
+        """
+        Scan newly appended text.
+
+        Returns:
+            CompletionMatch for the first matching line, or None
+        """
+        if not text:
+            return None
+        buffer = self._partial + text
+        lowered = buffer.lower()
+        position, indicator = -1, None
+        for candidate in self.indicators:
+            # Only a match starting before the best one so far can win; it may end after it
+            end = position + len(candidate) - 1 if position != -1 else len(lowered)
+            found = lowered.find(candidate, 0, end)
+            if found != -1:
+                position, indicator = found, candidate
+        if indicator is not None:
+            # lower() can change string lengths, so map back by line number
+            line_index = lowered.count("\n", 0, position)
+            line = buffer.split("\n")[line_index]
+            return CompletionMatch(indicator, line, self._lines_done + line_index + 1)
+
+        last_newline = buffer.rfind("\n")
+        if last_newline != -1:
+            self._lines_done += buffer.count("\n", 0, last_newline + 1)
+        # Keep the unfinished last line; cap it so one endless line cannot grow it forever
+        self._partial = buffer[last_newline + 1:][-self.MAX_PARTIAL_LINE:]
+        return None
+
+
+class LogTailUpdate:
+    """New log data returned by one LogTail.poll() call."""
+
+    def __init__(self, logs: List[Dict[str, Any]], text: str, reset: bool = False):
+        self.logs = logs
+        self.text = text
+        # True when the server-side log no longer extends what was seen before
+        # (e.g. a rerun replaced it) and the update restarts from the beginning
+        self.reset = reset
+
+    def __bool__(self) -> bool:
+        return bool(self.logs or self.text)
+
+
+class LogTail:
+    """
+    Follows the log of one experiment group/version incrementally.
+
+    When the server returns a 'next_cursor' with the logs, it is sent back as
+    'since' on the next poll so only new entries are transferred. Otherwise
+    the full log is fetched and only the part after what was already seen
+    is processed: structured 'logs' entries are sliced by count and checked
+    against the last seen entry, and 'log' text is sliced by offset and
+    checked against the last characters seen. With a StatusChannel the same
+    responses arrive over long-poll or SSE when the server offers them.
+    """
+
+    TEXT_ANCHOR_SIZE = 64
+
+    def __init__(self, experiment_manager: ExperimentManager, project_id: int,
+                 experiment_group_code: str, version: str, channel: Optional[StatusChannel] = None):
+        self.experiment_manager = experiment_manager
+        self.channel = channel
+        self.project_id = project_id
+        self.experiment_group_code = experiment_group_code
+        self.version = version
+        self.cursor: Optional[str] = None
+        self.server_cursor = False
+        self.entry_count = 0
+        self.text_offset = 0
+        self._last_entry: Optional[Dict[str, Any]] = None
+        self._text_anchor = ""
+
+    def get_state(self) -> Dict[str, Any]:
+        """Return the position of this tail so it can be resumed later."""
+        return {
+            'cursor': self.cursor,
+            'server_cursor': self.server_cursor,
+            'entry_count': self.entry_count,
+            'text_offset': self.text_offset,
+            'last_entry': self._last_entry,
+            'text_anchor': self._text_anchor,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Resume from a position previously returned by get_state()."""
+        self.cursor = state.get('cursor')
+        self.server_cursor = bool(state.get('server_cursor'))
+        self.entry_count = state.get('entry_count', 0)
+        self.text_offset = state.get('text_offset', 0)
+        self._last_entry = state.get('last_entry')
+        self._text_anchor = state.get('text_anchor', '')
+
+    def poll(self) -> LogTailUpdate:
+        """Fetch the log and return only what was appended since the last poll."""
+        response = self.experiment_manager.fetch_logs(
+            self.project_id, self.experiment_group_code, self.version, since=self.cursor, channel=self.channel
+        ) or {}
+        if self.channel is not None and not self.channel.fresh:
+            # Unchanged (304) or the push wait expired: nothing new
+            return LogTailUpdate([], '')
+        next_cursor = response.get('next_cursor')
+        if next_cursor is not None:
+            # The response only holds entries after the cursor we sent
+            incremental = self.cursor is not None
+            self.cursor = next_cursor
+            self.server_cursor = True
+            if incremental:
+                return self._take_delta(response.get('logs') or [], response.get('log') or '')
+        return self._take_suffix(response.get('logs') or [], response.get('log') or '')
+
+    def _take_delta(self, logs: List[Dict[str, Any]], text: str) -> LogTailUpdate:
+        if logs:
+            self.entry_count += len(logs)
+            self._last_entry = logs[-1]
+        if text:
+            self.text_offset += len(text)
+            self._text_anchor = (self._text_anchor + text)[-self.TEXT_ANCHOR_SIZE:]
+        return LogTailUpdate(logs, text)
+
+    def _take_suffix(self, logs: List[Dict[str, Any]], text: str) -> LogTailUpdate:
+        reset = False
+
+        seen = self.entry_count
+        if seen and (len(logs) < seen or logs[seen - 1] != self._last_entry):
+            reset, seen = True, 0
+        new_logs = logs[seen:]
+        if new_logs:
+            self._last_entry = new_logs[-1]
+        self.entry_count = len(logs)
+
+        offset = self.text_offset
+        if offset:
+            anchor = self._text_anchor
+            if len(text) < offset or text[offset - len(anchor):offset] != anchor:
+                reset, offset = True, 0
+        new_text = text[offset:]
+        self.text_offset = len(text)
+        self._text_anchor = text[-self.TEXT_ANCHOR_SIZE:]
+
+        if reset:
+            # Start over with the whole current log
+            new_logs, new_text = logs, text
+        return LogTailUpdate(new_logs, new_text, reset=reset)
@@ -0,0 +1,202 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agentcore.managers.client import APIError
+from agentcore.managers.instance_manager import InstanceFeed, InstanceManager
+from agentcore.managers.poll_scheduler import PollScheduler
+
+RUNNING_STATES = {"running", "started", "active"}
+
+
+def _parse_time(value: Any) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class FleetRow:
+    """One instance on the fleet dashboard, with the state history seen so far."""
+
+    def __init__(self, project_id, project_name: str, instance: Dict[str, Any]):
+        self.project_id = project_id
+        self.project_name = project_name
+        self.instance = instance
+        self.state = instance.get("state")
+        # Until a transition is seen, the last server update is the best guess
+        self.state_since = _parse_time(instance.get("updated_at"))
+        self.last_transition: Optional[Tuple[Any, Any, Optional[float]]] = None
+        self.version = 0
+
+    @property
+    def instance_id(self):
+        return self.instance.get("id")
+
+    def update(self, instance: Dict[str, Any], now: float) -> None:
+        state = instance.get("state")
+        if state != self.state:
+            duration = now - self.state_since if self.state_since is not None else None
+            self.last_transition = (self.state, state, duration)
+            self.state, self.state_since = state, now
+        self.instance = instance
+        self.version += 1
+
+    def in_state(self, now: float) -> Optional[float]:
+        return now - self.state_since if self.state_since is not None else None
+
+    def uptime(self, now: float) -> Optional[float]:
+        """Seconds since the instance started running, or None if it is not running."""
+        if str(self.state or "").lower() not in RUNNING_STATES:
+            return None
+        started = _parse_time(self.instance.get("running_since")) or self.state_since
+        return max(now - started, 0.0) if started is not None else None
+
+
+class FleetMonitor:
+    """
+    Polls the instances of many projects at once for `instances top`.
+
+    Each project has an InstanceFeed (conditional and delta requests) and
+    its own adaptive Poller, so busy projects are polled often and idle ones
+    back off. Polls run on a small thread pool under the shared
+    PollScheduler rate limit. ``on_update`` receives only the rows that
+    changed in each round.
+    """
+
+    MAX_WORKERS = 8
+    MAX_POLL_INTERVAL = 30
+
+    def __init__(self, projects: Dict[Any, str], min_interval: float = 2.0,
+                 instance_manager: Optional[InstanceManager] = None):
+        """
+        Args:
+            projects: Project names keyed by project id
+            min_interval: Seconds between polls of a project while it is changing
+        """
+        self.instance_manager = instance_manager or InstanceManager()
+        self.projects = projects
+        self.feeds: Dict[Any, InstanceFeed] = {
+            project_id: self.instance_manager.instance_feed(project_id) for project_id in projects
+        }
+        scheduler = PollScheduler.instance()
+        self.pollers = {
+            project_id: scheduler.poller(min_interval, max(self.MAX_POLL_INTERVAL, min_interval))
+            for project_id in projects
+        }
+        self.rows: Dict[Tuple[Any, Any], FleetRow] = {}
+        self.errors: Dict[Any, str] = {}
+        self.prices = self.instance_manager.cached_prices()
+
+    def price(self, row: FleetRow) -> Optional[Dict[str, Any]]:
+        """Cached price of the instance type of a row, if pricing was fetched before."""
+        entry = self.prices.get(self.instance_manager.pricing_key(row.instance))
+        return entry if entry and entry.get("price_per_hour") is not None else None
+
+    def cost(self, row: FleetRow, now: float) -> Optional[float]:
+        uptime = row.uptime(now)
+        price = self.price(row)
+        if uptime is None or price is None:
+            return None
+        try:
+            return uptime / 3600 * float(price["price_per_hour"])
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": sum(feed.requests for feed in self.feeds.values()),
+            "not_modified": sum(feed.not_modified for feed in self.feeds.values()),
+            "deltas": sum(feed.deltas for feed in self.feeds.values()),
+        }
+
+    def _poll(self, project_id) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        poller = self.pollers[project_id]
+        if not poller.acquire():
+            raise InterruptedError("cancelled")
+        return self.feeds[project_id].poll()
+
+    def _apply(self, project_id, future: Future, now: float) -> List[FleetRow]:
+        poller = self.pollers[project_id]
+        try:
+            changed, removed = future.result()
+        except Exception as e:
+            self.errors[project_id] = e.message if isinstance(e, APIError) else str(e)
+            poller.schedule(failed=True)
+            return []
+        self.errors.pop(project_id, None)
+        for instance_id in removed:
+            self.rows.pop((project_id, instance_id), None)
+        rows = []
+        for instance in changed:
+            key = (project_id, instance["id"])
+            row = self.rows.get(key)
+            if row is None:
+                row = self.rows[key] = FleetRow(project_id, self.projects[project_id], instance)
+            else:
+                row.update(instance, now)
+            rows.append(row)
+        poller.schedule(changed=bool(changed or removed))
+        return rows
+
+    def run(self, on_update: Optional[Callable[["FleetMonitor", List[FleetRow]], None]] = None,
+            stop: Optional[threading.Event] = None) -> None:
+        """Poll until ``stop`` is set or the user presses Ctrl+C."""
+        stop = stop or threading.Event()
+        in_flight: Dict[Future, Any] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.MAX_WORKERS, max(len(self.projects), 1)), thread_name_prefix="agentcore-top"
+        )
+        try:
+            while not stop.is_set():
+                busy = set(in_flight.values())
+                for project_id, poller in self.pollers.items():
+                    if project_id not in busy and poller.due():
+                        in_flight[executor.submit(self._poll, project_id)] = project_id
+
+                now = time.monotonic()
+                next_due = min((poller.next_due for poller in self.pollers.values()), default=now + 0.5)
+                timeout = max(0.05, min(next_due - now, 0.5))
+                if in_flight:
+                    finished, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    stop.wait(timeout)
+                    finished = set()
+                wall_now = time.time()
+                changed: List[FleetRow] = []
+                for future in finished:
+                    changed += self._apply(in_flight.pop(future), future, wall_now)
+                if on_update is not None:
+                    on_update(self, changed)
+        finally:
+            for poller in self.pollers.values():
+                poller.cancel()
+            executor.shutdown(wait=True)
@@ -20,12 +20,16 @@
 # Original License Date: 2025-07-24
 # ###################################################################################
 
-from typing import Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from agentcore.utils.config import (AWS_INSTANCE_ENDPOINT, AWS_PRICING_ENDPOINT,AWS_INSTANCE_TYPES_ENDPOINT,AWS_REGIONS_ENDPOINT,
-                                    PROJECT_INSTANCE_VIEW,INSTANCE_STATUS, INSTANCE_UPDATE, AWS_CREDENTIALS_ENDPOINT)
+                                    PROJECT_INSTANCE_VIEW,INSTANCE_STATUS, INSTANCE_UPDATE, AWS_CREDENTIALS_ENDPOINT,
+                                    PRICING_CACHE_FILE)
 from rich.console import Console
 from agentcore.managers.base import BaseManager
+from agentcore.managers.status_channel import StatusChannel
 from agentcore.managers.table_manager import TableDisplay
+from agentcore.managers.task_journal import TaskJournal
 from rich.panel import Panel
 import json
 from datetime import datetime
@@ -91,6 +95,11 @@ class InstanceManager(BaseManager):
             "Creating Instance...",
             lambda: self.api_client.post(endpoint=AWS_INSTANCE_ENDPOINT , data=instance_data)
         )
+        if isinstance(response, dict):
+            TaskJournal.instance().record(
+                "instance", response.get("task_id"), label=f"Create instance {instance_data.get('name', '')}".strip(),
+                instance_id=response.get("instance_id"),
+            )
 
         return response
     
@@ -106,6 +115,10 @@ class InstanceManager(BaseManager):
             "Starting Instance..." if action == "start" else "Stopping Instance...",
             lambda: self.api_client.post(endpoint=AWS_INSTANCE_ENDPOINT + f"{instance_id}/action/", data=data)
         )
+        if isinstance(response, dict):
+            TaskJournal.instance().record(
+                "instance", response.get("task_id"), label=f"{action.capitalize()} instance {instance_id}", instance_id=instance_id
+            )
 
         return response
 
@@ -159,6 +172,32 @@ class InstanceManager(BaseManager):
 
         return None
     
+    def poll_project_instances(self, project_id, etag: Optional[str] = None,
+                               since: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch the instances of a project for repeated polling.
+
+        Unlike project_instance_show this prints nothing and lets APIError
+        propagate, so a dashboard can show the error in place.
+
+        Args:
+            project_id: ID of the project
+            etag: ETag of the previous response, sent as If-None-Match
+            since: Cursor returned by a previous response as 'next_cursor'.
+                Servers that support it only return instances changed after
+                the cursor, plus the ids of 'removed' ones.
+
+        Returns:
+            (response, etag): response is None when nothing changed (304)
+        """
+        endpoint = PROJECT_INSTANCE_VIEW + f"{project_id}/"
+        params = {"since": since} if since is not None else None
+        return self.api_client.get_conditional(endpoint, etag=etag, params=params)
+
+    def instance_feed(self, project_id) -> "InstanceFeed":
+        """Create an InstanceFeed that tracks the instances of one project incrementally."""
+        return InstanceFeed(self, project_id)
+
     @BaseManager.handle_api_error
     def pricing(self, provider, instance_type, region):
         """Fetch cloud pricing for the given provider, instance type, and region."""
@@ -173,8 +212,54 @@ class InstanceManager(BaseManager):
                 "Fetching pricing data...",
                 lambda: self.api_client.get(endpoint)
             )
+        if isinstance(data, dict) and data.get("price_per_hour") is not None:
+            self._cache_pricing(provider, instance_type, region, data)
         return data
 
+    @staticmethod
+    def _pricing_key(provider, instance_type, region):
+        return f"{str(provider or 'AWS').upper()}|{instance_type}|{region}"
+
+    @staticmethod
+    def _load_pricing_cache() -> Dict[str, Any]:
+        try:
+            with open(PRICING_CACHE_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _cache_pricing(self, provider, instance_type, region, data):
+        """Remember a price so `instances top` can show running costs without asking again."""
+        cache = self._load_pricing_cache()
+        cache[self._pricing_key(provider, instance_type, region)] = {
+            "price_per_hour": data.get("price_per_hour"),
+            "currency": data.get("currency", ""),
+            "fetched_at": time.time(),
+        }
+        try:
+            PRICING_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp = PRICING_CACHE_FILE.with_suffix(".tmp")
+            temp.write_text(json.dumps(cache), encoding="utf-8")
+            temp.replace(PRICING_CACHE_FILE)
+        except OSError:
+            pass
+
+    def cached_prices(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Prices previously fetched with pricing(), keyed by pricing_key().
+
+        Returns:
+            Dictionary of {"price_per_hour", "currency", "fetched_at"} entries
+        """
+        return self._load_pricing_cache()
+
+    def pricing_key(self, instance: Dict[str, Any]) -> str:
+        """Key of the cached price for an instance returned by project_instance_show."""
+        return self._pricing_key(
+            instance.get("provider_type"), instance.get("instance_type"),
+            instance.get("aws_region") or instance.get("region"),
+        )
+
 
     @BaseManager.handle_api_error
     def regions_aws(self):
@@ -227,15 +312,27 @@ class InstanceManager(BaseManager):
 
     
     @BaseManager.handle_api_error
-    def instance_status(self,task_id):
-        "Fetches the status of an instance"
-
+    def instance_status(self,task_id, channel: Optional[StatusChannel] = None):
+        """
+        Fetches the status of an instance task.
+
+        Args:
+            task_id: ID of the task
+            channel: Channel from task_status_channel(); when given, waits for
+                the next update pushed by the server instead of polling
+        """
+        if channel is not None:
+            return channel.fetch()
         endpoint = INSTANCE_STATUS + task_id + "/"
         response = self._execute_with_progress(
             "Fetching status of instance", lambda: self.api_client.get(endpoint)
         )
         return response
     
+    def task_status_channel(self, task_id, **kwargs) -> StatusChannel:
+        """Open a StatusChannel for instance_status(task_id, channel=...)."""
+        return self.status_channel(INSTANCE_STATUS + task_id + "/", **kwargs)
+
     @BaseManager.handle_api_error
     def instance_update(self,payload):
         "Update an instance"
@@ -243,4 +340,69 @@ class InstanceManager(BaseManager):
         response = self._execute_with_progress(
             "Updating the instance...", lambda: self.api_client.post(INSTANCE_UPDATE, payload)
         )
-        return response
\ No newline at end of file
+        if isinstance(response, dict):
+            instance_id = response.get("instance_id")
+            TaskJournal.instance().record(
+                "instance", response.get("task_id"), label=f"Update instance {instance_id or ''}".strip(), instance_id=instance_id
+            )
+        return response
+
+
+class InstanceFeed:
+    """
+    Follows the instances of one project incrementally.
+
+    Each poll revalidates the previous response with its ETag, so an
+    unchanged project costs one empty 304 response. When the server returns
+    a 'next_cursor', it is sent back as 'since' and the response only holds
+    the instances that changed. Otherwise the full list is compared with the
+    previous one. Either way poll() reports only what changed.
+    """
+
+    def __init__(self, instance_manager: InstanceManager, project_id):
+        self.instance_manager = instance_manager
+        self.project_id = project_id
+        self.instances: Dict[Any, Dict[str, Any]] = {}
+        self.etag: Optional[str] = None
+        self.cursor: Optional[str] = None
+        self.requests = 0
+        self.not_modified = 0
+        self.deltas = 0
+
+    def poll(self) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """
+        Fetch the project's instances.
+
+        Returns:
+            (changed, removed): instances that are new or differ from the last
+            poll, and the ids of instances that disappeared
+        """
+        response, self.etag = self.instance_manager.poll_project_instances(
+            self.project_id, etag=self.etag, since=self.cursor
+        )
+        self.requests += 1
+        if response is None:
+            self.not_modified += 1
+            return [], []
+
+        instances = [instance for instance in response.get("instances") or [] if "id" in instance]
+        next_cursor = response.get("next_cursor")
+        # The response only holds changes after the cursor we sent
+        incremental = next_cursor is not None and self.cursor is not None
+        self.cursor = next_cursor
+
+        if incremental:
+            self.deltas += 1
+            removed = [instance_id for instance_id in response.get("removed") or [] if instance_id in self.instances]
+        else:
+            seen = {instance["id"] for instance in instances}
+            removed = [instance_id for instance_id in self.instances if instance_id not in seen]
+        for instance_id in removed:
+            del self.instances[instance_id]
+
+        changed = []
+        for instance in instances:
+            if self.instances.get(instance["id"]) != instance:
+                self.instances[instance["id"]] = instance
+                changed.append(instance)
+        return changed, removed
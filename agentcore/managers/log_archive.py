@@ -0,0 +1,420 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+import json
+import os
+import re
+import shutil
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern
+
+from agentcore.utils.config import LOGS_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_RELATIVE_TIME = re.compile(r"^(\d+(?:\.\d+)?)\s*([smhdw])$")
+_TIME_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+# Characters that make a --grep pattern more than a literal, or that JSON escapes inside a block
+_NOT_LITERAL = set('.^$*+?{}[]()|\\"')
+
+
+def parse_time(value: str) -> float:
+    """
+    Parse a --since/--until value into a Unix timestamp.
+
+    Accepts relative durations ('30s', '15m', '2h', '1d', '1w') meaning that long
+    ago, or an ISO 8601 date/time ('2025-07-24', '2025-07-24T10:30:00Z').
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    value = value.strip()
+    match = _RELATIVE_TIME.match(value)
+    if match:
+        delta = timedelta(**{_TIME_UNITS[match.group(2)]: float(match.group(1))})
+        return time.time() - delta.total_seconds()
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+def log_timestamp(log: Dict[str, Any]) -> Optional[float]:
+    """Return the Unix timestamp of a log entry, or None if it has none."""
+    timestamp = log.get('timestamp')
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(str(timestamp).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def _is_literal(pattern: Pattern) -> bool:
+    """Whether the pattern matches plain text the same way in a message and in its JSON encoding."""
+    return (not pattern.flags & re.VERBOSE
+            and not any(char in _NOT_LITERAL or char < " " for char in pattern.pattern))
+
+
+class LogArchive:
+    """
+    Append-only local archive of the logs of one experiment group/version.
+
+    Logs are stored under ``~/.agentcore/logs/<project>/<group>/<version>/`` as
+    zlib-compressed blocks appended to segment files. ``index.jsonl`` gets one
+    line per block with its location, entry count, time range and level and
+    source counts. This is a sparse index: queries only decompress blocks
+    that can contain a match. ``state.json`` holds the LogTail position so
+    the next sync only asks the server for what is missing.
+
+    The last block of each flush also carries the tail position, so a crash
+    before ``state.json`` is written does not archive the same entries
+    twice. Flushes take an exclusive lock on ``.lock`` so several viewers of
+    one experiment do not interleave their writes.
+    """
+
+    BLOCK_ENTRIES = 2000
+    FLUSH_INTERVAL = 30  # seconds
+    SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, project_id: int, experiment_group_code: str, version: str, root: Optional[Path] = None):
+        self.project_id = project_id
+        self.experiment_group_code = experiment_group_code
+        self.version = version
+        root = Path(root) if root is not None else LOGS_DIR
+        self.path = root / self._safe_name(project_id) / self._safe_name(experiment_group_code) / self._safe_name(version)
+        self.index_file = self.path / "index.jsonl"
+        self.state_file = self.path / "state.json"
+        self.lock_file = self.path / ".lock"
+        self._blocks: Optional[List[Dict[str, Any]]] = None
+        self._state: Optional[Dict[str, Any]] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_tail_state: Optional[Dict[str, Any]] = None
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _safe_name(value: Any) -> str:
+        return re.sub(r"[^A-Za-z0-9._-]", "_", str(value)) or "_"
+
+    @property
+    def blocks(self) -> List[Dict[str, Any]]:
+        if self._blocks is None:
+            self._blocks = []
+            if self.index_file.exists():
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            self._blocks.append(json.loads(line))
+                        except ValueError:
+                            # Partially written line from an interrupted flush
+                            continue
+        return self._blocks
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        if self._state is None:
+            self._state = {}
+            if self.state_file.exists():
+                try:
+                    self._state = json.loads(self.state_file.read_text(encoding="utf-8"))
+                except ValueError:
+                    self._state = {}
+        return self._state
+
+    @property
+    def entry_count(self) -> int:
+        """Number of entries archived, including ones not flushed yet."""
+        return sum(block['count'] for block in self.blocks) + len(self._pending)
+
+    def sync(self, tail) -> int:
+        """
+        Bring the archive up to date from the server.
+
+        Args:
+            tail: LogTail for the same experiment; it is moved to the archived
+                position before polling so only missing logs are fetched
+
+        Returns:
+            Number of entries added
+        """
+        self.resume(tail)
+        update = tail.poll()
+        if update.reset:
+            self.reset()
+        self.append(update.logs, tail.get_state())
+        self.flush()
+        return len(update.logs)
+
+    def resume(self, tail) -> None:
+        """Move a LogTail to the position of the last archived entry."""
+        tail_state = self._pending_tail_state or self._archived_tail()
+        if tail_state:
+            tail.set_state(tail_state)
+
+    def _archived_tail(self) -> Optional[Dict[str, Any]]:
+        # Blocks indexed after state.json was last written carry a newer position
+        for block in reversed(self.blocks[self.state.get('blocks', 0):]):
+            if 'tail' in block:
+                return block['tail']
+        return self.state.get('tail')
+
+    def append(self, logs: Iterable[Dict[str, Any]], tail_state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Queue log entries for the archive.
+
+        Entries are written as one block once BLOCK_ENTRIES are queued or
+        FLUSH_INTERVAL has passed since the last write, so frequent small
+        polls do not produce tiny blocks.
+        """
+        self._pending.extend(logs)
+        if tail_state is not None:
+            self._pending_tail_state = tail_state
+        if len(self._pending) >= self.BLOCK_ENTRIES or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write queued entries and the tail position to disk."""
+        self._last_flush = time.monotonic()
+        if not self._pending and self._pending_tail_state is None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        pending, self._pending = self._pending, []
+        tail_state, self._pending_tail_state = self._pending_tail_state, None
+        with self._locked():
+            # Another process may have written since the index was read
+            self._blocks = None
+            self._state = None
+            starts = range(0, len(pending), self.BLOCK_ENTRIES)
+            for start in starts:
+                last = start == starts[-1]
+                self._write_block(pending[start:start + self.BLOCK_ENTRIES], tail_state if last else None)
+            if tail_state is not None:
+                self.state['tail'] = tail_state
+            self.state['blocks'] = len(self.blocks)
+            self._write_state()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_file, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def reset(self) -> None:
+        """Drop everything archived, e.g. after the server log was replaced."""
+        self._pending = []
+        self._pending_tail_state = None
+        self._blocks = []
+        self._state = {}
+        if self.path.exists():
+            shutil.rmtree(self.path)
+
+    def _write_block(self, entries: List[Dict[str, Any]], tail_state: Optional[Dict[str, Any]] = None) -> None:
+        payload = zlib.compress("\n".join(_encoder.encode(entry) for entry in entries).encode("utf-8"))
+        segment = max([self.state.get('segment', 0)] + [block['segment'] for block in self.blocks[-1:]])
+        segment_file = self._segment_file(segment)
+        if segment_file.exists() and segment_file.stat().st_size + len(payload) > self.SEGMENT_MAX_BYTES:
+            segment += 1
+            segment_file = self._segment_file(segment)
+            self.state['segment'] = segment
+
+        with open(segment_file, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(payload)
+
+        levels: Dict[str, int] = {}
+        sources: Dict[str, int] = {}
+        start = end = None
+        for entry in entries:
+            level = str(entry.get('level', '')).upper()
+            source = str(entry.get('source', ''))
+            levels[level] = levels.get(level, 0) + 1
+            sources[source] = sources.get(source, 0) + 1
+            timestamp = log_timestamp(entry)
+            if timestamp is not None:
+                start = timestamp if start is None else min(start, timestamp)
+                end = timestamp if end is None else max(end, timestamp)
+
+        block = {
+            'segment': segment,
+            'offset': offset,
+            'length': len(payload),
+            'first': sum(b['count'] for b in self.blocks),
+            'count': len(entries),
+            'start': start,
+            'end': end,
+            'levels': levels,
+            'sources': sources,
+        }
+        if tail_state is not None:
+            block['tail'] = tail_state
+        # The block is on disk before it is indexed, so a crash never leaves
+        # an index entry pointing at missing data
+        with open(self.index_file, "ab") as f:
+            self._drop_partial_line(f)
+            f.write(_encoder.encode(block).encode("utf-8") + b"\n")
+        self.blocks.append(block)
+
+    @staticmethod
+    def _drop_partial_line(f) -> None:
+        """Cut a line left unfinished by an interrupted write, so new lines start clean."""
+        size = f.seek(0, os.SEEK_END)
+        with open(f.name, "rb") as reader:
+            end = size
+            while end > 0:
+                start = max(0, end - 64 * 1024)
+                reader.seek(start)
+                data = reader.read(end - start)
+                if end == size and data.endswith(b"\n"):
+                    return
+                cut = data.rfind(b"\n")
+                if cut >= 0:
+                    end = start + cut + 1
+                    break
+                end = start
+        if end < size:
+            f.truncate(end)
+            f.seek(0, os.SEEK_END)
+
+    def _write_state(self) -> None:
+        temp_file = self.state_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(self.state), encoding="utf-8")
+        os.replace(temp_file, self.state_file)
+
+    def _segment_file(self, segment: int) -> Path:
+        return self.path / f"segment-{segment:05d}.log.z"
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None,
+              levels: Optional[Iterable[str]] = None, sources: Optional[Iterable[str]] = None,
+              pattern: Optional[Pattern] = None, tail: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over archived entries matching all of the given filters.
+
+        Args:
+            since: Only entries at or after this Unix timestamp
+            until: Only entries at or before this Unix timestamp
+            levels: Only entries with one of these levels (case-insensitive)
+            sources: Only entries from one of these sources
+            pattern: Only entries whose message matches this compiled regex
+            tail: Only the last N matching entries
+
+        Returns:
+            Iterator of log entries in archive order
+        """
+        self.flush()
+        levels = {level.upper() for level in levels} if levels else None
+        sources = set(sources) if sources else None
+        blocks = [
+            block for block in self.blocks
+            if self._block_may_match(block, since, until, levels, sources)
+        ]
+
+        def entries(block):
+            return self._filter_block(block, since, until, levels, sources, pattern)
+
+        if tail is None:
+            return (entry for block in blocks for entry in entries(block))
+        if tail <= 0:
+            return iter(())
+
+        # Walk blocks newest first and stop once enough entries are found
+        collected: List[List[Dict[str, Any]]] = []
+        found = 0
+        for block in reversed(blocks):
+            matched = list(entries(block))
+            if matched:
+                collected.append(matched)
+                found += len(matched)
+                if found >= tail:
+                    break
+        result = [entry for matched in reversed(collected) for entry in matched]
+        return iter(result[-tail:])
+
+    def iter_block_texts(self, since: Optional[float] = None, until: Optional[float] = None,
+                         levels: Optional[Iterable[str]] = None,
+                         sources: Optional[Iterable[str]] = None) -> Iterator[str]:
+        """
+        Iterate over the raw JSON-lines text of every block that may match.
+
+        Blocks are only pruned using the index; callers that need exact
+        filtering (e.g. bulk loaders) apply it themselves.
+        """
+        self.flush()
+        levels = {level.upper() for level in levels} if levels else None
+        sources = set(sources) if sources else None
+        for block in self.blocks:
+            if self._block_may_match(block, since, until, levels, sources):
+                yield self._read_block(block)
+
+    @staticmethod
+    def _block_may_match(block: Dict[str, Any], since, until, levels, sources) -> bool:
+        if since is not None and block['end'] is not None and block['end'] < since:
+            return False
+        if until is not None and block['start'] is not None and block['start'] > until:
+            return False
+        if levels is not None and not levels.intersection(block['levels']):
+            return False
+        if sources is not None and not sources.intersection(block['sources']):
+            return False
+        return True
+
+    def _read_block(self, block: Dict[str, Any]) -> str:
+        with open(self._segment_file(block['segment']), "rb") as f:
+            f.seek(block['offset'])
+            return zlib.decompress(f.read(block['length'])).decode("utf-8")
+
+    def _filter_block(self, block: Dict[str, Any], since, until, levels, sources,
+                      pattern: Optional[Pattern]) -> Iterator[Dict[str, Any]]:
+        text = self._read_block(block)
+        if pattern is not None and _is_literal(pattern) and not pattern.search(text):
+            # A literal absent from the raw block text is absent from every message in it
+            return
+        # Per-entry time checks are only needed when the block straddles a bound
+        check_since = since is not None and (block['start'] is None or block['start'] < since)
+        check_until = until is not None and (block['end'] is None or block['end'] > until)
+        for line in text.split("\n"):
+            entry = json.loads(line)
+            if levels is not None and str(entry.get('level', '')).upper() not in levels:
+                continue
+            if sources is not None and str(entry.get('source', '')) not in sources:
+                continue
+            if pattern is not None and not pattern.search(str(entry.get('message', ''))):
+                continue
+            if check_since or check_until:
+                timestamp = log_timestamp(entry)
+                if timestamp is None:
+                    continue
+                if check_since and timestamp < since:
+                    continue
+                if check_until and timestamp > until:
+                    continue
+            yield entry
@@ -0,0 +1,221 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+import json
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Pattern
+
+LOG_COLUMNS = ("timestamp", "level", "source", "message")
+
+# Applied in this order; ids before numbers because ids contain digits
+_MASKS = [
+    (re.compile(r"[/\\][\w.\-]+(?:[/\\][\w.\-]+)+"), "<path>"),
+    (re.compile(r"\b(?:0x[0-9a-fA-F]+|[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|[0-9a-fA-F]{12,})\b"), "<id>"),
+    (re.compile(r"\d+(?:\.\d+)?(?:[eE][-+]?\d+)?"), "<num>"),
+]
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+
+BUCKETS = ["1min", "5min", "15min", "30min", "1h", "3h", "6h", "12h", "1D", "7D"]
+LEVEL_ORDER = ["ERROR", "WARNING", "INFO", "DEBUG"]
+
+
+def load_log_frame(block_texts: Iterable[str]):
+    """
+    Build a columnar frame from JSON-lines log text (e.g. LogArchive blocks).
+
+    Each block is decoded with a single json.loads call and the frame is
+    built from the decoded records in one go, which is several times faster
+    than one json.loads per line or pandas.read_json.
+
+    Returns:
+        DataFrame with a UTC 'timestamp', categorical 'level' and 'source',
+        and 'message'
+    """
+    import pandas as pd
+
+    records: List[Dict[str, Any]] = []
+    for text in block_texts:
+        if text:
+            records.extend(json.loads("[" + text.replace("\n", ",") + "]"))
+
+    frame = pd.DataFrame(records, columns=list(LOG_COLUMNS))
+    frame["timestamp"] = parse_timestamps(frame["timestamp"])
+    # Categorical first so only the handful of distinct levels are upper-cased
+    frame["level"] = frame["level"].fillna("UNKNOWN").astype(str).astype("category").map(str.upper).astype("category")
+    frame["source"] = frame["source"].fillna("Unknown").astype(str).astype("category")
+    frame["message"] = frame["message"].fillna("").astype(str)
+    return frame
+
+
+def parse_timestamps(values):
+    """
+    Parse ISO 8601 timestamps to UTC datetimes, unparseable values becoming NaT.
+
+    The archive stores UTC timestamps, so when every value carries a UTC
+    suffix it is stripped and numpy parses the rest, which is about three
+    times faster than pandas' per-element ISO 8601 parser with offsets.
+    Anything else takes the general path.
+    """
+    import numpy as np
+    import pandas as pd
+
+    strings = values.tolist()
+    for suffix in ("+00:00", "Z"):
+        if strings and all(isinstance(value, str) and value.endswith(suffix) for value in strings):
+            cut = -len(suffix)
+            try:
+                parsed = np.array([value[:cut] for value in strings], dtype="datetime64[us]")
+            except ValueError:
+                break
+            return pd.Series(parsed, index=values.index).dt.tz_localize("UTC")
+    return pd.to_datetime(values, utc=True, format="ISO8601", errors="coerce")
+
+
+def filter_log_frame(frame, since: Optional[float] = None, until: Optional[float] = None,
+                     levels: Optional[Iterable[str]] = None, sources: Optional[Iterable[str]] = None,
+                     pattern: Optional[Pattern] = None):
+    """Apply the `experiments logs` filters to a log frame with vectorized masks."""
+    import pandas as pd
+
+    mask = pd.Series(True, index=frame.index)
+    if since is not None:
+        mask &= frame["timestamp"] >= pd.Timestamp(since, unit="s", tz="UTC")
+    if until is not None:
+        mask &= frame["timestamp"] <= pd.Timestamp(until, unit="s", tz="UTC")
+    if levels:
+        mask &= frame["level"].isin([level.upper() for level in levels])
+    if sources:
+        mask &= frame["source"].isin(list(sources))
+    if pattern is not None:
+        mask &= frame["message"].str.contains(pattern, regex=True)
+    return frame[mask] if not mask.all() else frame
+
+
+def mask_templates(messages):
+    """
+    Turn messages into templates with numbers, ids and paths masked.
+
+    Digits are first collapsed to '0' with str.translate. That does not
+    change what the masks match, but it makes most messages that differ
+    only in their numbers identical, so the regexes run once per distinct
+    shape instead of once per line.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # Work on one big string; NUL separates messages so embedded newlines can be flattened
+    values = messages.tolist()
+    shapes = "\0".join(values).replace("\n", " ").translate(_DIGITS_TO_ZERO).split("\0")
+    if len(shapes) != len(values):
+        shapes = [value.replace("\0", " ").replace("\n", " ").translate(_DIGITS_TO_ZERO) for value in values]
+    codes, uniques = pd.factorize(np.array(shapes, dtype=object))
+    templates = "\n".join(uniques)
+    for mask, replacement in _MASKS:
+        templates = mask.sub(replacement, templates)
+    templates = pd.Index(templates.split("\n"))
+    return pd.Series(templates.take(codes), index=messages.index)
+
+
+def choose_bucket(start, end, max_rows: int) -> str:
+    """Smallest bucket from BUCKETS that splits start..end into at most max_rows rows."""
+    import pandas as pd
+
+    span = end - start
+    for bucket in BUCKETS:
+        if span / pd.Timedelta(bucket) < max_rows:
+            return bucket
+    return BUCKETS[-1]
+
+
+def compute_log_stats(frame, top: int = 10, max_timeline_rows: int = 24,
+                      now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Summarize a log frame.
+
+    Args:
+        frame: Frame from load_log_frame
+        top: Number of sources and message templates to report
+        max_timeline_rows: Per-minute counts are re-binned to fit this many rows
+        now: Current Unix time, for how long ago the last line was logged
+
+    Returns:
+        Dictionary with 'total', 'first', 'last', 'idle', 'levels',
+        'timeline' (bucketed counts by level), 'bucket', 'sources',
+        'templates', 'gaps' (longest pauses between lines) and 'gap_threshold'
+    """
+    import pandas as pd
+
+    now = pd.Timestamp(now if now is not None else time.time(), unit="s", tz="UTC")
+    timed = frame.dropna(subset=["timestamp"]).sort_values("timestamp", kind="stable")
+    stats: Dict[str, Any] = {
+        "total": len(frame),
+        "untimed": len(frame) - len(timed),
+        "levels": frame["level"].value_counts().loc[lambda counts: counts > 0],
+    }
+    if timed.empty:
+        stats.update(first=None, last=None, idle=None, timeline=None, bucket=None, gaps=None, gap_threshold=None)
+    else:
+        first, last = timed["timestamp"].iloc[0], timed["timestamp"].iloc[-1]
+        stats.update(first=first, last=last, idle=now - last)
+
+        per_minute = (
+            timed.groupby([pd.Grouper(key="timestamp", freq="1min"), "level"], observed=True)
+            .size().unstack(fill_value=0)
+        )
+        bucket = choose_bucket(first, last, max_timeline_rows)
+        timeline = per_minute.resample(bucket).sum() if bucket != "1min" else per_minute.asfreq("1min", fill_value=0)
+        ordered = [level for level in LEVEL_ORDER if level in timeline.columns]
+        timeline = timeline[ordered + [level for level in timeline.columns if level not in ordered]]
+        timeline.insert(0, "total", timeline.sum(axis=1))
+        stats.update(timeline=timeline, bucket=bucket)
+
+        # A gap is a pause well beyond the usual spacing between lines
+        deltas = timed["timestamp"].diff()
+        typical_gap = deltas.median() if len(deltas) > 1 else pd.Timedelta(0)
+        gap_threshold = max(pd.Timedelta(minutes=1), typical_gap * 10)
+        gaps = pd.DataFrame({"start": timed["timestamp"].shift(), "end": timed["timestamp"], "gap": deltas})
+        stats.update(
+            gaps=gaps[gaps["gap"] > gap_threshold].nlargest(5, "gap"),
+            gap_threshold=gap_threshold,
+        )
+
+    errors = frame["level"] == "ERROR"
+    by_source = frame.assign(errors=errors).groupby("source", observed=True).agg(
+        lines=("message", "size"), errors=("errors", "sum"),
+        first=("timestamp", "min"), last=("timestamp", "max"),
+    )
+    stats["sources"] = by_source.nlargest(top, "lines")
+
+    templated = frame.assign(template=mask_templates(frame["message"]))
+    by_template = templated.groupby("template", sort=False).agg(
+        count=("message", "size"), first=("timestamp", "min"), last=("timestamp", "max"),
+    ).nlargest(top, "count")
+    # Most common level, computed only for the templates that are reported
+    top_rows = templated[templated["template"].isin(by_template.index)]
+    level_counts = top_rows.groupby(["template", "level"], observed=True).size()
+    if len(level_counts):
+        by_template["level"] = level_counts.groupby(level=0).idxmax().map(lambda key: key[1])
+    else:
+        by_template["level"] = ""
+    stats["templates"] = by_template
+    return stats
@@ -0,0 +1,329 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import atexit
+import functools
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from agentcore.managers.client import APIClient, APIError
+from agentcore.utils.config import METRICS_BATCH_POST
+
+# Failures worth retrying: no response at all, throttling and server errors
+RETRYABLE_STATUS = {None, 408, 425, 429, 500, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values json does not know: numpy scalars and arrays, datetimes, sets."""
+    if hasattr(value, "tolist"):
+        # numpy scalars and arrays (and torch tensors) turn into plain Python values
+        return value.tolist()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_encoder = json.JSONEncoder(default=_json_default)
+
+
+class MetricsWriter:
+    """
+    Non-blocking, batched writer for metrics and events from training code.
+
+    ``log()`` only stamps the record and appends it to an in-memory queue; a
+    background thread sends queued records in batches once ``batch_size``
+    records are waiting or ``flush_interval`` seconds have passed, so the
+    training loop never waits on a round trip.
+
+    Memory is bounded by ``max_pending``. When the server cannot keep up the
+    queue fills and ``log()`` blocks for up to ``block_timeout`` seconds
+    (backpressure), after which the oldest queued record is dropped.
+
+    Every record carries a client-generated ``record_id`` and every batch a
+    ``batch_id`` sent as the Idempotency-Key header, so retried batches can
+    be de-duplicated by the server. If the server has no batch endpoint
+    (404/405) batches are not retried: they are dropped with a warning
+    naming the endpoint, and ``last_error`` says so.
+
+    Pending records are flushed on ``close()``, when used as a context
+    manager and at interpreter exit.
+    """
+
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL = 2.0
+    MAX_PENDING = 100_000
+    BLOCK_TIMEOUT = 1.0
+    MAX_RETRIES = 5
+    RETRY_BACKOFF = 0.5
+    MAX_RETRY_DELAY = 30.0
+
+    def __init__(
+        self,
+        api_client: APIClient,
+        endpoint: str = METRICS_BATCH_POST,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        block_timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        defaults: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            api_client: Client used to send batches
+            endpoint: Endpoint accepting ``{"batch_id", "records": [...]}``
+            batch_size: Records sent per request
+            flush_interval: Longest time a record waits before being sent
+            max_pending: Most records held in memory
+            block_timeout: How long ``log()`` waits for room before dropping
+                the oldest record; 0 never blocks
+            max_retries: Attempts per batch before it is given up
+            defaults: Fields added to every record (e.g. experiment_id)
+        """
+        self.api_client = api_client
+        self.endpoint = endpoint
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.flush_interval = self.FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.max_pending = max(max_pending or self.MAX_PENDING, self.batch_size)
+        self.block_timeout = self.BLOCK_TIMEOUT if block_timeout is None else block_timeout
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self.defaults = dict(defaults or {})
+
+        # Record ids are a per-writer random prefix plus a counter, much cheaper than a uuid each
+        self._id_prefix = uuid.uuid4().hex[:16]
+        self._ids = itertools.count()
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.retries = 0
+        self.last_error: Optional[str] = None
+
+        self._thread = threading.Thread(target=self._run, name="agentcore-metrics-writer", daemon=True)
+        self._thread.start()
+        # A hook per writer, so close() removes this writer's alone
+        self._atexit_hook = functools.partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit_hook)
+
+    def log(self, record: Dict[str, Any]) -> None:
+        """
+        Queue one record. Returns immediately unless the queue is full.
+
+        The record gets a ``record_id``, a ``timestamp`` and the writer's
+        defaults unless it sets them itself; the caller's dict is not modified.
+        """
+        if self._closed:
+            raise RuntimeError("MetricsWriter is closed")
+        record = {"record_id": f"{self._id_prefix}-{next(self._ids)}", "timestamp": time.time(), **self.defaults, **record}
+
+        queue = self._queue
+        if len(queue) >= self.max_pending:
+            self._wait_for_room()
+        # deque.append is atomic; the lock is only taken to wake the sender
+        queue.append(record)
+        if len(queue) == self.batch_size:
+            with self._cond:
+                self._cond.notify_all()
+
+    def log_metrics(self, metrics: Dict[str, Any], step: Optional[int] = None, **fields) -> None:
+        """Queue a metrics record, e.g. ``log_metrics({"loss": 0.3}, step=120)``."""
+        record = {"type": "metrics", "metrics": metrics, **fields}
+        if step is not None:
+            record["step"] = step
+        self.log(record)
+
+    def log_event(self, event: str, **fields) -> None:
+        """Queue an event record, e.g. ``log_event("checkpoint_saved", path=...)``."""
+        self.log({"type": "event", "event": event, **fields})
+
+    def _wait_for_room(self):
+        deadline = time.monotonic() + self.block_timeout
+        with self._cond:
+            self._cond.notify_all()
+            while len(self._queue) >= self.max_pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    try:
+                        self._queue.popleft()
+                        self.dropped += 1
+                    except IndexError:
+                        pass
+                    break
+                self._cond.wait(remaining)
+
+    @property
+    def pending(self) -> int:
+        """Records queued or being sent."""
+        return len(self._queue) + self._in_flight
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send everything queued so far and wait for it.
+
+        Returns:
+            True if the queue drained before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._queue or self._in_flight:
+                if not self._thread.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining if remaining is not None else 0.5)
+        return True
+
+    def close(self, timeout: Optional[float] = 30.0) -> bool:
+        """Flush pending records and stop the background thread."""
+        if self._closed:
+            return True
+        drained = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        atexit.unregister(self._atexit_hook)
+        return drained
+
+    def __enter__(self) -> "MetricsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if len(self._queue) >= self.batch_size or self._flush_requested:
+                        break
+                    remaining = next_flush - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed and not self._queue:
+                    return
+                self._flush_requested = False
+                count = min(len(self._queue), self.batch_size)
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                # Blocked producers can continue now
+                self._cond.notify_all()
+
+            if batch:
+                self._send(batch)
+            with self._cond:
+                self._in_flight = 0
+                if self._queue:
+                    # More is waiting (e.g. a backlog after a slow request): keep going
+                    self._flush_requested = True
+                else:
+                    next_flush = time.monotonic() + self.flush_interval
+                self._cond.notify_all()
+
+    def _send(self, batch: List[Dict[str, Any]]):
+        batch_id = uuid.uuid4().hex
+        body = self._encode(batch_id, batch)
+        if body is None:
+            return
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.api_client.post_body(
+                    self.endpoint, body,
+                    headers={"Content-Type": "application/json", "Idempotency-Key": batch_id},
+                )
+                self.sent += len(batch)
+                self.batches += 1
+                return
+            except APIError as e:
+                self.last_error = e.message
+                if e.status_code in (404, 405):
+                    self.last_error = f"batch endpoint {self.endpoint} is not available ({e.status_code}): {e.message}"
+                # A 401 after a successful token refresh asks for the request to be repeated
+                refreshed = e.status_code == 401 and e.message == "Given token not valid for any token type"
+                if (e.status_code not in RETRYABLE_STATUS and not refreshed) or attempt == self.max_retries:
+                    break
+            except Exception as e:
+                self.last_error = str(e)
+                if attempt == self.max_retries:
+                    break
+            self.retries += 1
+            delay = min(self.RETRY_BACKOFF * 2 ** attempt, self.MAX_RETRY_DELAY)
+            with self._cond:
+                if self._closed:
+                    break
+                self._cond.wait(delay * random.uniform(0.8, 1.2))
+        self._give_up(batch, attempt + 1)
+
+    def _encode(self, batch_id: str, batch: List[Dict[str, Any]]) -> Optional[bytes]:
+        try:
+            return _encoder.encode({"batch_id": batch_id, "records": batch}).encode("utf-8")
+        except (TypeError, ValueError):
+            pass
+        # Retrying cannot fix a record that does not encode: drop just those records
+        encodable = []
+        for record in batch:
+            try:
+                _encoder.encode(record)
+                encodable.append(record)
+            except (TypeError, ValueError) as e:
+                self.last_error = str(e)
+        dropped = len(batch) - len(encodable)
+        self.failed += dropped
+        logger.warning("Dropped %d metrics records that cannot be sent as JSON: %s", dropped, self.last_error)
+        batch[:] = encodable
+        if not batch:
+            return None
+        return _encoder.encode({"batch_id": batch_id, "records": batch}).encode("utf-8")
+
+    def _give_up(self, batch: List[Dict[str, Any]], attempts: int):
+        self.failed += len(batch)
+        logger.warning("Dropped %d metrics records after %d attempt(s): %s", len(batch), attempts, self.last_error)
+
+
+def _close_at_exit(writer_ref):
+    writer = writer_ref()
+    if writer is not None:
+        writer.close(timeout=10.0)
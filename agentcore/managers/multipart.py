@@ -0,0 +1,129 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import os
+import uuid
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Called with (bytes sent so far, total bytes) as the body is streamed
+ProgressCallback = Callable[[int, int], None]
+
+
+class MultipartEncoder:
+    """
+    Streams a multipart/form-data body instead of building it in memory.
+
+    Accepts the same ``data`` and ``files`` arguments as requests: form
+    fields as a dict (list values repeat the field) and files as a dict of
+    file objects or ``(filename, fileobj[, content_type])`` tuples. File
+    contents are read ``chunk_size`` bytes at a time while the request is
+    sent, so memory use does not grow with the file size. The total length
+    is known up front and sent as Content-Length.
+
+    The body can be iterated again (e.g. when a request is retried); each
+    pass rewinds the files to where they started.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, fields: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None,
+                 chunk_size: Optional[int] = None, callback: Optional[ProgressCallback] = None):
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.callback = callback
+        # Each part is (header and inline bytes, file object or None, file start offset, file length)
+        self._parts: List[Tuple[bytes, Optional[IO[bytes]], int, int]] = []
+
+        for name, value in (fields or {}).items():
+            for item in value if isinstance(value, (list, tuple)) else [value]:
+                if item is None:
+                    continue
+                body = item if isinstance(item, bytes) else str(item).encode("utf-8")
+                self._parts.append((self._header(name) + body + b"\r\n", None, 0, 0))
+
+        for name, value in (files or {}).items():
+            file_name, file, content_type = self._file_spec(value)
+            start = file.tell()
+            length = os.fstat(file.fileno()).st_size - start
+            self._parts.append((self._header(name, file_name, content_type), file, start, length))
+
+        self._closing = f"--{self.boundary}--\r\n".encode()
+        # File parts are followed by the CRLF that ends the part
+        self.length = sum(len(head) + length + (2 if file else 0) for head, file, _, length in self._parts)
+        self.length += len(self._closing)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        for head, file, start, length in self._parts:
+            yield head
+            sent += len(head)
+            if file is None:
+                continue
+            file.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    raise IOError(f"{getattr(file, 'name', 'file')} shrank while it was being uploaded")
+                remaining -= len(chunk)
+                sent += len(chunk)
+                yield chunk
+                if self.callback:
+                    self.callback(sent, self.length)
+            yield b"\r\n"
+            sent += 2
+        yield self._closing
+        if self.callback:
+            self.callback(self.length, self.length)
+
+    def _header(self, name: str, file_name: Optional[str] = None, content_type: Optional[str] = None) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if file_name is not None:
+            disposition += f'; filename="{_quote(file_name)}"'
+        lines = [f"--{self.boundary}", f"Content-Disposition: {disposition}"]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+    @staticmethod
+    def _file_spec(value: Any) -> Tuple[str, IO[bytes], Optional[str]]:
+        # Same rules as requests: a bare file object is named after its path and has no Content-Type
+        if isinstance(value, (list, tuple)):
+            file_name, file = value[0], value[1]
+            content_type = value[2] if len(value) > 2 else None
+        else:
+            file = value
+            file_name = os.path.basename(getattr(file, "name", "file"))
+            content_type = None
+        return str(file_name), file, content_type
+
+
+def _quote(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\r", "").replace("\n", "")
@@ -0,0 +1,167 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+import random
+import threading
+import time
+from typing import Any, Optional
+
+
+class Poller:
+    """
+    Adaptive delay for one watch loop.
+
+    After a poll that saw a change the next poll comes after ``min_interval``.
+    Each idle or failed poll multiplies the delay by ``backoff`` up to
+    ``max_interval``. Delays are jittered so many watchers do not poll in
+    lockstep, and every poll takes a slot from the shared PollScheduler.
+    """
+
+    def __init__(self, scheduler: "PollScheduler", min_interval: float, max_interval: float,
+                 backoff: float = 1.5, jitter: float = 0.2):
+        self.scheduler = scheduler
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.delay = min_interval
+        self.next_due = time.monotonic()
+        self.polls = 0
+        self._last_value: Any = None
+        self._cancelled = threading.Event()
+
+    def observe(self, value: Any) -> bool:
+        """Remember the latest poll result and return True if it differs from the previous one."""
+        changed = self.polls == 0 or value != self._last_value
+        self._last_value = value
+        self.polls += 1
+        return changed
+
+    def schedule(self, changed: bool = False, failed: bool = False) -> float:
+        """
+        Work out when the next poll is due without waiting for it.
+
+        Args:
+            changed: The last poll returned something new
+            failed: The last poll raised an error; backs off like an idle poll
+
+        Returns:
+            Seconds until the next poll
+        """
+        if changed and not failed:
+            self.delay = self.min_interval
+        else:
+            self.delay = min(self.delay * self.backoff, self.max_interval)
+        delay = self.delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.next_due = time.monotonic() + delay
+        return delay
+
+    def due(self) -> bool:
+        return time.monotonic() >= self.next_due
+
+    def wait(self, changed: bool = False, failed: bool = False) -> bool:
+        """
+        Sleep until the next poll is due and a request slot is free.
+
+        Ctrl+C interrupts the wait as usual; cancel() wakes it from other threads.
+
+        Returns:
+            False if the poller was cancelled, True otherwise
+        """
+        delay = self.schedule(changed=changed, failed=failed)
+        if self._cancelled.wait(delay):
+            return False
+        return self.acquire()
+
+    def acquire(self) -> bool:
+        """Take a request slot from the shared scheduler; False if cancelled."""
+        return self.scheduler.acquire(self._cancelled)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+class PollScheduler:
+    """
+    Process-wide pacing for every watch loop (logs, status trackers, task polling).
+
+    Each loop gets its own adaptive Poller. All pollers share one token
+    bucket, so the total request rate of all watchers in the process stays
+    under ``MAX_REQUESTS_PER_SECOND`` however many are running.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_REQUESTS_PER_SECOND = 10.0
+    BURST = 10
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        self.rate = rate or self.MAX_REQUESTS_PER_SECOND
+        self.burst = burst or self.BURST
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "PollScheduler":
+        """Return the process-wide scheduler, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def poller(self, min_interval: float = 1.0, max_interval: float = 30.0, **kwargs) -> Poller:
+        """
+        Create a Poller for one watch loop.
+
+        Args:
+            min_interval: Delay in seconds while results keep changing
+            max_interval: Longest delay reached by backing off while idle
+            **kwargs: backoff and jitter overrides passed to Poller
+
+        Returns:
+            Poller
+        """
+        return Poller(self, min_interval, max_interval, **kwargs)
+
+    def acquire(self, cancelled: Optional[threading.Event] = None) -> bool:
+        """Block until a request slot is free. Returns False if ``cancelled`` is set first."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if cancelled is not None:
+                if cancelled.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
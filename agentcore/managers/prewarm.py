@@ -0,0 +1,64 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+import threading
+
+from agentcore.managers.config import ConfigManager
+
+
+def start_prewarm():
+    """
+    Open the API connection on a background thread if prewarming is enabled.
+
+    Called at CLI startup, before the command modules are imported, so the
+    DNS, TCP and TLS handshakes overlap with imports and the first prompt.
+    The API client is imported and built here on the main thread; the
+    background thread only opens the connection, so it never imports
+    modules while the main thread does.
+    Enabled with 'agentcore config prewarm on' or AGENTCORE_PREWARM=1.
+
+    Returns:
+        The started thread, or None when prewarming is disabled.
+    """
+    try:
+        config = ConfigManager()
+    except Exception:
+        return None
+    if not config.url() or not config.prewarm_enabled():
+        return None
+    try:
+        from agentcore.managers.base import BaseManager
+        api_client = BaseManager(config_manager=config).api_client
+    except Exception:
+        return None
+
+    thread = threading.Thread(target=_prewarm, args=(api_client,), name="agentcore-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def _prewarm(api_client):
+    try:
+        api_client.prewarm()
+    except Exception:
+        # Prewarming is best effort; the first request connects as usual
+        pass
@@ -0,0 +1,234 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+import threading
+import time
+from itertools import count
+from typing import Dict, Optional
+
+from rich.console import Console
+from rich.live import Live
+from rich.spinner import Spinner
+from rich.table import Table
+from rich.text import Text
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressTask:
+    """
+    Handle for one unit of work registered with the ProgressHub.
+
+    Use as a context manager; the task is removed from the display on exit.
+    """
+
+    def __init__(self, hub: "ProgressHub", task_id: int, description: str, total: Optional[float] = None):
+        self.hub = hub
+        self.task_id = task_id
+        self.description = description
+        self.total = total
+        self.completed = 0
+        self.started_at = time.monotonic()
+
+    def update(self, description: Optional[str] = None, total: Optional[float] = None) -> None:
+        """Change the description or total shown for this task."""
+        if description is not None:
+            self.description = description
+        if total is not None:
+            self.total = total
+
+    def advance(self, amount: float = 1) -> None:
+        """Record completed units of work (files, rows, bytes...)."""
+        with self.hub._lock:
+            self.completed += amount
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def finish(self) -> None:
+        self.hub._finish(self)
+
+    def __enter__(self) -> "ProgressTask":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.finish()
+
+
+class ProgressHub:
+    """
+    Process-wide progress display shared by every manager and command.
+
+    Tasks register with the hub instead of creating their own Rich Progress.
+    Nothing is drawn until a task has been running for longer than ``delay``
+    seconds, so millisecond API calls never touch the terminal. While work is
+    running, all concurrent tasks share one Live display with counts,
+    throughput and ETA. The hub stays silent on non-TTY output or when quiet.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    DELAY = 0.25
+    MAX_VISIBLE_TASKS = 6
+    REFRESH_PER_SECOND = 10
+
+    def __init__(self, console: Optional[Console] = None, delay: Optional[float] = None):
+        self.console = console or Console()
+        self.delay = self.DELAY if delay is None else delay
+        self.quiet = False
+        self._tasks: Dict[int, ProgressTask] = {}
+        self._ids = count(1)
+        self._lock = threading.RLock()
+        # Serializes starting and stopping the Live display; never held while rendering
+        self._display_lock = threading.Lock()
+        self._live: Optional[Live] = None
+        self._timer: Optional[threading.Timer] = None
+        self._spinner = Spinner("dots", style="progress.spinner")
+        self._session_started = None
+        self._tasks_done = 0
+
+    @classmethod
+    def instance(cls) -> "ProgressHub":
+        """Return the process-wide hub, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @property
+    def enabled(self) -> bool:
+        return not self.quiet and self.console.is_terminal
+
+    def set_quiet(self, quiet: bool = True) -> None:
+        """Turn the display off (e.g. for --quiet runs)."""
+        self.quiet = quiet
+        if quiet:
+            self._stop_display()
+
+    def task(self, description: str, total: Optional[float] = None) -> ProgressTask:
+        """
+        Register a task with the hub.
+
+        Args:
+            description: Text shown next to the spinner
+            total: Optional number of units, enabling per-task ETA
+
+        Returns:
+            ProgressTask usable as a context manager
+        """
+        with self._lock:
+            task = ProgressTask(self, next(self._ids), description, total)
+            if not self._tasks and self._live is None:
+                self._session_started = task.started_at
+                self._tasks_done = 0
+            self._tasks[task.task_id] = task
+            if self.enabled and self._live is None and self._timer is None:
+                self._schedule(self.delay)
+        return task
+
+    def _schedule(self, delay: float) -> None:
+        self._timer = threading.Timer(delay, self._maybe_start_display)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _finish(self, task: ProgressTask) -> None:
+        with self._lock:
+            if self._tasks.pop(task.task_id, None) is None:
+                return
+            self._tasks_done += 1
+            idle = not self._tasks
+        if idle:
+            self._stop_display()
+
+    def _maybe_start_display(self) -> None:
+        with self._display_lock:
+            with self._lock:
+                self._timer = None
+                if not self._tasks or self._live is not None or not self.enabled:
+                    return
+                oldest = min(task.started_at for task in self._tasks.values())
+                remaining = self.delay - (time.monotonic() - oldest)
+                if remaining > 0:
+                    self._schedule(remaining)
+                    return
+                self._live = Live(
+                    get_renderable=self._render,
+                    console=self.console,
+                    transient=True,
+                    refresh_per_second=self.REFRESH_PER_SECOND,
+                )
+                live = self._live
+            live.start()
+
+    def _stop_display(self) -> None:
+        with self._display_lock:
+            with self._lock:
+                if self._tasks and not self.quiet:
+                    return
+                live, self._live = self._live, None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if live is not None:
+                live.stop()
+
+    def _render(self) -> Table:
+        with self._lock:
+            tasks = sorted(self._tasks.values(), key=lambda task: task.started_at)
+            tasks_done = self._tasks_done
+            started = self._session_started or time.monotonic()
+        now = time.monotonic()
+
+        grid = Table.grid(padding=(0, 1))
+        grid.add_column()
+        grid.add_column()
+        for task in tasks[:self.MAX_VISIBLE_TASKS]:
+            detail = ""
+            if task.total:
+                detail = f" [cyan]{task.completed:g}/{task.total:g}[/cyan]"
+                rate = task.rate()
+                if rate > 0:
+                    detail += f" [dim]{rate:.1f}/s ETA {_format_duration((task.total - task.completed) / rate)}[/dim]"
+            elif task.completed:
+                detail = f" [cyan]{task.completed:g}[/cyan]"
+            grid.add_row(self._spinner, Text.from_markup(f"{task.description}{detail}"))
+
+        if len(tasks) > self.MAX_VISIBLE_TASKS:
+            grid.add_row("", Text(f"... and {len(tasks) - self.MAX_VISIBLE_TASKS} more", style="dim"))
+        if len(tasks) > 1 or tasks_done:
+            elapsed = now - started
+            summary = f"{len(tasks)} running | {tasks_done} done"
+            if elapsed > 0 and tasks_done:
+                summary += f" | {tasks_done / elapsed:.1f} tasks/s"
+            remaining = sum(task.total - task.completed for task in tasks if task.total)
+            rate = sum(task.rate() for task in tasks if task.total)
+            if remaining > 0 and rate > 0:
+                summary += f" | ETA {_format_duration(remaining / rate)}"
+            summary += f" | {_format_duration(elapsed)} elapsed"
+            grid.add_row("", Text(summary, style="dim"))
+        return grid
@@ -0,0 +1,282 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import json
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.exceptions import RequestException
+from urllib3.exceptions import HTTPError
+
+from agentcore.managers.client import APIClient, APIError
+from agentcore.managers.poll_scheduler import Poller, PollScheduler
+
+# Response header in which a server lists the push transports an endpoint supports
+TRANSPORT_HEADER = "X-Status-Stream"
+
+# Statuses meaning the server does not support what was asked for
+UNSUPPORTED_STATUSES = {400, 404, 405, 406, 501}
+
+
+class StatusChannel:
+    """
+    Delivers the updates of one status endpoint over the cheapest transport
+    the server offers.
+
+    The first fetch() is an ordinary GET. If its response carries
+    ``X-Status-Stream: sse`` the channel keeps one server-sent events stream
+    open and each fetch() returns the next event. With ``long-poll`` each
+    fetch() is a GET with ``?wait=`` and If-None-Match, which the server holds
+    until the status changes or the wait expires. Otherwise the endpoint is
+    polled with an adaptive Poller as before. A transport the server turns
+    out not to support drops the channel one step (SSE, long-poll, polling).
+
+    Loops use it in place of a Poller: fetch() for the next status, then
+    wait(changed=observe(...)) before fetching again. For push transports
+    wait() returns at once unless the last fetch failed.
+    """
+
+    POLL = "poll"
+    LONG_POLL = "long-poll"
+    SSE = "sse"
+
+    MAX_WAIT = 25
+    CONNECT_TIMEOUT = 10
+
+    def __init__(self, api_client: APIClient, endpoint: str, poller: Optional[Poller] = None,
+                 params: Optional[Dict[str, Any]] = None, wait: Optional[int] = None):
+        """
+        Args:
+            api_client: Client used for every request
+            endpoint: Status endpoint; may already carry a query string
+            poller: Poller used while polling and after failures
+            params: Extra query parameters, updated by fetch(params=...)
+            wait: Seconds the server may hold a long-poll request
+        """
+        self.api_client = api_client
+        self.endpoint = endpoint
+        self.poller = poller or PollScheduler.instance().poller(min_interval=1, max_interval=20)
+        self.params: Dict[str, Any] = dict(params or {})
+        self.wait_seconds = wait or self.MAX_WAIT
+        self.mode = self.POLL
+        self.offered: Tuple[str, ...] = ()
+        self.etag: Optional[str] = None
+        self.last: Optional[Dict[str, Any]] = None
+        # False when the last fetch() returned the previous response again
+        self.fresh = False
+        self.requests = 0
+        self.failed = False
+        self._discovered = False
+        self._stream: Optional[requests.Response] = None
+        self._events: Optional[Iterator[str]] = None
+        self._last_event_id: Optional[str] = None
+        self._dropped = False
+
+    @property
+    def delay(self) -> float:
+        return self.poller.delay
+
+    @property
+    def pushing(self) -> bool:
+        return self.mode != self.POLL
+
+    def observe(self, value: Any) -> bool:
+        return self.poller.observe(value)
+
+    def fetch(self, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the next status response.
+
+        Polling returns the current status right away. Long-poll and SSE block
+        until the server reports a change or the wait expires, in which case
+        the previous response is returned again.
+
+        Args:
+            params: Query parameters to update before the request (e.g. a log cursor)
+
+        Raises:
+            APIError: If the request fails
+        """
+        if params:
+            self.params.update(params)
+        self.fresh = False
+        try:
+            try:
+                response = self._fetch_once()
+            except APIError as e:
+                # The client refreshed an expired token; retry once with the new
+                # one, as BaseManager._execute_with_progress does
+                if e.status_code != 401 or "Given token not valid for any token type" not in str(e.message):
+                    raise
+                response = self._fetch_once()
+        except APIError as e:
+            self.failed = True
+            if self.mode != self.POLL and e.status_code in UNSUPPORTED_STATUSES:
+                self._downgrade()
+            raise
+        self.failed = False
+        return response
+
+    def _fetch_once(self) -> Optional[Dict[str, Any]]:
+        if self.mode == self.SSE:
+            return self._next_event()
+        return self._get(wait=self.mode == self.LONG_POLL)
+
+    def wait(self, changed: bool = False, failed: bool = False) -> bool:
+        """
+        Pause before the next fetch().
+
+        Returns:
+            False if the channel was closed, True otherwise
+        """
+        if self.mode == self.POLL or failed or self.failed or self._dropped:
+            self._dropped = False
+            return self.poller.wait(changed=changed, failed=failed or self.failed)
+        # The next fetch() blocks on the server; only take a request slot
+        return self.poller.acquire()
+
+    def close(self) -> None:
+        self._close_stream()
+        self.poller.cancel()
+
+    def _query(self, **extra) -> Optional[Dict[str, Any]]:
+        query = {key: value for key, value in {**self.params, **extra}.items() if value is not None}
+        return query or None
+
+    def _get(self, wait: bool = False) -> Optional[Dict[str, Any]]:
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        timeout = None
+        query = self._query()
+        if wait:
+            query = self._query(wait=self.wait_seconds)
+            timeout = (self.CONNECT_TIMEOUT, self.wait_seconds + self.CONNECT_TIMEOUT)
+        response = self.api_client.get_response(self.endpoint, params=query, headers=headers, timeout=timeout)
+        self.requests += 1
+        if not self._discovered:
+            self._discover(response)
+        return self._take(response)
+
+    def _take(self, response: requests.Response) -> Optional[Dict[str, Any]]:
+        if response.status_code == 304:
+            return self.last
+        self.etag = response.headers.get("ETag") or None
+        try:
+            self.last = response.json() if response.content.strip() else {}
+        except ValueError:
+            raise APIError(message="Invalid response format", status_code=response.status_code)
+        self.fresh = True
+        return self.last
+
+    def _discover(self, response: requests.Response) -> None:
+        self._discovered = True
+        self.offered = tuple(
+            token.strip().lower() for token in response.headers.get(TRANSPORT_HEADER, "").split(",") if token.strip()
+        )
+        if self.SSE in self.offered:
+            self.mode = self.SSE
+        elif self.LONG_POLL in self.offered:
+            self.mode = self.LONG_POLL
+
+    def _downgrade(self) -> None:
+        self._close_stream()
+        if self.mode == self.SSE and self.LONG_POLL in self.offered:
+            self.mode = self.LONG_POLL
+        else:
+            self.mode = self.POLL
+
+    def _connect(self) -> Optional[Dict[str, Any]]:
+        # Uncompressed, so events can be read as they arrive
+        headers = {"Accept": "text/event-stream", "Accept-Encoding": "identity", "Cache-Control": "no-cache"}
+        if self._last_event_id:
+            headers["Last-Event-ID"] = self._last_event_id
+        response = self.api_client.get_response(
+            self.endpoint, params=self._query(), headers=headers, stream=True,
+            timeout=(self.CONNECT_TIMEOUT, self.wait_seconds + self.CONNECT_TIMEOUT),
+        )
+        self.requests += 1
+        if "text/event-stream" not in response.headers.get("Content-Type", ""):
+            # An ordinary response after all: use it and stop asking for a stream
+            try:
+                return self._take(response)
+            finally:
+                response.close()
+                self._downgrade()
+        self._stream = response
+        self._events = self._iter_events(response)
+        return None
+
+    def _next_event(self) -> Optional[Dict[str, Any]]:
+        if self._events is None:
+            response = self._connect()
+            if self._events is None:
+                return response
+        try:
+            data = next(self._events)
+        except (StopIteration, RequestException, HTTPError, OSError):
+            # Stream closed or idle past the read timeout: reconnect on the next fetch
+            self._close_stream()
+            self._dropped = True
+            return self.last
+        try:
+            self.last = json.loads(data)
+        except ValueError:
+            raise APIError(message="Invalid event format")
+        self.fresh = True
+        return self.last
+
+    def _iter_events(self, response: requests.Response) -> Iterator[str]:
+        """Yield the data of each server-sent event; comments are keep-alives."""
+        data = []
+        for line in self._iter_lines(response):
+            if not line:
+                if data:
+                    yield "\n".join(data)
+                    data = []
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "data":
+                data.append(value)
+            elif field == "id":
+                self._last_event_id = value
+
+    @staticmethod
+    def _iter_lines(response: requests.Response) -> Iterator[str]:
+        # read1() returns whatever has arrived, so each event is seen as soon
+        # as it is sent whether or not the stream uses chunked encoding
+        buffer = b""
+        while True:
+            chunk = response.raw.read1(65536)
+            if not chunk:
+                return
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                yield line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+    def _close_stream(self) -> None:
+        stream, self._stream, self._events = self._stream, None, None
+        if stream is not None:
+            stream.close()
@@ -20,9 +20,27 @@
 # Original License Date: 2025-07-24
 # ###################################################################################
 
+from itertools import islice
 from rich.table import Table
 from rich.console import Console
+
+
+def _chain_rows(sample, rows):
+    """Yield the already-consumed sample rows, then the rest of the iterator."""
+    yield from sample
+    yield from rows
+
+
 class TableDisplay:
+    # Tables up to CHUNK_SIZE rows are rendered as a single Rich table.
+    # Larger tables are rendered CHUNK_SIZE rows at a time with column widths
+    # fixed from the first WIDTH_SAMPLE_SIZE rows, and above
+    # PLAIN_TEXT_THRESHOLD rows as aligned plain text.
+    CHUNK_SIZE = 250
+    WIDTH_SAMPLE_SIZE = 200
+    PLAIN_TEXT_THRESHOLD = 1000
+    MAX_COLUMN_WIDTH = 40
+
     def __init__(self, console=None):
         """
         Initialize TableDisplay with optional console.
@@ -36,6 +54,18 @@ class TableDisplay:
             'Active Status': 'is_active'
             # Add other special mappings as needed
         }
+        # Per-row-type handlers for columns that need more than a key lookup
+        self.special_columns = {
+            'project': {
+                'Deployed': lambda item: "✓" if item.get('deployed', False) else "✗",
+                'Users': lambda item: ", ".join([user['username'] for user in item.get('users', [])]) or '-',
+                'Metrics Name': lambda item: item.get('metric_name') if item.get('metric_name') else '-',
+            },
+            'user': {
+                'Active Status': lambda item: "✓" if item.get('is_active', False) else "✗",
+            },
+        }
+        self._row_plans = {}
 
     @staticmethod
     def get_safe(item, key, default='-'):
@@ -63,6 +93,52 @@ class TableDisplay:
         # Default behavior: convert to lowercase and replace spaces
         return column.lower().replace(' ', '_')
 
+    def compile_row_plan(self, columns, row_type=None):
+        """
+        Resolve each column to a value extractor once per table.
+        
+        Args:
+            columns (list): Column definitions
+            row_type (str, optional): Key into special_columns ('project', 'user')
+        
+        Returns:
+            list: One callable per column, each taking an item and returning a string
+        """
+        plan_key = (row_type, tuple(columns))
+        plan = self._row_plans.get(plan_key)
+        if plan is None:
+            special = self.special_columns.get(row_type, {})
+            plan = []
+            for column in columns:
+                if column in special:
+                    plan.append(special[column])
+                else:
+                    key = self.get_column_key(column)
+                    plan.append(lambda item, key=key: str(item.get(key, '-')))
+            self._row_plans[plan_key] = plan
+        return plan
+
+    def compile_row_formatter(self, columns, row_formatter=None):
+        """
+        Build a single-argument row formatter for a table.
+        
+        The built-in format_*_row methods are replaced by their compiled plan;
+        any other formatter is called as formatter(item, columns).
+        
+        Args:
+            columns (list): Column definitions
+            row_formatter (callable, optional): Custom row formatting function
+        
+        Returns:
+            callable: Function taking an item and returning the formatted row
+        """
+        formatter = row_formatter or self.format_generic_row
+        func = getattr(formatter, '__func__', None)
+        if func in self._formatter_row_types and isinstance(formatter.__self__, TableDisplay):
+            plan = formatter.__self__.compile_row_plan(columns, self._formatter_row_types[func])
+            return lambda item: [extract(item) for extract in plan]
+        return lambda item: formatter(item, columns)
+
     def format_generic_row(self, item, mapping):
         """
         Generate a formatted row for table display.
@@ -87,18 +163,7 @@ class TableDisplay:
         Returns:
             list: Formatted project row
         """
-        row_data = []
-        for column in columns:
-            if column == 'Deployed':
-                row_data.append("✓" if project.get('deployed', False) else "✗")
-            elif column == 'Users':
-                row_data.append(", ".join([user['username'] for user in project.get('users', [])]) or '-')
-            elif column == 'Metrics Name':
-                row_data.append(project.get('metric_name') if project.get('metric_name') else '-')
-            else:
-                key = self.get_column_key(column)
-                row_data.append(self.get_safe(project, key))
-        return row_data
+        return [extract(project) for extract in self.compile_row_plan(columns, 'project')]
     
     def format_user_row(self, user, columns):
         """
@@ -111,14 +176,7 @@ class TableDisplay:
         Returns:
             list: Formatted user row
         """
-        row_data = []
-        for column in columns:
-            if column == 'Active Status':
-                row_data.append("✓" if user.get('is_active', False) else "✗")
-            else:
-                key = self.get_column_key(column)
-                row_data.append(self.get_safe(user, key))
-        return row_data
+        return [extract(user) for extract in self.compile_row_plan(columns, 'user')]
 
     def format_instance_row(self, instance, columns):
         """
@@ -131,36 +189,98 @@ class TableDisplay:
         Returns:
             list: Formatted instance row.
         """
-        row_data = []
-        for column in columns:
-            key = self.get_column_key(column)
-            row_data.append(self.get_safe(instance, key))
-        return row_data
+        return [extract(instance) for extract in self.compile_row_plan(columns)]
     
     def format_dataversion_row(self, dataversion, columns):
         """data version columns format"""
-        row_data = []
-        for column in columns:
-            key = self.get_column_key(column)
-            row_data.append(self.get_safe(dataversion, key))
-        return row_data
+        return [extract(dataversion) for extract in self.compile_row_plan(columns)]
     
     def format_datasource_row(self, datasource, columns):
         """data source columns format"""
-        row_data = []
-        for column in columns:
-            key = self.get_column_key(column)
-            row_data.append(self.get_safe(datasource, key))
-        return row_data
+        return [extract(datasource) for extract in self.compile_row_plan(columns)]
 
     def format_experiments_row(self, experiment_response, columns):
         """Format experiment run response into a row for table display"""
-        row_data = []
-        for column in columns:
-            key = self.get_column_key(column)  # usually converts "Instance ID" to "instance_id"
-            row_data.append(self.get_safe(experiment_response, key))
-        return row_data
+        # usually converts "Instance ID" to "instance_id"
+        return [extract(experiment_response) for extract in self.compile_row_plan(columns)]
 
+    # Formatters that compile_row_formatter can replace with a column plan, keyed
+    # by the functions themselves so an override or a same-named function is not
+    _formatter_row_types = {
+        format_project_row: 'project',
+        format_user_row: 'user',
+        format_instance_row: None,
+        format_dataversion_row: None,
+        format_datasource_row: None,
+        format_experiments_row: None,
+    }
+
+    def _create_table(self, title, columns, widths=None, show_header=True):
+        """Create the Rich table used by display_table."""
+        table = Table(
+            title=title,
+            title_style="bold magenta",
+            border_style="blue",
+            header_style="bold cyan",
+            show_lines=True,
+            show_header=show_header
+        )
+        
+        # Add columns to the table
+        for index, column in enumerate(columns):
+            table.add_column(column, width=widths[index] if widths else None)
+        return table
+
+    def _sample_column_widths(self, columns, sample):
+        """
+        Compute fixed column widths from a sample of formatted rows.
+        
+        Args:
+            columns (list): Table column headers
+            sample (list): Formatted rows to measure
+        
+        Returns:
+            list: Width per column, capped at MAX_COLUMN_WIDTH
+        """
+        widths = [len(str(column)) for column in columns]
+        for row in sample:
+            for index, value in enumerate(row):
+                length = len(str(value))
+                if length > widths[index]:
+                    widths[index] = length
+        return [min(width, self.MAX_COLUMN_WIDTH) for width in widths]
+
+    def _print_table_chunks(self, title, columns, rows, widths):
+        """Print rows as consecutive Rich tables of CHUNK_SIZE rows with fixed widths."""
+        first = True
+        while True:
+            chunk = list(islice(rows, self.CHUNK_SIZE))
+            if not chunk:
+                break
+            table = self._create_table(title if first else None, columns, widths, show_header=first)
+            for row in chunk:
+                table.add_row(*row)
+            self.console.print(table)
+            first = False
+
+    def _print_plain_rows(self, title, columns, rows, widths):
+        """Print rows as fixed-width plain text, CHUNK_SIZE lines per write."""
+        def fit(value, width):
+            value = str(value).replace('\n', ' ')
+            if len(value) > width:
+                value = value[:width - 1] + '…'
+            return value.ljust(width)
+
+        self.console.print(f"[bold magenta]{title}[/bold magenta]")
+        header = "  ".join(fit(column, width) for column, width in zip(columns, widths))
+        self.console.print(header, style="bold cyan", markup=False, highlight=False)
+        self.console.print("  ".join("─" * width for width in widths), style="blue", highlight=False)
+        while True:
+            chunk = list(islice(rows, self.CHUNK_SIZE))
+            if not chunk:
+                break
+            lines = ["  ".join(fit(value, width) for value, width in zip(row, widths)).rstrip() for row in chunk]
+            self.console.out("\n".join(lines), highlight=False)
 
     def display_table(self, response_data, columns, title_prefix='Items', 
                       row_formatter=None, row_mapping=None):
@@ -181,25 +301,23 @@ class TableDisplay:
             self.console.print(f"[yellow]No {title_prefix.lower()} found.[/yellow]\n")
             return
 
-        table = Table(
-            title=f"{title_prefix} (Total: {response_data.get('count', len(results))})",
-            title_style="bold magenta",
-            border_style="blue",
-            header_style="bold cyan",
-            show_lines=True
-        )
-        
-        # Add columns to the table
-        for column in columns:
-            table.add_column(column)
-
-        # Dynamically map columns to keys
-        formatter = row_formatter or self.format_generic_row
-        
-        for item in results:
-            table.add_row(*formatter(item, columns))
+        title = f"{title_prefix} (Total: {response_data.get('count', len(results))})"
+        format_row = self.compile_row_formatter(columns, row_formatter)
 
-        self.console.print(table)
+        if len(results) <= self.CHUNK_SIZE:
+            table = self._create_table(title, columns)
+            for item in results:
+                table.add_row(*format_row(item))
+            self.console.print(table)
+        else:
+            rows = map(format_row, results)
+            sample = list(islice(rows, self.WIDTH_SAMPLE_SIZE))
+            widths = self._sample_column_widths(columns, sample)
+            rows = _chain_rows(sample, rows)
+            if len(results) > self.PLAIN_TEXT_THRESHOLD:
+                self._print_plain_rows(title, columns, rows, widths)
+            else:
+                self._print_table_chunks(title, columns, rows, widths)
 
         # Pagination info
         if any(key in response_data for key in ['next', 'previous']):
@@ -0,0 +1,115 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agentcore.utils.config import TASKS_FILE
+
+# Kinds of long-running work that can be watched with `agentcore watch`
+TASK_KINDS = ("instance", "data", "deploy", "promotion")
+
+
+class TaskJournal:
+    """
+    Local record of the async tasks started from this machine.
+
+    Managers record the task or job id returned when they start long-running
+    work, so `agentcore watch --since 1h` can pick up everything started
+    recently. Entries are appended to a JSON-lines file, which is trimmed to
+    the newest ``MAX_ENTRIES``. Recording never raises: a journal that cannot
+    be written must not fail the command that started the task.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_ENTRIES = 1000
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or TASKS_FILE)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "TaskJournal":
+        """Return the process-wide journal, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def record(self, kind: str, task_id: Any, label: Optional[str] = None, **context) -> None:
+        """
+        Remember a started task.
+
+        Args:
+            kind: One of TASK_KINDS
+            task_id: Task, job or promotion id returned by the server
+            label: Short description shown by `agentcore watch`
+            **context: Extra ids worth keeping (e.g. instance_id)
+        """
+        if task_id in (None, ""):
+            return
+        entry = {"kind": kind, "id": str(task_id), "label": label, "started_at": time.time()}
+        if context:
+            entry["context"] = {key: value for key, value in context.items() if value is not None}
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, default=str) + "\n")
+                if self.path.stat().st_size > self.MAX_ENTRIES * 400:
+                    self._trim()
+        except OSError:
+            pass
+
+    def _trim(self) -> None:
+        lines = self.path.read_text(encoding="utf-8").splitlines()[-self.MAX_ENTRIES:]
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        temp.replace(self.path)
+
+    def recent(self, since: float, kinds: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Tasks started at or after the Unix time ``since``, oldest first.
+
+        A task recorded more than once (e.g. by two commands) is returned once.
+        """
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return []
+        entries: Dict[Any, Dict[str, Any]] = {}
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("started_at", 0) < since or (kinds and entry.get("kind") not in kinds):
+                continue
+            entries.setdefault((entry.get("kind"), entry.get("id")), entry)
+        return list(entries.values())
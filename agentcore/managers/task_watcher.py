@@ -0,0 +1,276 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import os
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agentcore.managers.client import APIError
+from agentcore.managers.data_version_manager import DataVersionManager2
+from agentcore.managers.deploy_manager import DeployManager
+from agentcore.managers.instance_manager import InstanceManager
+from agentcore.managers.poll_scheduler import PollScheduler
+
+SUCCEEDED_STATUSES = {"SUCCESS", "SUCCEEDED", "COMPLETED", "COMPLETE", "DONE", "FINISHED"}
+FAILED_STATUSES = {"FAILED", "FAILURE", "ERROR", "REVOKED", "CANCELLED", "CANCELED", "TIMEOUT"}
+
+PENDING, RUNNING, SUCCEEDED, FAILED = "pending", "running", "succeeded", "failed"
+
+
+def _call(method: Callable, *args):
+    """
+    Call a manager method without its handle_api_error wrapper, so API errors
+    reach the watcher (and its table) instead of being printed over it.
+    """
+    func = getattr(method.__func__, "__wrapped__", method.__func__)
+    return func(method.__self__, *args)
+
+
+def _state_of(status: Any, finished: bool = False) -> str:
+    status = str(status or "").upper()
+    if status in FAILED_STATUSES:
+        return FAILED
+    if status in SUCCEEDED_STATUSES or finished:
+        return SUCCEEDED
+    return RUNNING
+
+
+class WatchedTask:
+    """One task, job or promotion followed by a TaskWatcher."""
+
+    def __init__(self, kind: str, task_id: str, label: Optional[str] = None, poller=None):
+        self.kind = kind
+        self.task_id = str(task_id)
+        self.label = label or ""
+        self.status = "-"
+        self.state = PENDING
+        self.detail = ""
+        self.error: Optional[str] = None
+        self.hook_result: Optional[str] = None
+        self.started = time.monotonic()
+        self.changed_at = self.started
+        self.finished_at: Optional[float] = None
+        self.polls = 0
+        # Failed polls in a row; reset by any successful poll
+        self.errors = 0
+        self.poller = poller
+
+    @property
+    def done(self) -> bool:
+        return self.state in (SUCCEEDED, FAILED)
+
+    def elapsed(self, now: float) -> float:
+        return (self.finished_at or now) - self.started
+
+
+class TaskWatcher:
+    """
+    Follows any mix of instance tasks, data tasks, deployment jobs and
+    promotions until all of them finish.
+
+    Each task has its own adaptive Poller and polls run on a small thread
+    pool, so slow endpoints do not hold up the others, while the shared
+    PollScheduler caps the total request rate. ``on_update`` is called on the
+    caller's thread after every round of results.
+    """
+
+    MAX_WORKERS = 8
+    MIN_POLL_INTERVAL = 1
+    MAX_POLL_INTERVAL = 20
+    # A task whose polls fail this many times in a row is given up as failed
+    MAX_CONSECUTIVE_ERRORS = 5
+    # Statuses meaning the task id will never resolve, so it fails at once
+    GONE_STATUS_CODES = (404, 410)
+
+    def __init__(self, tasks: List[Tuple[str, str, Optional[str]]], on_complete: Optional[str] = None,
+                 timeout: Optional[float] = None, instance_manager=None, data_version_manager=None,
+                 deploy_manager=None):
+        """
+        Args:
+            tasks: (kind, id, label) tuples; kind is one of TASK_KINDS
+            on_complete: Shell command run when each task finishes, with
+                AGENTCORE_TASK_KIND, _ID, _LABEL, _STATUS and _STATE set
+            timeout: Seconds after which unfinished tasks count as failed
+        """
+        scheduler = PollScheduler.instance()
+        self.tasks = [
+            WatchedTask(kind, task_id, label, scheduler.poller(self.MIN_POLL_INTERVAL, self.MAX_POLL_INTERVAL))
+            for kind, task_id, label in tasks
+        ]
+        self.on_complete = on_complete
+        self.timeout = timeout
+        self.instance_manager = instance_manager or InstanceManager()
+        self.data_version_manager = data_version_manager or DataVersionManager2()
+        self.deploy_manager = deploy_manager or DeployManager()
+        self._fetchers: Dict[str, Callable[[str], Tuple[str, str, str]]] = {
+            "instance": self._fetch_instance,
+            "data": self._fetch_data,
+            "deploy": self._fetch_deploy,
+            "promotion": self._fetch_promotion,
+        }
+
+    # Each fetcher returns (status, state, detail) for one task id
+
+    def _fetch_instance(self, task_id: str) -> Tuple[str, str, str]:
+        response = _call(self.instance_manager.instance_status, task_id) or {}
+        result = response.get("result") or {}
+        status = response.get("status", "-")
+        if result:
+            # Same rule as `instances` status tracking: a result means the task is over
+            state = FAILED if _state_of(result.get("status")) == FAILED else _state_of(status, finished=True)
+            return status, state, str(result.get("message") or result.get("status") or "")
+        return status, _state_of(status), ""
+
+    def _fetch_data(self, task_id: str) -> Tuple[str, str, str]:
+        response = _call(self.data_version_manager.get_task_status, task_id) or {}
+        status = response.get("status", "-")
+        result = response.get("result") or {}
+        detail = ""
+        if isinstance(result, dict) and result:
+            detail = f"{result.get('rows')} rows" if result.get("rows") is not None else str(result.get("status") or "")
+        return status, _state_of(status), detail
+
+    def _fetch_deploy(self, job_id: str) -> Tuple[str, str, str]:
+        response = _call(self.deploy_manager.fetch_status, job_id) or {}
+        status = response.get("status", "-")
+        steps = response.get("details") or []
+        detail = ""
+        if steps and isinstance(steps[-1], dict):
+            detail = f"{steps[-1].get('step', '')}: {steps[-1].get('status', '')}"
+        return status, _state_of(status), detail
+
+    def _fetch_promotion(self, promotion_id: str) -> Tuple[str, str, str]:
+        response = _call(self.deploy_manager.promote_production_staus, promotion_id) or {}
+        status = response.get("status", "-")
+        result = response.get("result") or {}
+        return status, _state_of(status), str(result.get("message") or "") if isinstance(result, dict) else ""
+
+    def _poll(self, task: WatchedTask) -> Tuple[str, str, str]:
+        if not task.poller.acquire():
+            raise InterruptedError("cancelled")
+        return self._fetchers[task.kind](task.task_id)
+
+    def _record(self, task: WatchedTask, future: Future, now: float):
+        task.polls += 1
+        try:
+            status, state, detail = future.result()
+        except InterruptedError:
+            # Cancelled before it was sent, not a failed poll
+            task.poller.schedule()
+            return
+        except Exception as e:
+            task.error = e.message if isinstance(e, APIError) else str(e)
+            task.errors += 1
+            if isinstance(e, APIError) and e.status_code in self.GONE_STATUS_CODES:
+                task.status, task.detail = str(e.status_code), "task not found"
+            elif task.errors >= self.MAX_CONSECUTIVE_ERRORS:
+                task.status, task.detail = "ERROR", f"gave up after {task.errors} failed polls"
+            else:
+                task.poller.schedule(failed=True)
+                return
+            task.state, task.finished_at = FAILED, now
+            return
+        task.error = None
+        task.errors = 0
+        changed = task.poller.observe((status, state, detail))
+        if changed:
+            task.changed_at = now
+        task.status, task.state, task.detail = status, state, detail
+        if task.done:
+            task.finished_at = now
+        else:
+            task.poller.schedule(changed=changed)
+
+    def _run_hook(self, task: WatchedTask):
+        env = dict(
+            os.environ,
+            AGENTCORE_TASK_KIND=task.kind,
+            AGENTCORE_TASK_ID=task.task_id,
+            AGENTCORE_TASK_LABEL=task.label,
+            AGENTCORE_TASK_STATUS=str(task.status),
+            AGENTCORE_TASK_STATE=task.state,
+        )
+        try:
+            completed = subprocess.run(self.on_complete, shell=True, env=env, capture_output=True, text=True)
+            output = (completed.stdout or completed.stderr).strip().splitlines()
+            task.hook_result = f"hook exit {completed.returncode}" + (f": {output[-1][:60]}" if output else "")
+        except OSError as e:
+            task.hook_result = f"hook failed: {e}"
+
+    @property
+    def failed(self) -> List[WatchedTask]:
+        return [task for task in self.tasks if task.state == FAILED]
+
+    def run(self, on_update: Optional[Callable[["TaskWatcher"], None]] = None) -> bool:
+        """
+        Poll until every task has finished (or the timeout passes).
+
+        Returns:
+            True if every task succeeded
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        in_flight: Dict[Future, Tuple[WatchedTask, str]] = {}
+        workers = min(self.MAX_WORKERS, max(len(self.tasks), 1))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-watch")
+        try:
+            while True:
+                busy = {task for task, _ in in_flight.values()}
+                for task in self.tasks:
+                    if not task.done and task not in busy and task.poller.due():
+                        in_flight[executor.submit(self._poll, task)] = (task, "poll")
+                if not in_flight and all(task.done for task in self.tasks):
+                    break
+
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    for task in self.tasks:
+                        if not task.done:
+                            task.state, task.error, task.finished_at = FAILED, "timed out", now
+                    break
+
+                next_due = min((task.poller.next_due for task in self.tasks if not task.done), default=now + 0.5)
+                timeout = max(0.05, min(next_due - now, 0.5))
+                if in_flight:
+                    finished, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    # wait() returns at once for an empty set
+                    time.sleep(timeout)
+                    finished = set()
+                now = time.monotonic()
+                for future in finished:
+                    task, action = in_flight.pop(future)
+                    if action == "poll":
+                        self._record(task, future, now)
+                        if task.done and self.on_complete:
+                            in_flight[executor.submit(self._run_hook, task)] = (task, "hook")
+                if on_update is not None:
+                    on_update(self)
+        finally:
+            for task in self.tasks:
+                task.poller.cancel()
+            executor.shutdown(wait=True)
+        if on_update is not None:
+            on_update(self)
+        return not self.failed
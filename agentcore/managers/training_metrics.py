@@ -0,0 +1,295 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import json
+import math
+import re
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Union
+
+# A decimal or scientific-notation number, e.g. 3, 0.25, .5, 1.2e-4
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
+# Each pattern captures the metric value in its 'value' group (or its first
+# matching group). A 'name' group, if present, splits the metric into one
+# series per captured name (e.g. val_loss and val_acc). They run against
+# lower-cased text, and each starts with a literal or a digit with the
+# word-boundary check after it as a lookbehind, so the regex engine can skip
+# ahead instead of trying every position.
+DEFAULT_METRIC_PATTERNS = {
+    "epoch": r"epoch(?<![^\W_]epoch)[\s:=#\[]*(?P<value>\d+)",
+    "step": r"(?:step(?<![^\W_]step)|iter(?<![^\W_]iter)(?:ation)?)[\s:=#\[]*(?P<value>\d+)",
+    "loss": (
+        r"loss(?<![^\W_]loss)(?<!val.loss)(?<!valid.loss)(?<!validation.loss)"
+        rf"[\s:=]+(?P<value>{_NUMBER})"
+    ),
+    "val_metric": (
+        r"(?P<name>(?:val(?<![^\W_]val)(?:id(?:ation)?)?|eval(?<![^\W_]eval))[_ /-]?"
+        r"(?:loss|accuracy|acc|f1|auc|score|metric|map|bleu|ppl|perplexity))"
+        rf"[\s:=]+(?P<value>{_NUMBER})"
+    ),
+    "throughput": (
+        r"(?P<value>\d(?<![\d.]\d)\d*(?:\.\d+)?)\s*"
+        r"(?:samples|examples|tokens|tok|its|it|steps|images|imgs|img|seqs|seq)\s*/\s*s(?:ec)?\b"
+        rf"|throughput(?<![^\W_]throughput)[\s:=]+(?P<throughput>{_NUMBER})"
+    ),
+}
+
+# Metrics named like this are better when lower; for other metrics only a
+# flat curve is reported, since their direction is not known
+LOWER_IS_BETTER_SUFFIXES = ("loss", "ppl", "perplexity")
+
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def compile_metric_patterns(patterns: Optional[Mapping[str, Union[str, Pattern]]] = None) -> Dict[str, Pattern]:
+    """
+    Compile metric patterns in multi-line mode.
+
+    Patterns are matched against lower-cased text; custom patterns are also
+    compiled case-insensitively so they may be written in any case.
+
+    Args:
+        patterns: Mapping of metric name to regex, added to (or replacing)
+            the defaults. A None value removes a default metric.
+
+    Returns:
+        Mapping of metric name to compiled pattern
+
+    Raises:
+        ValueError: If a pattern does not compile or has no capture group
+    """
+    compiled = {name: re.compile(pattern, re.MULTILINE) for name, pattern in DEFAULT_METRIC_PATTERNS.items()}
+    for name, pattern in (patterns or {}).items():
+        if pattern is None:
+            compiled.pop(name, None)
+            continue
+        try:
+            regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern for metric '{name}': {e}")
+        if not regex.groups:
+            raise ValueError(f"Pattern for metric '{name}' needs a capture group for the value")
+        compiled[name] = regex
+    return compiled
+
+
+class MetricSeries:
+    """
+    Numeric series kept at a bounded size by incremental downsampling.
+
+    Values are stored in an ``array('d')``. When it reaches ``capacity``,
+    neighbouring points are averaged pairwise and every later point stands
+    for twice as many raw values as before, so memory stays fixed however
+    long training runs while the overall shape of the curve is preserved.
+    """
+
+    CAPACITY = 512
+
+    def __init__(self, name: str, capacity: Optional[int] = None):
+        self.name = name
+        self.capacity = max(2, (capacity or self.CAPACITY) // 2 * 2)
+        self.values = array("d")
+        # Raw values represented by each stored point
+        self.stride = 1
+        self._pending_sum = 0.0
+        self._pending_count = 0
+        self.count = 0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float):
+        self.extend((value,))
+
+    def extend(self, values: Sequence[float]):
+        """Append values in bulk; the per-value work is done by builtins over slices."""
+        if not values:
+            return
+        if self.first is None:
+            self.first, self.minimum, self.maximum = values[0], min(values), max(values)
+        else:
+            self.minimum = min(self.minimum, min(values))
+            self.maximum = max(self.maximum, max(values))
+        self.last = values[-1]
+        self.count += len(values)
+
+        position = 0
+        while position < len(values):
+            take = min(self.stride - self._pending_count, len(values) - position)
+            self._pending_sum += sum(values[position:position + take])
+            self._pending_count += take
+            position += take
+            if self._pending_count < self.stride:
+                break
+            self.values.append(self._pending_sum / self._pending_count)
+            self._pending_sum = 0.0
+            self._pending_count = 0
+            if len(self.values) >= self.capacity:
+                points = self.values
+                self.values = array("d", ((points[i] + points[i + 1]) / 2 for i in range(0, len(points), 2)))
+                self.stride *= 2
+
+    def points(self) -> List[float]:
+        """Stored points, including the partly filled last one."""
+        points = list(self.values)
+        if self._pending_count:
+            points.append(self._pending_sum / self._pending_count)
+        return points
+
+    def change(self, window: float = 0.25) -> Optional[float]:
+        """
+        Relative change of the mean over the last ``window`` of the series
+        against the window before it, or None with too few points.
+        """
+        points = self.points()
+        size = max(1, int(len(points) * window))
+        if len(points) < 2 * size or len(points) < 4:
+            return None
+        recent = sum(points[-size:]) / size
+        earlier = sum(points[-2 * size:-size]) / size
+        if earlier == 0:
+            return None
+        return (recent - earlier) / abs(earlier)
+
+
+def sparkline(values: List[float], width: int = 40) -> str:
+    """Draw values as a line of block characters, averaged down to ``width``."""
+    if not values:
+        return ""
+    if len(values) > width:
+        bounds = [len(values) * i // width for i in range(width + 1)]
+        values = [sum(values[start:end]) / (end - start) for start, end in zip(bounds, bounds[1:])]
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_BLOCKS[len(SPARK_BLOCKS) // 2] * len(values)
+    scale = (len(SPARK_BLOCKS) - 1) / (high - low)
+    return "".join(SPARK_BLOCKS[int((value - low) * scale)] for value in values)
+
+
+def _to_floats(raw: List[str]) -> List[float]:
+    """Convert captured strings to finite floats, dropping anything that is not a number."""
+    try:
+        values = list(map(float, raw))
+    except ValueError:
+        values = []
+        for item in raw:
+            try:
+                values.append(float(item))
+            except ValueError:
+                continue
+    if not all(map(math.isfinite, values)):
+        values = [value for value in values if math.isfinite(value)]
+    return values
+
+
+class TrainingMetricsExtractor:
+    """
+    Pulls training curves (epoch, step, loss, validation metric, throughput)
+    out of free-text log messages as they stream in.
+
+    Each batch of messages is joined and lower-cased into one string and every
+    pattern is run over it once with ``findall``, so the regex engine does
+    the scanning rather than a Python loop over lines. Matches are appended
+    to one MetricSeries per metric.
+    """
+
+    # Throughput below this fraction of its running median is reported as a drop
+    THROUGHPUT_DROP = 0.8
+    # Less relative improvement than this between the last two quarters is a plateau
+    PLATEAU_CHANGE = 0.01
+
+    def __init__(self, patterns: Optional[Mapping[str, Union[str, Pattern]]] = None,
+                 capacity: Optional[int] = None):
+        self.patterns = compile_metric_patterns(patterns)
+        self.capacity = capacity
+        self.series: Dict[str, MetricSeries] = {}
+
+    def feed(self, logs: Iterable[Dict]) -> int:
+        """Extract metrics from log entries. Returns the number of values found."""
+        return self.feed_text("\n".join(str(log.get('message', '')) for log in logs))
+
+    def feed_jsonl(self, text: str) -> int:
+        """Extract metrics from JSON-lines log records, e.g. LogArchive block text."""
+        if not text:
+            return 0
+        return self.feed(json.loads("[" + text.replace("\n", ",") + "]"))
+
+    def feed_text(self, text: str) -> int:
+        """Extract metrics from raw text, e.g. a batch of messages. Returns the number of values found."""
+        if not text:
+            return 0
+        text = text.lower()
+        found = 0
+        for metric, regex in self.patterns.items():
+            for name, raw in self._matches(metric, regex, text).items():
+                values = _to_floats(raw)
+                if values:
+                    series = self.series.get(name)
+                    if series is None:
+                        series = self.series[name] = MetricSeries(name, self.capacity)
+                    series.extend(values)
+                    found += len(values)
+        return found
+
+    @staticmethod
+    def _matches(metric: str, regex: Pattern, text: str) -> Dict[str, List[str]]:
+        """Captured value strings by series name, using findall to stay in C."""
+        if regex.groups == 1:
+            return {metric: regex.findall(text)}
+        value_index = regex.groupindex.get("value", 0) - 1
+        name_index = regex.groupindex.get("name", 0) - 1
+        found: Dict[str, List[str]] = {}
+        for groups in regex.findall(text):
+            raw = groups[value_index] if value_index >= 0 else ""
+            if not raw:
+                raw = next((group for index, group in enumerate(groups) if group and index != name_index), "")
+            name = metric
+            if name_index >= 0 and groups[name_index]:
+                name = re.sub(r"[\s/-]+", "_", groups[name_index])
+            found.setdefault(name, []).append(raw)
+        return found
+
+    def active_series(self) -> List[MetricSeries]:
+        return [series for series in self.series.values() if series.count]
+
+    def alerts(self) -> Dict[str, str]:
+        """Short warnings for stalled convergence and throughput drops, by metric name."""
+        alerts = {}
+        for series in self.active_series():
+            if series.name in ("epoch", "step"):
+                continue
+            if series.name == "throughput":
+                points = sorted(series.points())
+                median = points[len(points) // 2]
+                if len(points) >= 4 and median > 0 and series.last < median * self.THROUGHPUT_DROP:
+                    alerts[series.name] = f"dropped {100 * (1 - series.last / median):.0f}% below median"
+                continue
+            change = series.change()
+            if change is None:
+                continue
+            improvement = -change if series.name.endswith(LOWER_IS_BETTER_SUFFIXES) else abs(change)
+            if improvement < self.PLATEAU_CHANGE:
+                alerts[series.name] = "getting worse" if improvement < -self.PLATEAU_CHANGE else "plateaued"
+        return alerts
@@ -0,0 +1,203 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from agentcore.managers.client import APIClient, APIError
+from agentcore.utils.config import UPLOAD_LOOKUP_ENDPOINT, UPLOAD_REGISTRY_FILE
+
+# Statuses meaning the server has no lookup endpoint
+UNSUPPORTED_STATUS = {404, 405, 501}
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """Hash a file with SHA-256, reading it in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadRegistry:
+    """
+    Remembers which file contents are already on the server.
+
+    Uploads are recorded by the SHA-256 of their contents together with
+    what they were uploaded as (a datasource for a given project, a data
+    file...) and the server URL. Uploading the same contents again, from
+    any path, can then reuse the existing record instead of sending the
+    file. Hashes are cached by path, size and modification time, so an
+    unchanged file is not read again.
+
+    When the server offers ``GET uploads/lookup/?sha256=...`` it is asked
+    as well, which finds files uploaded from other machines. The lookup
+    answers ``{"record": ...}`` with the response of the original upload,
+    or ``{"record": null}`` if it has not seen the contents.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or UPLOAD_REGISTRY_FILE)
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+        # Servers found to have no lookup endpoint in this process
+        self._no_lookup: Set[str] = set()
+
+    @classmethod
+    def instance(cls) -> "UploadRegistry":
+        """Return the process-wide registry, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._data is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            self._data = {"hashes": data.get("hashes", {}), "uploads": data.get("uploads", {})}
+        return self._data
+
+    def _store(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_suffix(".tmp")
+            temp.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+            temp.replace(self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _key(server: str, purpose: str, digest: str, scope: Dict[str, Any]) -> str:
+        scope_text = ",".join(f"{name}={scope[name]}" for name in sorted(scope))
+        return f"{server.rstrip('/')}|{purpose}|{scope_text}|{digest}"
+
+    def digest(self, file_path: str) -> str:
+        """Return the SHA-256 of a file, reusing the cached hash if the file is unchanged."""
+        stat = os.stat(file_path)
+        stat_key = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        with self._lock:
+            cached = self._load()["hashes"].get(stat_key)
+        if cached:
+            return cached
+        digest = file_sha256(file_path)
+        with self._lock:
+            hashes = self._load()["hashes"]
+            # Drop hashes of earlier versions of the same file
+            prefix = f"{os.path.abspath(file_path)}|"
+            for key in [key for key in hashes if key.startswith(prefix)]:
+                del hashes[key]
+            hashes[stat_key] = digest
+            self._store()
+        return digest
+
+    def find(self, api_client: APIClient, file_path: str, purpose: str,
+             resource_endpoint: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
+             **scope: Any) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Look for an earlier upload of the same contents.
+
+        A record cached locally is only returned once the server confirms it
+        still exists, through the lookup endpoint or, on servers without one,
+        a GET of ``resource_endpoint(record)``. Records the server no longer
+        has are forgotten, so the file is uploaded again.
+
+        Args:
+            api_client: Client for the server the file would be uploaded to
+            file_path: File about to be uploaded
+            purpose: What it is uploaded as (e.g. 'datasource')
+            resource_endpoint: Returns the endpoint of the server object a
+                record refers to, used to check it still exists
+            **scope: Values that must also match, e.g. project_id
+
+        Returns:
+            The file's SHA-256 and the record of the earlier upload, or None
+        """
+        digest = self.digest(file_path)
+        server = api_client.base_url
+        key = self._key(server, purpose, digest, scope)
+        with self._lock:
+            entry = self._load()["uploads"].get(key)
+
+        if server not in self._no_lookup:
+            try:
+                record = api_client.get(UPLOAD_LOOKUP_ENDPOINT, params={"sha256": digest, "purpose": purpose, **scope})
+            except APIError as e:
+                # The lookup only saves work; if it fails the file is simply uploaded
+                if e.status_code not in UNSUPPORTED_STATUS:
+                    return digest, None
+                self._no_lookup.add(server)
+            else:
+                record = (record or {}).get("record")
+                if not record:
+                    if entry:
+                        self._forget(key)
+                    return digest, None
+                self.record(api_client, digest, purpose, record, os.path.basename(file_path), **scope)
+                return digest, record
+
+        if not entry:
+            return digest, None
+        record = entry["record"]
+        endpoint = resource_endpoint(record) if resource_endpoint else None
+        if endpoint:
+            try:
+                api_client.get(endpoint)
+            except APIError as e:
+                if e.status_code in (404, 410):
+                    self._forget(key)
+                    return digest, None
+                if e.status_code not in UNSUPPORTED_STATUS - {404}:
+                    # Could not confirm it; uploading again is the safe choice
+                    return digest, None
+        return digest, record
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            if self._load()["uploads"].pop(key, None) is not None:
+                self._store()
+
+    def record(self, api_client: APIClient, digest: str, purpose: str, record: Dict[str, Any],
+               file_name: str, **scope: Any) -> None:
+        """Remember the server record created by uploading contents with this hash."""
+        with self._lock:
+            self._load()["uploads"][self._key(api_client.base_url, purpose, digest, scope)] = {
+                "record": record,
+                "file_name": file_name,
+                "recorded_at": time.time(),
+            }
+            self._store()
@@ -24,6 +24,17 @@ from pathlib import Path
 
 CONFIG_DIR = Path.home() / ".agentcore"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+LOGS_DIR = CONFIG_DIR / "logs"
+TASKS_FILE = CONFIG_DIR / "tasks.jsonl"
+PRICING_CACHE_FILE = CONFIG_DIR / "pricing.json"
+UPLOADS_FILE = CONFIG_DIR / "uploads.json"
+UPLOAD_REGISTRY_FILE = CONFIG_DIR / "upload_registry.json"
+SERVER_FEATURES_FILE = CONFIG_DIR / "server_features.json"
+INGEST_MANIFEST_DIR = CONFIG_DIR / "ingest"
+
+# Largest upload accepted unless changed with `agentcore config max-upload-size`
+DEFAULT_MAX_UPLOAD_MB = 100
+DEFAULT_UPLOAD_COMPRESSION = 1
 
 USERS_ENDPOINT = "/api/users/"
 PROJECTS_ENDPOINT = "/api/projects/"
@@ -52,6 +63,10 @@ EXPERIMENT_SETUP_ENDPOINT = "api/instance-setup/"
 EXPERIMENT_RUN_ENDPOINT = "api/run-experiment/"
 DATASOURCE_ENDPOINT = "api/datasources/"
 DATASOURCE_TYPES_ENDPOINT = "api/data-source-types/"
+UPLOAD_SESSIONS_ENDPOINT = "api/uploads/"
+UPLOAD_LOOKUP_ENDPOINT = "api/uploads/lookup/"
+UPLOAD_CHUNK_ENDPOINT = "api/uploads/{session_id}/chunks/{index}/"
+UPLOAD_COMPLETE_ENDPOINT = "api/uploads/{session_id}/complete/"
 DATAVERSION_ENDPOINT = "api/dataversions"
 FETCH_DATA_MONGO_ENDPOINT = "api/mongodb-data/"
 OPERATIONS_FE_ENDPOINT = "api/operations/feature-engineering/"
@@ -75,6 +90,7 @@ RUN_EXPERIMENT_ENDPOINT = "/api/experiment/init/"
 RUN_EXPERIMENT_ENDPOINT = "/api/experiment/run-new-experiment/"
 LOGS_ENDPOINT = "/api/logs/{experiment_id}/?instance_id={instance_id}&project_id={project_id}"
 METRICS_POST = "/api/metrics/"
+METRICS_BATCH_POST = "/api/metrics/batch/"
 METRICS_GET = "/api/metrics/{experiment_id}"
 ARTIFACTS_ENDPOINT = "/api/experiments/artifacts/list/?instance_id={instance_id}&experiment_id={experiment_id}"
 ARTIFACT_DOWNLOAD_ENDPOINT = "/api/experiments/artifact/?instance_id={instance_id}&experiment_id={experiment_id}&filename={filename}"
@@ -0,0 +1,83 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Chunked upload throughput with parallel workers (user-045).
+
+Uploads a file of random bytes through ChunkedUploader to a stub that adds
+``--latency`` seconds to every request and takes chunk bodies in at
+``--bandwidth`` MB/s per request, like a long link with a per-connection
+window limit. Each run uses a different worker count; the first one,
+1 worker with 8 MiB parts, is the sequential upload this request replaced.
+
+Peak RSS covers the whole process, including the stub's copy of the file
+while it verifies uploads of up to 256 MB. For the client's own memory,
+upload a larger file, e.g. ``--file-mb 512 --workers 8``.
+
+    PYTHONPATH=. python benchmarks/bench_chunked_upload.py [--file-mb 64] [--workers 1 4 8 16]
+"""
+
+import argparse
+import os
+import tempfile
+
+import stub_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--file-mb", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--latency", type=float, default=0.08)
+    parser.add_argument("--bandwidth", type=float, default=20.0, help="MB/s per request")
+    args = parser.parse_args()
+    stub_server.UploadStubHandler.LATENCY = args.latency
+    stub_server.UploadStubHandler.BANDWIDTH = args.bandwidth * 1024 * 1024
+    # Only the client's memory is of interest
+    stub_server.UploadStubHandler.KEEP_CHUNKS = args.file_mb <= 256
+
+    stub_server.use_scratch_home()
+    server, url = stub_server.start(stub_server.UploadStubHandler)
+    stub_server.write_config(url)
+    from agentcore.managers.chunked_upload import ChunkedUploader
+    from agentcore.managers.client import APIClient
+
+    with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as upload:
+        for _ in range(args.file_mb):
+            upload.write(os.urandom(1024 * 1024))
+    client = APIClient()
+    try:
+        for workers, chunk_size in [(1, 8 * 1024 * 1024)] + [(count, None) for count in args.workers]:
+            stub_server.UploadStubHandler.sessions.clear()
+            uploader = ChunkedUploader(client, workers=workers, chunk_size=chunk_size)
+            result = uploader.upload(upload.name, f"bench-{workers}-{chunk_size}")
+            part = uploader.part_size(args.file_mb * 1024 * 1024) // (1024 * 1024)
+            print(f"{workers:>2} workers, {part:>2} MiB parts: {uploader.summary()}, "
+                  f"ok={result.get('ok')}, peak RSS {stub_server.peak_rss_mb()} MB")
+    finally:
+        os.unlink(upload.name)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
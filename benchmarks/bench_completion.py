@@ -0,0 +1,121 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Cost per poll of watching a long experiment log for completion (user-036).
+
+A fake log tail appends ``--chunk-mb`` MiB of training output on each of
+``--polls`` polls, with the completion line in the last one. ``--mode
+incremental`` runs ExperimentManager.poll_experiment_logs, which scans only
+the new text. ``--mode rescan`` runs the loop it replaced: the whole log
+is kept, yielded and lower-cased on every poll.
+
+    PYTHONPATH=. python benchmarks/bench_completion.py [--mode incremental|rescan]
+"""
+
+import argparse
+import time
+
+import stub_server
+
+LINE = "2025-01-01 00:00:00 [INFO] trainer: epoch 3 step 1234 loss=0.12345 lr=0.0001 throughput=512.3\n"
+LAST_LINE = "2025-01-01 01:00:00 [INFO] runner: Experiment completed in 3600s\n"
+# The indicators poll_experiment_logs checked before CompletionDetector
+OLD_INDICATORS = ['✅ model execution complete', 'experiment completed', 'pipeline finished', 'error:', 'failed']
+
+
+class FakeTail:
+    def __init__(self, chunk: str, polls: int):
+        self.chunk = chunk
+        self.polls = polls
+        self.count = 0
+
+    def poll(self):
+        from agentcore.managers.experiment_manager import LogTailUpdate
+        self.count += 1
+        text = self.chunk + (LAST_LINE if self.count >= self.polls else "")
+        return LogTailUpdate([], text)
+
+
+class FakeChannel:
+    def wait(self, changed=False, failed=False):
+        return True
+
+
+def rescan(tail):
+    shown = ""
+    while True:
+        current = shown + tail.poll().text
+        if current != shown:
+            yield current
+            shown = current
+        if any(indicator in current.lower() for indicator in OLD_INDICATORS):
+            yield "done"
+            return
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=["incremental", "rescan"], default="incremental")
+    parser.add_argument("--polls", type=int, default=100)
+    parser.add_argument("--chunk-mb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    stub_server.use_scratch_home()
+    from agentcore.managers.experiment_manager import ExperimentManager
+    from agentcore.managers.poll_scheduler import PollScheduler
+
+    chunk = LINE * int(args.chunk_mb * 2 ** 20 // len(LINE))
+    tail = FakeTail(chunk, args.polls)
+
+    class FakeManager(ExperimentManager):
+        def __init__(self):
+            pass
+
+        def log_channel(self, *args, **kwargs):
+            return FakeChannel()
+
+        def log_tail(self, *args, **kwargs):
+            return tail
+
+    # No request is sent, so the shared rate limit only slows the loop down
+    PollScheduler._instance = PollScheduler(rate=1e9, burst=10 ** 9)
+    started = time.perf_counter()
+    if args.mode == "rescan":
+        messages = rescan(tail)
+    else:
+        messages = FakeManager().poll_experiment_logs(1, "G", "1", poll_interval=1, max_polls=10 ** 9)
+    yielded = 0
+    last = ""
+    for message in messages:
+        yielded += len(message)
+        last = message
+    elapsed = time.perf_counter() - started
+    print(f"{args.mode:>11}: {tail.count} polls, {tail.count * args.chunk_mb:.0f} MiB of log in {elapsed:.2f}s "
+          f"({elapsed / tail.count * 1000:.1f} ms/poll), {yielded / 2 ** 20:.0f} MiB yielded, "
+          f"peak RSS {stub_server.peak_rss_mb()} MB")
+    print(f"{'':>11}  last message: {last[:100].strip()}")
+
+
+if __name__ == "__main__":
+    main()
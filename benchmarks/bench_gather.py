@@ -0,0 +1,88 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Independent API fetches run one after another and with BaseManager.gather
+(user-029).
+
+Every request to the stub takes ``--latency`` seconds. The benchmark times
+the fetches behind `users view` (users and roles) and the `experiments run`
+wizard (instance, data versions and model types), first in sequence and
+then through BaseManager.gather.
+
+    PYTHONPATH=. python benchmarks/bench_gather.py [--latency 0.3]
+"""
+
+import argparse
+import time
+
+import stub_server
+
+
+class SlowStubHandler(stub_server.StubHandler):
+    LATENCY = 0.3
+
+    def do_GET(self):
+        if "users" in self.path or "roles" in self.path:
+            return self.reply(200, [{"id": 1, "name": "x"}])
+        self.reply(200, {"instances": [], "ok": True})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency", type=float, default=SlowStubHandler.LATENCY)
+    args = parser.parse_args()
+    SlowStubHandler.LATENCY = args.latency
+
+    stub_server.use_scratch_home()
+    server, url = stub_server.start(SlowStubHandler)
+    stub_server.write_config(url)
+    from agentcore.managers.base import BaseManager
+    from agentcore.managers.experiment_manager import ExperimentManager
+    from agentcore.managers.instance_manager import InstanceManager
+    from agentcore.managers.users_manager import UserManager
+
+    users, instances, experiments = UserManager(), InstanceManager(), ExperimentManager()
+    # Open the connection first so neither variant pays for the handshake
+    users.view_users()
+
+    cases = [
+        ("users view", [users.view_users, users.view_roles]),
+        ("run wizard", [lambda: instances.project_instance_show(1),
+                        lambda: experiments.list_data_versions(1),
+                        lambda: experiments.get_model_types(1)]),
+    ]
+    for name, fetches in cases:
+        started = time.perf_counter()
+        for fetch in fetches:
+            fetch()
+        sequential = time.perf_counter() - started
+        started = time.perf_counter()
+        BaseManager.gather(*fetches)
+        gathered = time.perf_counter() - started
+        print(f"{name}: sequential {sequential:.2f}s, gather {gathered:.2f}s")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
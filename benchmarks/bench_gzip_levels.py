@@ -0,0 +1,92 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Chunked upload throughput of a CSV at different gzip levels (user-048).
+
+Uploads a generated CSV (about 84 MB by default) through ChunkedUploader
+to a stub with ``--latency`` seconds per request and ``--bandwidth`` MB/s
+per request, once per compression level. Level 0 sends the file as is.
+Throughput is file bytes per second, so it can exceed the link speed when
+compression pays off.
+
+With ``--reject-gzip`` the stub answers gzip chunks with 415: the first
+upload finds out and resends that chunk uncompressed, and ServerFeatures
+stops later uploads from trying.
+
+    PYTHONPATH=. python benchmarks/bench_gzip_levels.py [--levels 0 1 6] [--bandwidth 10]
+"""
+
+import argparse
+import os
+import random
+
+import stub_server
+
+
+def write_csv(path: str, rows: int):
+    rnd = random.Random(1)
+    with open(path, "w") as f:
+        f.write("id,timestamp,region,product,qty,price,score\n")
+        for i in range(rows):
+            f.write(f"{i},2025-01-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00Z,"
+                    f"{rnd.choice(['us-east', 'eu-west', 'ap-south'])},"
+                    f"{rnd.choice(['alpha', 'beta', 'gamma', 'delta'])},"
+                    f"{rnd.randint(1, 50)},{rnd.uniform(1, 500):.2f},{rnd.random():.4f}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=[0, 1, 6])
+    parser.add_argument("--rows", type=int, default=1_500_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--bandwidth", type=float, default=10.0, help="MB/s per request")
+    parser.add_argument("--reject-gzip", action="store_true")
+    args = parser.parse_args()
+    handler = stub_server.UploadStubHandler
+    handler.LATENCY = args.latency
+    handler.BANDWIDTH = args.bandwidth * 1024 * 1024
+    handler.ACCEPT_GZIP = not args.reject_gzip
+
+    stub_server.use_scratch_home()
+    server, url = stub_server.start(handler)
+    stub_server.write_config(url)
+    from agentcore.managers.chunked_upload import ChunkedUploader
+    from agentcore.managers.client import APIClient
+
+    path = os.path.join(os.environ["HOME"], "data.csv")
+    write_csv(path, args.rows)
+    client = APIClient()
+    try:
+        for level in args.levels:
+            handler.sessions.clear()
+            uploader = ChunkedUploader(client, compression=level)
+            result = uploader.upload(path, f"bench-gzip-{level}")
+            print(f"level {level}: {uploader.summary()}, ok={result.get('ok')}")
+    finally:
+        os.unlink(path)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
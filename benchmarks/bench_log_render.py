@@ -0,0 +1,116 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Terminal rendering cost of `experiments logs` as the log grows (user-037).
+
+``--lines`` log entries arrive over ``--polls`` polls and are written to a
+160-column colour terminal that discards its output. ``--mode append``
+uses LogRenderer, which writes only the new lines. ``--mode redraw`` runs
+the loop it replaced: clear the screen and print the whole log again
+whenever it changed, which is quadratic in the log length, so keep
+``--lines`` small for it.
+
+    PYTHONPATH=. python benchmarks/bench_log_render.py [--mode append|redraw] [--lines 100000]
+"""
+
+import argparse
+import datetime
+import io
+import time
+
+import stub_server
+
+START = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+LEVELS = ["INFO", "DEBUG", "WARNING", "ERROR"]
+
+
+class NullTerminal(io.TextIOBase):
+    """Counts what would have been written to the terminal."""
+
+    written = 0
+
+    def write(self, text):
+        self.written += len(text)
+        return len(text)
+
+
+def make_logs(count):
+    return [
+        {
+            "timestamp": (START + datetime.timedelta(seconds=i)).isoformat(),
+            "level": LEVELS[i % 4],
+            "source": f"worker-{i % 8}",
+            "message": f"step {i} loss={1 / (i + 1):.6f} throughput=512.3 samples/s",
+        }
+        for i in range(count)
+    ]
+
+
+def redraw(console, batches):
+    shown, previous = [], ""
+    for batch in batches:
+        shown.extend(batch)
+        current = "\n".join(
+            f"{datetime.datetime.fromisoformat(log['timestamp']).strftime('%Y-%m-%d %H:%M:%S')} "
+            f"[{log['level']}] {log['source']}: {log['message']}"
+            for log in shown
+        )
+        if current != previous:
+            console.clear()
+            console.print("[bold blue]Live Logs[/bold blue]")
+            console.print(current)
+            previous = current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=["append", "redraw"], default="append")
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--polls", type=int, default=100)
+    args = parser.parse_args()
+
+    stub_server.use_scratch_home()
+    from rich.console import Console
+    from agentcore.cli.experiments.logs import LogRenderer
+
+    logs = make_logs(args.lines)
+    per_poll = max(1, args.lines // args.polls)
+    batches = [logs[start:start + per_poll] for start in range(0, args.lines, per_poll)]
+    terminal = NullTerminal()
+    console = Console(file=terminal, force_terminal=True, color_system="truecolor", width=160)
+
+    started = time.perf_counter()
+    if args.mode == "redraw":
+        redraw(console, batches)
+    else:
+        renderer = LogRenderer(console)
+        for batch in batches:
+            renderer.write(batch)
+    elapsed = time.perf_counter() - started
+    print(f"{args.mode:>6}: {args.lines} lines in {len(batches)} polls: {elapsed:.2f}s, "
+          f"{args.lines / elapsed:,.0f} lines/s, {terminal.written / 1e6:.1f} MB written to the terminal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Bytes transferred and client CPU while following a growing experiment log
+(user-031).
+
+The stub log grows by ``--step`` entries between polls up to ``--lines``
+entries, and each poll goes through LogMonitor.fetch_new_logs. With
+``--mode cursor`` the stub honours the 'since' cursor and returns only new
+entries. With ``--mode full`` it always returns the whole log, like a
+server without cursor support, and the client falls back to suffix
+matching.
+
+CPU is process time around each poll, so it includes the in-process
+stub's JSON encoding as well as the client's decoding and matching.
+
+    PYTHONPATH=. python benchmarks/bench_log_tail.py [--mode cursor|full]
+"""
+
+import argparse
+import datetime
+import time
+from urllib.parse import parse_qs, urlparse
+
+import stub_server
+
+START = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_entry(index):
+    return {
+        "timestamp": (START + datetime.timedelta(seconds=index)).isoformat().replace("+00:00", "Z"),
+        "level": ["INFO", "DEBUG", "WARNING", "ERROR"][index % 4],
+        "source": f"worker-{index % 8}",
+        "message": f"step {index} loss={1.0 / (index + 1):.5f} batch done",
+        "user": "system",
+    }
+
+
+class LogStubHandler(stub_server.StubHandler):
+    entries = []
+    cursor_support = True
+    sent_bytes = 0
+    requests = 0
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        cls = type(self)
+        if cls.cursor_support:
+            since = int(query["since"][0]) if "since" in query else 0
+            body = {"logs": cls.entries[since:], "next_cursor": str(len(cls.entries))}
+        else:
+            body = {"logs": cls.entries}
+        cls.requests += 1
+        cls.sent_bytes += self.reply(200, body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=["cursor", "full"], default="cursor")
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--step", type=int, default=10_000)
+    args = parser.parse_args()
+    LogStubHandler.cursor_support = args.mode == "cursor"
+
+    stub_server.use_scratch_home()
+    server, url = stub_server.start(LogStubHandler)
+    stub_server.write_config(url)
+    from agentcore.cli.experiments.logs import LogMonitor
+    from agentcore.managers.experiment_manager import ExperimentManager
+
+    monitor = LogMonitor(ExperimentManager(), 1, "G", "1")
+    cpu = 0.0
+    received = 0
+    for end in range(args.step, args.lines + 1, args.step):
+        LogStubHandler.entries.extend(make_entry(i) for i in range(end - args.step, end))
+        started = time.process_time()
+        received += len(monitor.fetch_new_logs())
+        cpu += time.process_time() - started
+    server.shutdown()
+    print(f"{args.mode:>6}: {LogStubHandler.requests} polls, {received} new entries, "
+          f"{LogStubHandler.sent_bytes / 1e6:.0f} MB on the wire, {cpu:.2f}s client CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Client memory while posting a large file as multipart/form-data (user-046).
+
+Posts a file of random bytes with a few form fields through
+APIClient.post(files=...) to a stub that hashes the body as it reads it,
+and reports how far the client's peak RSS rose during the request. The
+body is streamed from disk, so the rise should stay flat as the file
+grows; with the body built in memory it grows by about twice the file
+size.
+
+    PYTHONPATH=. python benchmarks/bench_multipart_rss.py [--file-mb 1 100 500]
+
+Each size runs in its own process, because peak RSS never goes down.
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import stub_server
+
+
+class HashingStubHandler(stub_server.StubHandler):
+    def do_POST(self):
+        digest = hashlib.sha256()
+        remaining = int(self.headers["Content-Length"])
+        while remaining:
+            block = self.rfile.read(min(remaining, 1024 * 1024))
+            if not block:
+                break
+            remaining -= len(block)
+            digest.update(block)
+        self.reply(201, {"sha256": digest.hexdigest()})
+
+
+def measure(file_mb: int):
+    stub_server.use_scratch_home()
+    server, url = stub_server.start(HashingStubHandler)
+    stub_server.write_config(url)
+    from agentcore.managers.client import APIClient
+
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as upload:
+        for _ in range(file_mb):
+            upload.write(os.urandom(1024 * 1024))
+    client = APIClient()
+    try:
+        before = stub_server.peak_rss_mb()
+        started = time.perf_counter()
+        with open(upload.name, "rb") as file:
+            client.post("api/upload/", data={"project": 1, "tags": ["a", "b"], "description": "x"},
+                        files={"files": ("data.csv", file, "application/octet-stream")})
+        elapsed = time.perf_counter() - started
+        print(f"{file_mb:>5} MB file: peak RSS +{stub_server.peak_rss_mb() - before} MB, {elapsed:.2f}s")
+    finally:
+        os.unlink(upload.name)
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--file-mb", type=int, nargs="+", default=[1, 100, 500])
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.single:
+        measure(args.file_mb[0])
+        return
+    for file_mb in args.file_mb:
+        subprocess.run([sys.executable, __file__, "--single", "--file-mb", str(file_mb)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Rendering speed of large tables (user-026).
+
+Renders 7-column project rows through TableDisplay.display_table into an
+in-memory 160-column console, the way `projects list` would, and reports
+rows per second for each table size.
+
+    PYTHONPATH=. python benchmarks/bench_table_render.py [--rows 3000 20000 100000]
+"""
+
+import argparse
+import io
+import time
+
+import stub_server
+
+COLUMNS = ["ID", "Name", "Description", "Deployed", "Users", "Metrics Name", "Created At"]
+
+
+def make_rows(count):
+    return [
+        {
+            "id": i,
+            "name": f"project-{i}",
+            "description": "some description text " * 2,
+            "deployed": i % 2 == 0,
+            "users": [{"username": "alice"}, {"username": "bob"}],
+            "metric_name": "rmse",
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[3000, 20000, 100000])
+    args = parser.parse_args()
+
+    stub_server.use_scratch_home()
+    from rich.console import Console
+    from agentcore.managers.table_manager import TableDisplay
+
+    for count in args.rows:
+        rows = make_rows(count)
+        output = io.StringIO()
+        display = TableDisplay(console=Console(file=output, width=160))
+        started = time.perf_counter()
+        display.display_table({"results": rows, "count": count}, COLUMNS, "Projects",
+                              row_formatter=display.format_project_row)
+        elapsed = time.perf_counter() - started
+        print(f"{count:>7} rows: {elapsed:6.2f}s  {count / elapsed:>9,.0f} rows/s  "
+              f"{len(output.getvalue()) / 1e6:.1f} MB of output")
+
+
+if __name__ == "__main__":
+    main()
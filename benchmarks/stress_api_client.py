@@ -0,0 +1,182 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Stress test for one APIClient shared by many threads (user-027).
+
+Worker threads send a mix of JSON POSTs, GETs and multipart file uploads
+through a single APIClient while the stub server keeps expiring the
+access token, so requests race with token refreshes. The stub checks
+every request's Authorization and Content-Type headers.
+
+A pass means no request carried a wrong Content-Type or an Authorization
+header the client never held. Each call is allowed to repeat after a 401
+that follows a successful refresh, as BaseManager._execute_with_progress
+does, so no call should fail either. The refresh count shows how many
+refreshes the token expiries cost.
+
+    PYTHONPATH=. python benchmarks/stress_api_client.py [--threads 64] [--calls 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import stub_server
+
+TOKEN_ERROR = "Given token not valid for any token type"
+
+
+class TokenStubHandler(stub_server.StubHandler):
+    LATENCY = 0.002
+    lock = threading.Lock()
+    generation = 0
+    issued = {"token-0"}
+    stats = {"requests": 0, "rejected": 0, "refreshes": 0, "expiries": 0, "header_errors": []}
+
+    @classmethod
+    def expire(cls):
+        with cls.lock:
+            cls.generation += 1
+            cls.stats["expiries"] += 1
+
+    def _check(self, expect_multipart: bool) -> bool:
+        content_type = self.headers.get("Content-Type") or ""
+        auth = self.headers.get("Authorization") or ""
+        token = auth[len("Bearer "):] if auth.startswith("Bearer ") else None
+        errors = self.stats["header_errors"]
+        if expect_multipart and not content_type.startswith("multipart/form-data"):
+            errors.append(("multipart Content-Type", content_type))
+        if not expect_multipart and content_type != "application/json":
+            errors.append(("JSON Content-Type", content_type))
+        with self.lock:
+            self.stats["requests"] += 1
+            if token not in self.issued:
+                errors.append(("Authorization", auth))
+            if token != f"token-{self.generation}":
+                self.stats["rejected"] += 1
+                return False
+        return True
+
+    def do_GET(self):
+        if not self._check(expect_multipart=False):
+            return self.reply(401, {"detail": TOKEN_ERROR})
+        self.reply(200, {"ok": True})
+
+    def do_POST(self):
+        self.read_body()
+        if self.path.rstrip("/").endswith("token/refresh"):
+            with self.lock:
+                self.stats["refreshes"] += 1
+                token = f"token-{self.generation}"
+                self.issued.add(token)
+            return self.reply(200, {"access": token})
+        if not self._check(expect_multipart=self.path.rstrip("/").endswith("upload")):
+            return self.reply(401, {"detail": TOKEN_ERROR})
+        self.reply(201, {"ok": True})
+
+
+class StubConfig:
+    """Just enough of ConfigManager for APIClient and TokenManager."""
+
+    def __init__(self, url: str):
+        self._url = url
+
+    def url(self):
+        return self._url
+
+    def access_token(self):
+        return "token-0"
+
+    def refresh_token(self):
+        return "refresh-token"
+
+    def set_token(self, token, token_type="access"):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--expire-every", type=float, default=0.5,
+                        help="Seconds between server-side token expiries")
+    args = parser.parse_args()
+
+    stub_server.use_scratch_home()
+    from agentcore.managers.client import APIClient, APIError
+
+    server, url = stub_server.start(TokenStubHandler)
+    client = APIClient(config=StubConfig(url))
+    # Inside the scratch home, which is removed on exit
+    upload_path = os.path.join(os.environ["HOME"], "upload.csv")
+    with open(upload_path, "wb") as upload:
+        upload.write(b"a,b\n1,2\n" * 1000)
+
+    failures = []
+
+    def call(index: int):
+        choice = random.random()
+        for _ in range(3):
+            try:
+                if choice < 0.3:
+                    return client.upload_file("api/upload/", upload_path)
+                if choice < 0.5:
+                    return client.post("api/json/", data={"index": index})
+                return client.get("api/get/")
+            except APIError as e:
+                if e.status_code == 401 and e.message == TOKEN_ERROR:
+                    continue
+                failures.append(e.message)
+                return None
+        failures.append("still rejected after 3 attempts")
+
+    stop = threading.Event()
+
+    def expire_tokens():
+        while not stop.wait(args.expire_every):
+            TokenStubHandler.expire()
+
+    threading.Thread(target=expire_tokens, daemon=True).start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as executor:
+        list(executor.map(call, range(args.calls)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    server.shutdown()
+
+    stats = TokenStubHandler.stats
+    print(f"{args.calls} calls on {args.threads} threads in {elapsed:.2f}s "
+          f"({stats['requests']} requests, {stats['rejected']} rejected with an expired token)")
+    print(f"token expiries: {stats['expiries']}, refreshes: {stats['refreshes']}")
+    print(f"requests with wrong headers: {len(stats['header_errors'])} {stats['header_errors'][:3]}")
+    print(f"failed calls: {len(failures)} {failures[:3]}")
+    return 1 if stats["header_errors"] or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
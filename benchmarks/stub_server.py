@@ -0,0 +1,190 @@
+# ###################################################################################
+# Business Source License 1.1
+
+# This file is licensed under the Business Source License 1.1 (BSL 1.1). 
+# You may not use this file except in compliance with the License.
+
+# You may obtain a copy of the License at:
+# https://mariadb.com/bsl11
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+
+# Change Date: 2028-08-01 (3 years from initial release)
+
+# On the Change Date, the License will change to a specified open source license:
+# Apache License, Version 2.0
+
+# Original Developer: CoreOps.AI 
+# Original License Date: 2025-07-24
+# ###################################################################################
+
+
+"""
+Local HTTP stub used by the benchmarks.
+
+Benchmarks talk to a ThreadingHTTPServer on 127.0.0.1 instead of a real
+AgentCore server. ``use_scratch_home`` points HOME at a temporary
+directory holding a config.json for the stub, so the managers pick it up
+without touching the user's own ~/.agentcore. Call it before importing
+anything from agentcore: the config paths are fixed at import time.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Base request handler with JSON helpers and injected latency.
+
+    ``LATENCY`` seconds are added to every reply and ``BANDWIDTH`` bytes per
+    second, if set, limits how fast request bodies are taken in, so the
+    client sees round trips and transfer times close to a remote server.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; separate small writes stall on delayed ACKs
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    LATENCY = 0.0
+    BANDWIDTH: Optional[float] = None
+
+    def log_message(self, *args):
+        pass
+
+    def read_body(self) -> bytes:
+        """Read the request body, including chunked transfer encoding."""
+        length = self.headers.get("Content-Length")
+        if length is not None:
+            body = self.rfile.read(int(length))
+        else:
+            chunks = bytearray()
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks += self.rfile.read(size)
+                self.rfile.readline()
+            body = bytes(chunks)
+        if self.BANDWIDTH:
+            time.sleep(len(body) / self.BANDWIDTH)
+        return body
+
+    def reply(self, status: int = 200, body: Any = None) -> int:
+        """Send ``body`` as JSON after the injected latency. Returns the body size in bytes."""
+        time.sleep(self.LATENCY)
+        data = json.dumps({} if body is None else body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return len(data)
+
+
+class UploadStubHandler(StubHandler):
+    """
+    Chunked upload sessions as ChunkedUploader expects them.
+
+    Each chunk's X-Chunk-SHA256 is checked, and on completion the whole
+    file's SHA-256 is checked too, unless ``KEEP_CHUNKS`` is off to keep the
+    stub's memory flat for large files. Gzip-encoded chunks are answered
+    with 415 unless ``ACCEPT_GZIP`` is set.
+    """
+
+    ACCEPT_GZIP = True
+    KEEP_CHUNKS = True
+    sessions: Dict[str, Dict[str, Any]] = {}
+    received_bytes = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.read_body()
+        if self.path.rstrip("/").endswith("api/uploads"):
+            request = json.loads(body)
+            with self.lock:
+                session_id = f"s{len(self.sessions) + 1}"
+                self.sessions[session_id] = {"chunks": {}}
+            return self.reply(201, {"session_id": session_id, "chunk_size": request["chunk_size"]})
+        match = re.search(r"uploads/(\w+)/complete/", self.path)
+        if match:
+            chunks = self.sessions[match.group(1)]["chunks"]
+            if not self.KEEP_CHUNKS:
+                return self.reply(200, {"ok": True})
+            data = b"".join(chunks[index] for index in sorted(chunks))
+            ok = hashlib.sha256(data).hexdigest() == json.loads(body)["sha256"]
+            return self.reply(200 if ok else 422, {"ok": ok, "size": len(data)})
+        self.reply(201, {"id": 1})
+
+    def do_GET(self):
+        match = re.search(r"uploads/(\w+)/$", self.path)
+        if not match or match.group(1) not in self.sessions:
+            return self.reply(404, {"detail": "Not found."})
+        self.reply(200, {"received": sorted(self.sessions[match.group(1)]["chunks"])})
+
+    def do_PUT(self):
+        match = re.search(r"uploads/(\w+)/chunks/(\d+)/", self.path)
+        body = self.read_body()
+        with self.lock:
+            type(self).received_bytes += len(body)
+        if self.headers.get("Content-Encoding") == "gzip":
+            if not self.ACCEPT_GZIP:
+                return self.reply(415, {"detail": "Unsupported media type"})
+            body = gzip.decompress(body)
+        if hashlib.sha256(body).hexdigest() != self.headers["X-Chunk-SHA256"]:
+            return self.reply(422, {"detail": "Checksum mismatch"})
+        self.sessions[match.group(1)]["chunks"][int(match.group(2))] = body if self.KEEP_CHUNKS else b""
+        self.reply(200, {})
+
+
+def start(handler: Type[BaseHTTPRequestHandler]) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve ``handler`` on a free local port. Returns the server and its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="benchmark-stub", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+
+def use_scratch_home(url: str = "http://127.0.0.1:1/", **config: Any) -> Path:
+    """
+    Point HOME at a new temporary directory with a config.json for ``url``.
+
+    The directory is removed when the process exits.
+
+    Returns:
+        The temporary home directory
+    """
+    home = Path(tempfile.mkdtemp(prefix="agentcore-bench-"))
+    atexit.register(shutil.rmtree, home, ignore_errors=True)
+    os.environ["HOME"] = str(home)
+    write_config(url, **config)
+    return home
+
+
+def write_config(url: str, **config: Any) -> None:
+    """Rewrite the scratch config, e.g. once the stub's port is known."""
+    config_dir = Path(os.environ["HOME"]) / ".agentcore"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "config.json").write_text(json.dumps({"url": url, "access_token": "token-0", **config}))
+
+
+def peak_rss_mb() -> int:
+    """Peak resident set size of this process so far, in MB (Linux and macOS)."""
+    import resource
+    import sys
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // (1024 * 1024) if sys.platform == "darwin" else peak // 1024